@@ -11,9 +11,9 @@ Implementation Status: Version 1.5.0
 - ✅ Commits: View commit history and details (2 tools)
 - ✅ Branches: List, create, compare branches (4 tools)
 - ✅ Releases & Tags: Manage releases and tags (5 tools)
-- ✅ Actions/Workflows: Trigger and monitor workflows (7 tools)
+- ✅ Actions/Workflows: Trigger and monitor workflows (8 tools)
 
-Total: 34 tools implemented
+Total: 35 tools implemented
 
 Future Features:
 - 🔲 Projects: Manage GitHub Projects
@@ -23,16 +23,19 @@ Future Features:
 - 🔲 Discussions: Create and manage discussions
 """
 
+import importlib
 import logging
-from typing import Any
+from typing import Any, TYPE_CHECKING
 
 try:
     from amplifier_core import ModuleCoordinator
 except ImportError:
     ModuleCoordinator = None
 
-from .manager import GitHubManager
-from .unified_tool import GitHubUnifiedTool
+if TYPE_CHECKING:
+    from .manager import GitHubManager
+    from .unified_tool import GitHubUnifiedTool
+
 from .exceptions import (
     GitHubError,
     AuthenticationError,
@@ -48,6 +51,22 @@ __version__ = "1.5.0"
 
 logger = logging.getLogger(__name__)
 
+# The manager and tools pull in PyGithub and all 35 tool modules, so they are
+# imported on first use (PEP 562) rather than when the package is imported.
+_LAZY_IMPORTS = {
+    "GitHubManager": ".manager",
+    "GitHubUnifiedTool": ".unified_tool",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 async def mount(coordinator: "ModuleCoordinator", config: dict[str, Any] | None = None):
     """
@@ -79,6 +98,9 @@ async def mount(coordinator: "ModuleCoordinator", config: dict[str, Any] | None
     Returns:
         Async cleanup function to be called when the module is unmounted
     """
+    from .manager import GitHubManager
+    from .unified_tool import GitHubUnifiedTool
+
     config = config or {}
 
     logger.info("Mounting GitHub module...")
@@ -90,7 +112,7 @@ async def mount(coordinator: "ModuleCoordinator", config: dict[str, Any] | None
         manager = GitHubManager(config)
         await manager.start()
 
-        # Create the unified GitHub tool (provides 34 operations via single tool)
+        # Create the unified GitHub tool (provides 35 operations via single tool)
         github_tool = GitHubUnifiedTool(manager)
 
         # Register the unified tool
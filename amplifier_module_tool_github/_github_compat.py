@@ -0,0 +1,49 @@
+"""
+PyGithub imports shared by the manager and tools.
+
+PyGithub is imported once here. When it is not installed, the classes are
+None and the exceptions fall back to ``Exception`` so ``except`` clauses
+elsewhere remain valid; GitHubManager reports the missing dependency.
+"""
+
+try:
+    from github import Github, Auth, GithubRetry
+    from github.AuthenticatedUser import AuthenticatedUser
+    from github.IssueComment import IssueComment
+    from github.PaginatedList import PaginatedList
+    from github.Workflow import Workflow
+    from github.WorkflowJob import WorkflowJob
+    from github.GithubException import (
+        BadCredentialsException,
+        GithubException,
+        RateLimitExceededException,
+        UnknownObjectException,
+    )
+except ImportError:
+    Github = None
+    Auth = None
+    GithubRetry = None
+    AuthenticatedUser = None
+    IssueComment = None
+    PaginatedList = None
+    Workflow = None
+    WorkflowJob = None
+    GithubException = Exception
+    BadCredentialsException = Exception
+    RateLimitExceededException = Exception
+    UnknownObjectException = Exception
+
+__all__ = [
+    "Github",
+    "Auth",
+    "GithubRetry",
+    "AuthenticatedUser",
+    "IssueComment",
+    "PaginatedList",
+    "Workflow",
+    "WorkflowJob",
+    "GithubException",
+    "BadCredentialsException",
+    "RateLimitExceededException",
+    "UnknownObjectException",
+]
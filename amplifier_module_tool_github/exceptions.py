@@ -4,13 +4,19 @@ GitHub Module Exceptions
 Custom exception classes for GitHub tool operations.
 """
 
+from datetime import datetime
+from typing import ClassVar
+
 
 class GitHubError(Exception):
     """Base exception for all GitHub-related errors."""
 
-    def __init__(self, message: str, code: str = "GITHUB_ERROR"):
+    #: Error code reported in ToolResult errors; subclasses override it
+    CODE: ClassVar[str] = "GITHUB_ERROR"
+
+    def __init__(self, message: str, code: str | None = None):
         self.message = message
-        self.code = code
+        self.code = code or self.CODE
         super().__init__(message)
 
     def to_dict(self) -> dict:
@@ -24,62 +30,86 @@ class GitHubError(Exception):
 class AuthenticationError(GitHubError):
     """Raised when GitHub authentication fails."""
 
+    CODE = "AUTHENTICATION_ERROR"
+
     def __init__(self, message: str = "GitHub authentication failed"):
-        super().__init__(message, code="AUTHENTICATION_ERROR")
+        super().__init__(message)
 
 
 class RepositoryNotFoundError(GitHubError):
     """Raised when a repository is not found or not accessible."""
 
+    CODE = "REPOSITORY_NOT_FOUND"
+
     def __init__(self, repository: str):
         super().__init__(
-            f"Repository not found or not accessible: {repository}",
-            code="REPOSITORY_NOT_FOUND"
+            f"Repository not found or not accessible: {repository}"
         )
 
 
 class IssueNotFoundError(GitHubError):
     """Raised when an issue is not found."""
 
+    CODE = "ISSUE_NOT_FOUND"
+
     def __init__(self, issue_number: int, repository: str):
         super().__init__(
-            f"Issue #{issue_number} not found in repository {repository}",
-            code="ISSUE_NOT_FOUND"
+            f"Issue #{issue_number} not found in repository {repository}"
         )
 
 
 class RateLimitError(GitHubError):
     """Raised when GitHub API rate limit is exceeded."""
 
-    def __init__(self, reset_time: str = "unknown"):
-        super().__init__(
-            f"GitHub API rate limit exceeded. Resets at: {reset_time}",
-            code="RATE_LIMIT_EXCEEDED"
-        )
+    CODE = "RATE_LIMIT_EXCEEDED"
+
+    def __init__(self, reset_time: int | str = "unknown"):
+        """
+        Args:
+            reset_time: Reset time as epoch seconds (formatted only when the
+                message is rendered) or as a preformatted string
+        """
+        self.reset_time = reset_time
+        self.code = self.CODE
+        Exception.__init__(self, reset_time)
+
+    @property
+    def message(self) -> str:
+        reset_time = self.reset_time
+        if isinstance(reset_time, (int, float)):
+            reset_time = datetime.fromtimestamp(reset_time).isoformat()
+        return f"GitHub API rate limit exceeded. Resets at: {reset_time}"
+
+    def __str__(self) -> str:
+        return self.message
 
 
 class PermissionError(GitHubError):
     """Raised when operation requires permissions not available."""
 
+    CODE = "PERMISSION_DENIED"
+
     def __init__(self, operation: str):
         super().__init__(
-            f"Insufficient permissions for operation: {operation}",
-            code="PERMISSION_DENIED"
+            f"Insufficient permissions for operation: {operation}"
         )
 
 
 class ValidationError(GitHubError):
     """Raised when input validation fails."""
 
+    CODE = "VALIDATION_ERROR"
+
     def __init__(self, message: str):
-        super().__init__(message, code="VALIDATION_ERROR")
+        super().__init__(message)
 
 
 class ToolExecutionError(GitHubError):
     """Raised when a tool execution fails unexpectedly."""
 
+    CODE = "TOOL_EXECUTION_ERROR"
+
     def __init__(self, tool_name: str, message: str):
         super().__init__(
-            f"Tool '{tool_name}' execution failed: {message}",
-            code="TOOL_EXECUTION_ERROR"
+            f"Tool '{tool_name}' execution failed: {message}"
         )
@@ -4,42 +4,199 @@ GitHub Manager
 Manages the lifecycle of GitHub API interactions and provides access to GitHub tools.
 """
 
+import asyncio
+import hashlib
 import logging
 import os
-import subprocess
 import getpass
 import re
-from typing import Any
-from datetime import datetime
-
-try:
-    from github import Github, Auth
-    from github.GithubException import (
-        BadCredentialsException,
-        UnknownObjectException,
-        RateLimitExceededException,
-        GithubException,
-    )
-except ImportError:
-    Github = None
-    Auth = None
-    BadCredentialsException = None
-    UnknownObjectException = None
-    RateLimitExceededException = None
-    GithubException = None
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, ClassVar
+from urllib.parse import urlsplit
 
+from ._github_compat import (
+    Auth,
+    AuthenticatedUser,
+    BadCredentialsException,
+    Github,
+    GithubRetry,
+    IssueComment,
+    PaginatedList,
+    RateLimitExceededException,
+    UnknownObjectException,
+    Workflow,
+    WorkflowJob,
+)
 from .exceptions import (
     AuthenticationError,
+    PermissionError,
     RateLimitError,
     RepositoryNotFoundError,
 )
 
 logger = logging.getLogger(__name__)
 
+# How long a token verified against the API is trusted before verifying again
+_VERIFIED_USER_TTL = 3600
+
+# How long get_rate_limit() reuses its last answer
+_RATE_LIMIT_INFO_TTL = 10
+
+# Printed in one write before prompting for a token
+_PROMPT_BANNER = (
+    "\n" + "=" * 70 + "\n"
+    "GitHub Authentication Required\n"
+    + "=" * 70 + "\n"
+    "\nNo GitHub authentication found. Please provide a personal access token.\n"
+    "\nYou can create a token at: https://github.com/settings/tokens\n"
+    "\nAlternatively, authenticate with GitHub CLI: gh auth login\n"
+    "\nRequired token permissions:\n"
+    "  - repo (for private repositories)\n"
+    "  - public_repo (for public repositories only)\n"
+    "\nNote: Your token will not be stored. Set GITHUB_TOKEN environment\n"
+    "      variable or use GitHub CLI for persistent authentication.\n"
+    + "=" * 70 + "\n"
+)
+
+# Repository identifier formats accepted in the `repositories` config
+_HTTPS_REPO_RE = re.compile(r'https?://[^/]+/([^/]+/[^/]+?)(?:\.git)?/?$')
+_SSH_REPO_RE = re.compile(r'git@[^:]+:([^/]+/[^/]+?)(?:\.git)?$')
+_OWNER_REPO_RE = re.compile(r'^[^/]+/[^/]+$')
+
+# A full commit SHA names content that can never change
+_FULL_SHA_RE = re.compile(r'^[0-9a-fA-F]{40}$')
+
+# How long a token read from the GitHub CLI is reused before asking `gh` again
+_CLI_TOKEN_TTL = 600
+
+
+def _rate_limit_error(e: Exception) -> RateLimitError:
+    """Translate PyGithub's rate limit exception, keeping the reset time."""
+    reset = (e.headers or {}).get("x-ratelimit-reset")
+    return RateLimitError(int(reset) if reset else "unknown")
+
+def _remaining_requests(client) -> float:
+    """Requests a client has left per its last response headers, or infinity if unknown."""
+    remaining, _ = client.requester.rate_limiting
+    return remaining if remaining >= 0 else float("inf")
+
+
+# Responses that mean "slow down" rather than "the request may have been applied"
+_RATE_LIMIT_STATUSES = frozenset({403, 429})
+
+
+class _RateLimitRetry(GithubRetry if GithubRetry is not None else object):
+    """
+    A retry policy that waits out rate limits for every method.
+
+    ``allowed_methods`` keeps 5xx responses and read errors from repeating
+    non-idempotent requests, but urllib3 checks it before the status, which
+    would also stop POSTs from retrying a rate limit rejection. A rate limited
+    request was never applied, so those statuses skip the method check;
+    GithubRetry still retries a 403 only when it is a rate limit.
+    """
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if status_code in _RATE_LIMIT_STATUSES:
+            return bool(self.total) and status_code in self.status_forcelist
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+class _ConditionalList:
+    """
+    A list endpoint that revalidates with its ETag, like a PyGithub object.
+
+    ``update()`` mirrors ``CompletableGithubObject.update()`` so listings can
+    live in the manager's object cache: a 304 keeps the items already held.
+    """
+
+    __slots__ = ("_requester", "_url", "_klass", "_list_item", "_etag", "items")
+
+    def __init__(self, requester, url: str, klass, list_item: str):
+        self._requester = requester
+        self._url = url
+        self._klass = klass
+        self._list_item = list_item
+        self._etag = None
+        self.items: list = []
+
+    def update(self) -> bool:
+        """
+        Refresh the items unless GitHub reports them unchanged.
+
+        Returns:
+            True if the items were reloaded, False on 304 Not Modified
+        """
+        params = {"per_page": 100}
+        headers = {"If-None-Match": self._etag} if self._etag else None
+        response_headers, data = self._requester.requestJsonAndCheck(
+            "GET", self._url, parameters=params, headers=headers
+        )
+        if data is None:
+            # 304 Not Modified has no body
+            return False
+
+        raw = data[self._list_item]
+        page = 1
+        while len(raw) < data.get("total_count", 0):
+            page += 1
+            _, more = self._requester.requestJsonAndCheck(
+                "GET", self._url, parameters={**params, "page": page}
+            )
+            if not more[self._list_item]:
+                break
+            raw.extend(more[self._list_item])
+
+        self._etag = response_headers.get("etag")
+        self.items = [self._klass(self._requester, response_headers, item) for item in raw]
+        return True
+
 
 class GitHubManager:
     """Manages GitHub API interactions and tool access."""
 
+    __slots__ = (
+        "config",
+        "token",
+        "_extra_tokens",
+        "use_cli_auth",
+        "prompt_if_missing",
+        "base_url",
+        "rate_limit_threshold",
+        "max_rate_limit_wait",
+        "pool_size",
+        "timeout",
+        "max_retries",
+        "per_page",
+        "client",
+        "_clients",
+        "github_user",
+        "_rate_limit_lock",
+        "_rate_limit_info",
+        "max_concurrency",
+        "_api_semaphore",
+        "cache_size",
+        "_object_cache",
+        "_cache_lock",
+        "_inflight",
+        "configured_repositories",
+        "_allowed_repositories",
+        "_sorted_repositories",
+        "restrict_to_configured",
+    )
+
+    # Tokens from `gh auth token` and when they were read, keyed by GitHub host
+    # and shared by all managers so repeated start() calls don't each spawn a subprocess
+    _cli_token_cache: ClassVar[dict[str, tuple[str, float]]] = {}
+
+    # Users returned when verifying a token, keyed by a fingerprint of the
+    # server and token, so restarting a manager skips the GET /user request
+    _verified_users: ClassVar[dict[str, tuple[dict[str, Any], float]]] = {}
+
     def __init__(self, config: dict[str, Any]):
         """
         Initialize the GitHub manager.
@@ -47,23 +204,62 @@ class GitHubManager:
         Args:
             config: Configuration dictionary with settings:
                 - token: GitHub personal access token or GitHub App token (optional)
+                - tokens: Additional tokens to spread requests across, each with its own
+                  rate limit (optional)
                 - use_cli_auth: Use GitHub CLI authentication if token not provided (default: True)
                 - prompt_if_missing: Prompt user for token if no auth found (default: True)
                 - base_url: GitHub Enterprise URL (optional, defaults to github.com)
                 - repositories: List of repository URLs or owner/repo strings to restrict access to (optional)
+                - rate_limit_threshold: Remaining-request count at which calls start waiting
+                  for the rate limit window to reset (default: 10)
+                - max_rate_limit_wait: Longest time in seconds a call will wait for the rate
+                  limit to reset before being sent anyway (default: 60)
+                - max_concurrency: Maximum number of API calls in flight at once (default: 50)
+                - cache_size: Maximum number of API objects kept for conditional (ETag)
+                  revalidation (default: 1024)
+                - pool_size: Maximum keep-alive connections per client (default: 64)
+                - timeout: HTTP request timeout in seconds (default: 15)
+                - max_retries: Retries for transient failures such as 5xx responses,
+                  dropped connections and secondary rate limits (default: 5)
+                - per_page: Items requested per page from list endpoints (default: 100,
+                  the GitHub maximum)
         """
         self.config = config
-        self.token = config.get("token")
+        tokens = list(config.get("tokens") or [])
+        self.token = config.get("token") or (tokens[0] if tokens else None)
+        self._extra_tokens = [t for t in dict.fromkeys(tokens) if t != self.token]
         self.use_cli_auth = config.get("use_cli_auth", True)
         self.prompt_if_missing = config.get("prompt_if_missing", True)
         self.base_url = config.get("base_url", "https://api.github.com")
+        self.rate_limit_threshold = config.get("rate_limit_threshold", 10)
+        self.max_rate_limit_wait = config.get("max_rate_limit_wait", 60)
+        self.pool_size = config.get("pool_size", 64)
+        self.timeout = config.get("timeout", 15)
+        self.max_retries = config.get("max_retries", 5)
+        self.per_page = config.get("per_page", 100)
         self.client = None
+        self._clients: list = []
         self.github_user = None
+        self._rate_limit_lock = asyncio.Lock()
+        self._rate_limit_info: tuple[dict[str, Any], float] | None = None
+        # GitHub's secondary rate limits reject bursts of concurrent requests
+        self.max_concurrency = config.get("max_concurrency", 50)
+        self._api_semaphore = asyncio.Semaphore(self.max_concurrency)
+        self.cache_size = config.get("cache_size", 1024)
+        self._object_cache: OrderedDict[str, Any] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._inflight: dict[str, Future] = {}
         
         # Parse and store configured repositories
         repos_raw = config.get("repositories", [])
         logger.debug(f"Raw repositories from config: {repos_raw} (type: {type(repos_raw)})")
         self.configured_repositories = self._parse_repositories(repos_raw)
+        # GitHub repository names are case-insensitive; access checks compare
+        # against this pre-lowercased copy
+        self._allowed_repositories = frozenset(
+            repo.lower() for repo in self.configured_repositories
+        )
+        self._sorted_repositories = tuple(sorted(self.configured_repositories))
         self.restrict_to_configured = len(self.configured_repositories) > 0
         logger.info(f"Manager initialized with {len(self.configured_repositories)} configured repositories")
 
@@ -78,7 +274,7 @@ class GitHubManager:
 
         # Try to get authentication token from various sources
         if not self.token:
-            self.token = self._get_token_from_sources()
+            self.token = await self._get_token_from_sources()
 
         if not self.token:
             logger.warning("No GitHub authentication configured")
@@ -96,19 +292,12 @@ class GitHubManager:
                 return
 
         try:
-            # Initialize GitHub client with authentication
-            auth = Auth.Token(self.token)
-            
-            if self.base_url != "https://api.github.com":
-                # GitHub Enterprise
-                self.client = Github(base_url=self.base_url, auth=auth)
-            else:
-                # GitHub.com
-                self.client = Github(auth=auth)
-
-            # Verify authentication
-            self.github_user = self.client.get_user()
+            # PyGithub is synchronous; build the client and verify the token
+            # in a worker thread so the event loop is not blocked.
+            await asyncio.to_thread(self._connect)
             logger.info(f"Authenticated as: {self.github_user.login}")
+            if self._extra_tokens:
+                logger.info(f"Using a pool of {len(self._clients)} tokens")
 
         except BadCredentialsException:
             logger.error("GitHub authentication failed - invalid token")
@@ -117,7 +306,97 @@ class GitHubManager:
             logger.error(f"Failed to initialize GitHub client: {e}")
             raise
 
-    def _get_token_from_sources(self) -> str | None:
+    def _create_client(self, token: str):
+        """
+        Create a PyGithub client for a token.
+
+        Each client keeps one pooled HTTP session for its lifetime, so
+        concurrent tool calls reuse keep-alive connections instead of paying
+        a TCP and TLS handshake per request.
+
+        Transient failures (5xx responses, dropped connections) of idempotent
+        requests are retried with exponential backoff; POST and PATCH
+        requests are not repeated for those, since a retry could trigger a
+        workflow or create an issue twice. Rate limit responses (403 and 429)
+        of any method wait for ``Retry-After`` or the rate limit reset before
+        retrying.
+        """
+        auth = Auth.Token(token)
+        options = {
+            "auth": auth,
+            "pool_size": self.pool_size,
+            "timeout": self.timeout,
+            "retry": _RateLimitRetry(
+                total=self.max_retries,
+                backoff_factor=0.5,
+                # 403 rate limit responses are added by GithubRetry itself
+                status_forcelist=[429, *range(500, 600)],
+                allowed_methods=GithubRetry.DEFAULT_ALLOWED_METHODS,
+            ),
+            "per_page": self.per_page,
+        }
+
+        if self.base_url != "https://api.github.com":
+            # GitHub Enterprise
+            return Github(base_url=self.base_url, **options)
+        # GitHub.com
+        return Github(**options)
+
+    def _connect(self) -> None:
+        """Create the PyGithub clients and verify authentication (blocking)."""
+        clients = [self._create_client(token) for token in (self.token, *self._extra_tokens)]
+
+        # Verify every token
+        github_user = self._verify_token(clients[0], self.token)
+        for extra, token in zip(clients[1:], self._extra_tokens):
+            self._verify_token(extra, token)
+
+        self.client = clients[0]
+        self._clients = clients
+        self.github_user = github_user
+
+    def _verify_token(self, client, token: str):
+        """
+        Get the authenticated user for a client, verifying its token (blocking).
+
+        A token already verified against the same server within the last hour
+        is trusted without another request; an invalid token still fails on
+        its first real API call.
+
+        Args:
+            client: PyGithub client using the token
+            token: The client's token
+
+        Returns:
+            AuthenticatedUser for the token
+        """
+        fingerprint = hashlib.blake2b(
+            f"{self.base_url}\0{token}".encode(), digest_size=16
+        ).hexdigest()
+        cached = GitHubManager._verified_users.get(fingerprint)
+        if cached and time.monotonic() - cached[1] < _VERIFIED_USER_TTL:
+            return client.create_from_raw_data(AuthenticatedUser, cached[0])
+
+        # ``login`` forces the lazy user object to load, which also seeds the
+        # client's rate limit state
+        user = client.get_user()
+        user.login
+        GitHubManager._verified_users[fingerprint] = (user.raw_data, time.monotonic())
+        return user
+
+    def _pick_client(self):
+        """
+        Pick the client to use for the next request.
+
+        With a token pool this is the client with the most remaining requests,
+        as last reported by GitHub's rate limit headers. A client that has not
+        seen those headers yet is tried first, so every token gets used.
+        """
+        if len(self._clients) < 2:
+            return self.client
+        return max(self._clients, key=_remaining_requests)
+
+    async def _get_token_from_sources(self) -> str | None:
         """
         Try to get GitHub token from various sources.
         
@@ -132,38 +411,61 @@ class GitHubManager:
         
         # 2. Try GitHub CLI authentication
         if self.use_cli_auth:
-            token = self._get_token_from_cli()
+            token = await self._get_token_from_cli()
             if token:
                 logger.info("Using GitHub token from GitHub CLI")
                 return token
         
         return None
     
-    def _get_token_from_cli(self) -> str | None:
+    def _cli_host(self) -> str:
+        """Get the GitHub host name the CLI knows this manager's server by."""
+        if self.base_url == "https://api.github.com":
+            return "github.com"
+        return urlsplit(self.base_url).hostname or self.base_url
+
+    async def _get_token_from_cli(self) -> str | None:
         """
         Get authentication token from GitHub CLI.
+
+        The token is cached for a few minutes so that repeated starts don't
+        spawn `gh` again, and the subprocess runs without blocking the event loop.
         
         Returns:
             Token string if CLI is authenticated, None otherwise
         """
+        host = self._cli_host()
+        cached = GitHubManager._cli_token_cache.get(host)
+        if cached and time.monotonic() - cached[1] < _CLI_TOKEN_TTL:
+            return cached[0]
+
+        command = ["gh", "auth", "token"]
+        if host != "github.com":
+            command += ["--hostname", host]
+
         try:
-            result = subprocess.run(
-                ["gh", "auth", "token"],
-                capture_output=True,
-                text=True,
-                timeout=5
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
             )
-            
-            if result.returncode == 0:
-                token = result.stdout.strip()
+            try:
+                stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=5)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                logger.warning("GitHub CLI command timed out")
+                return None
+
+            if process.returncode == 0:
+                token = stdout.decode().strip()
                 if token:
+                    GitHubManager._cli_token_cache[host] = (token, time.monotonic())
                     return token
             else:
-                logger.debug(f"GitHub CLI not authenticated: {result.stderr}")
+                logger.debug(f"GitHub CLI not authenticated: {stderr.decode().strip()}")
         except FileNotFoundError:
             logger.debug("GitHub CLI (gh) not found in PATH")
-        except subprocess.TimeoutExpired:
-            logger.warning("GitHub CLI command timed out")
         except Exception as e:
             logger.debug(f"Failed to get token from GitHub CLI: {e}")
         
@@ -176,18 +478,8 @@ class GitHubManager:
         Returns:
             Token string if provided, None otherwise
         """
-        print("\n" + "="*70)
-        print("GitHub Authentication Required")
-        print("="*70)
-        print("\nNo GitHub authentication found. Please provide a personal access token.")
-        print("\nYou can create a token at: https://github.com/settings/tokens")
-        print("\nAlternatively, authenticate with GitHub CLI: gh auth login")
-        print("\nRequired token permissions:")
-        print("  - repo (for private repositories)")
-        print("  - public_repo (for public repositories only)")
-        print("\nNote: Your token will not be stored. Set GITHUB_TOKEN environment")
-        print("      variable or use GitHub CLI for persistent authentication.")
-        print("="*70)
+        sys.stdout.write(_PROMPT_BANNER)
+        sys.stdout.flush()
         
         try:
             token = getpass.getpass("\nEnter your GitHub token (input hidden): ").strip()
@@ -203,14 +495,83 @@ class GitHubManager:
     async def stop(self):
         """Stop the manager and clean up resources."""
         logger.info("Stopping GitHub manager")
-        if self.client:
-            self.client.close()
+        for client in self._clients or [self.client]:
+            if client:
+                await asyncio.to_thread(client.close)
+
+    async def run(self, fn, /, *args, **kwargs):
+        """
+        Run a blocking PyGithub call without blocking the event loop.
+
+        PyGithub performs its HTTP requests synchronously, so every call that
+        may touch the network (including lazily-loaded attributes and
+        paginated iteration) should go through this method. At most
+        ``max_concurrency`` calls run at once; the rest wait their turn.
+
+        Args:
+            fn: Callable to run
+            *args: Positional arguments for ``fn``
+            **kwargs: Keyword arguments for ``fn``
+
+        Returns:
+            The return value of ``fn``
+
+        Raises:
+            RateLimitError: If GitHub rejects the request for rate limiting
+        """
+        async with self._api_semaphore:
+            await self._wait_for_rate_limit()
+            try:
+                return await asyncio.to_thread(fn, *args, **kwargs)
+            except RateLimitExceededException as e:
+                raise _rate_limit_error(e)
+
+    def _rate_limit_delay(self) -> float:
+        """
+        Seconds to wait before the next request to stay within the rate limit.
+
+        PyGithub's requester records ``X-RateLimit-Remaining`` and
+        ``X-RateLimit-Reset`` from every response, so this reads the budget
+        without an API call; before any headers are seen there is no delay.
+        (``Github.rate_limiting`` would instead fetch ``/rate_limit``, which
+        blocks and fails on servers with rate limiting disabled.) Secondary
+        rate limits (``Retry-After``) are handled by PyGithub's retry policy.
+        """
+        client = self._pick_client()
+        if client is None:
+            return 0.0
+
+        requester = client.requester
+        remaining, _ = requester.rate_limiting
+        if remaining < 0 or remaining > self.rate_limit_threshold:
+            return 0.0
+
+        return max(0.0, requester.rate_limiting_resettime - time.time())
+
+    async def _wait_for_rate_limit(self) -> None:
+        """Pause until the rate limit window resets when the budget is nearly spent."""
+        if self._rate_limit_delay() <= 0:
+            return
+
+        # Serialize waiters so a burst of calls doesn't drain the last few requests
+        async with self._rate_limit_lock:
+            delay = self._rate_limit_delay()
+            if delay <= 0:
+                return
+            if delay > self.max_rate_limit_wait:
+                logger.warning(
+                    f"Rate limit nearly exhausted; resets in {delay:.0f}s "
+                    f"(longer than max_rate_limit_wait), sending request anyway"
+                )
+                return
+            logger.info(f"Rate limit nearly exhausted; waiting {delay:.1f}s for reset")
+            await asyncio.sleep(delay)
 
     def is_authenticated(self) -> bool:
         """Check if GitHub client is authenticated."""
         return self.client is not None
     
-    def _parse_repositories(self, repositories: list[str]) -> set[str]:
+    def _parse_repositories(self, repositories: list[str]) -> frozenset[str]:
         """
         Parse repository configurations from URLs or owner/repo format.
         
@@ -218,19 +579,15 @@ class GitHubManager:
             repositories: List of repository identifiers (URLs or owner/repo)
         
         Returns:
-            Set of normalized repository names in owner/repo format
+            Frozen set of normalized repository names in owner/repo format
         """
-        parsed = set()
-        
-        for repo in repositories:
-            normalized = self._normalize_repository(repo)
-            if normalized:
-                parsed.add(normalized)
-                logger.debug(f"Configured repository: {normalized}")
-        
+        parsed = frozenset(filter(None, map(self._normalize_repository, repositories)))
+
         if parsed:
             logger.info(f"Restricting access to {len(parsed)} configured repositories")
-        
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Configured repositories: {', '.join(sorted(parsed))}")
+
         return parsed
     
     def _normalize_repository(self, repo: str) -> str | None:
@@ -252,17 +609,17 @@ class GitHubManager:
         repo = repo.strip()
         
         # Pattern 1: HTTPS URL (https://github.com/owner/repo or https://github.com/owner/repo.git)
-        https_match = re.match(r'https?://[^/]+/([^/]+/[^/]+?)(?:\.git)?/?$', repo)
+        https_match = _HTTPS_REPO_RE.match(repo)
         if https_match:
             return https_match.group(1)
         
         # Pattern 2: SSH URL (git@github.com:owner/repo.git)
-        ssh_match = re.match(r'git@[^:]+:([^/]+/[^/]+?)(?:\.git)?$', repo)
+        ssh_match = _SSH_REPO_RE.match(repo)
         if ssh_match:
             return ssh_match.group(1)
         
         # Pattern 3: Direct owner/repo format
-        if re.match(r'^[^/]+/[^/]+$', repo):
+        if _OWNER_REPO_RE.match(repo):
             return repo
         
         logger.warning(f"Could not parse repository identifier: {repo}")
@@ -271,6 +628,8 @@ class GitHubManager:
     def is_repository_allowed(self, repo_name: str) -> bool:
         """
         Check if a repository is allowed based on configuration.
+
+        The comparison ignores case, as GitHub does.
         
         Args:
             repo_name: Repository name in owner/repo format
@@ -281,22 +640,26 @@ class GitHubManager:
         # If no repositories configured, allow all
         if not self.restrict_to_configured:
             return True
+
+        # Tool inputs are usually already in owner/repo form
+        if repo_name.lower() in self._allowed_repositories:
+            return True
         
         # Normalize the repo name for comparison
         normalized = self._normalize_repository(repo_name)
         if not normalized:
             return False
         
-        return normalized in self.configured_repositories
+        return normalized.lower() in self._allowed_repositories
     
     def get_configured_repositories(self) -> list[str]:
         """
         Get the list of configured repositories.
         
         Returns:
-            List of repository names in owner/repo format
+            Sorted list of repository names in owner/repo format
         """
-        return sorted(self.configured_repositories)
+        return list(self._sorted_repositories)
 
     def get_repository(self, repo_full_name: str):
         """
@@ -310,36 +673,318 @@ class GitHubManager:
 
         Raises:
             AuthenticationError: If not authenticated
+            PermissionError: If the repository is not in the configured repositories
             RepositoryNotFoundError: If repository not found
+            RateLimitError: If the rate limit is exceeded
         """
         if not self.is_authenticated():
             raise AuthenticationError("GitHub client not authenticated")
 
+        # Every tool resolves repositories through here, so this enforces the
+        # configured allow-list even for tools that don't check it up front
+        if not self.is_repository_allowed(repo_full_name):
+            raise PermissionError(f"access repository '{repo_full_name}' (not in configured repositories)")
+
         try:
-            return self.client.get_repo(repo_full_name)
+            return self._get_cached(
+                repo_full_name.lower(),
+                lambda: self._pick_client().get_repo(repo_full_name),
+            )
         except UnknownObjectException:
             raise RepositoryNotFoundError(repo_full_name)
-        except RateLimitExceededException as e:
-            reset_time = datetime.fromtimestamp(e.reset_timestamp).isoformat()
-            raise RateLimitError(reset_time)
+
+    def get_workflow_run(self, repo, run_id: int):
+        """
+        Get a workflow run object.
+
+        Args:
+            repo: Repository object returned by get_repository()
+            run_id: Workflow run ID
+
+        Returns:
+            WorkflowRun object
+
+        Raises:
+            RateLimitError: If the rate limit is exceeded
+        """
+        return self._get_cached(
+            f"{repo.full_name.lower()}/actions/runs/{run_id}",
+            lambda: repo.get_workflow_run(run_id),
+        )
+
+    def get_comparison(self, repo, base: str, head: str):
+        """
+        Get the comparison between two refs.
+
+        Args:
+            repo: Repository object returned by get_repository()
+            base: Base branch, tag or commit
+            head: Head branch, tag or commit
+
+        Returns:
+            Comparison object
+
+        Raises:
+            RateLimitError: If the rate limit is exceeded
+        """
+        return self._get_cached(
+            f"{repo.full_name.lower()}/compare/{base}...{head}",
+            lambda: repo.compare(base, head),
+        )
+
+    def get_commit(self, repo, sha: str):
+        """
+        Get a commit object.
+
+        A commit looked up by its full SHA never changes, so it is served
+        from the cache without revalidating. Branch names, tags and short
+        SHAs are fetched every time: the cached object's URL names the
+        resolved SHA, so revalidating it would keep answering 304 after the
+        ref moves.
+
+        Args:
+            repo: Repository object returned by get_repository()
+            sha: Commit SHA, branch name or tag
+
+        Returns:
+            Commit object
+
+        Raises:
+            RateLimitError: If the rate limit is exceeded
+        """
+        if not _FULL_SHA_RE.match(sha):
+            try:
+                return repo.get_commit(sha)
+            except RateLimitExceededException as e:
+                raise _rate_limit_error(e)
+
+        return self._get_cached(
+            f"{repo.full_name.lower()}/commits/{sha.lower()}",
+            lambda: repo.get_commit(sha),
+            revalidate=False,
+        )
+
+    def get_issue(self, repo, number: int):
+        """
+        Get an issue object.
+
+        Comments and edits change the issue's ETag, so a revalidated cached
+        issue is never stale and writes need no explicit invalidation.
+
+        Args:
+            repo: Repository object returned by get_repository()
+            number: Issue number
+
+        Returns:
+            Issue object
+
+        Raises:
+            RateLimitError: If the rate limit is exceeded
+        """
+        return self._get_cached(
+            f"{repo.full_name.lower()}/issues/{number}",
+            lambda: repo.get_issue(number=number),
+        )
+
+    def get_issue_comments(self, repo, number: int):
+        """
+        Get the comments of an issue without loading the issue first.
+
+        The comments URL only depends on the issue number, so the listing can
+        be fetched alongside the issue itself instead of after it.
+
+        Args:
+            repo: Repository object returned by get_repository()
+            number: Issue number
+
+        Returns:
+            PaginatedList of IssueComment objects (nothing is fetched yet)
+        """
+        return PaginatedList(
+            IssueComment,
+            repo.requester,
+            f"{repo.url}/issues/{number}/comments",
+            None,
+        )
+
+    def get_workflow_run_jobs(self, repo, run_id: int):
+        """
+        Get the jobs of a workflow run without loading the run first.
+
+        The jobs URL only depends on the run ID, so the listing can be fetched
+        alongside the run itself instead of after it.
+
+        Args:
+            repo: Repository object returned by get_repository()
+            run_id: Workflow run ID
+
+        Returns:
+            PaginatedList of WorkflowJob objects (nothing is fetched yet)
+        """
+        return PaginatedList(
+            WorkflowJob,
+            repo.requester,
+            f"{repo.url}/actions/runs/{run_id}/jobs",
+            None,
+            list_item="jobs",
+        )
+
+    def get_workflow(self, repo, workflow_id: int | str):
+        """
+        Get a workflow object.
+
+        Args:
+            repo: Repository object returned by get_repository()
+            workflow_id: Workflow ID or filename
+
+        Returns:
+            Workflow object
+
+        Raises:
+            RateLimitError: If the rate limit is exceeded
+        """
+        return self._get_cached(
+            f"{repo.full_name.lower()}/actions/workflows/{workflow_id}",
+            lambda: repo.get_workflow(workflow_id),
+        )
+
+    def get_workflows(self, repo) -> list:
+        """
+        Get every workflow in a repository.
+
+        Args:
+            repo: Repository object returned by get_repository()
+
+        Returns:
+            List of Workflow objects
+
+        Raises:
+            RateLimitError: If the rate limit is exceeded
+        """
+        def fetch():
+            listing = _ConditionalList(
+                repo.requester, f"{repo.url}/actions/workflows", Workflow, "workflows"
+            )
+            listing.update()
+            return listing
+
+        return self._get_cached(f"{repo.full_name.lower()}/actions/workflows", fetch).items
+
+    def _get_cached(self, key: str, fetch, revalidate: bool = True):
+        """
+        Get an API object through the conditional request cache.
+
+        The first lookup calls ``fetch``; later lookups revalidate the cached
+        object with its stored ETag. An unchanged object comes back as a 304,
+        which does not count against the rate limit. Concurrent lookups of
+        the same key share a single request.
+
+        Args:
+            key: Cache key identifying the object
+            fetch: Callable that loads the object on a cache miss
+            revalidate: Whether a cached object is checked for changes; pass
+                False for objects that cannot change
+
+        Returns:
+            The cached or freshly fetched object
+        """
+        with self._cache_lock:
+            if not revalidate and key in self._object_cache:
+                self._object_cache.move_to_end(key)
+                return self._object_cache[key]
+            pending = self._inflight.get(key)
+            if pending is not None:
+                owner = False
+            else:
+                # First caller for this key does the request; concurrent
+                # callers for the same key wait for its result
+                pending = self._inflight[key] = Future()
+                owner = True
+            obj = self._object_cache.get(key)
+
+        if not owner:
+            return pending.result()
+
+        try:
+            try:
+                if obj is None:
+                    obj = fetch()
+                else:
+                    obj.update()
+            except UnknownObjectException:
+                with self._cache_lock:
+                    self._object_cache.pop(key, None)
+                raise
+            except RateLimitExceededException as e:
+                raise _rate_limit_error(e)
+        except BaseException as e:
+            with self._cache_lock:
+                del self._inflight[key]
+            pending.set_exception(e)
+            raise
+
+        with self._cache_lock:
+            del self._inflight[key]
+            self._object_cache[key] = obj
+            self._object_cache.move_to_end(key)
+            while len(self._object_cache) > self.cache_size:
+                self._object_cache.popitem(last=False)
+
+        pending.set_result(obj)
+        return obj
+
+    def graphql(self, query: str, variables: dict[str, Any] | None = None) -> dict[str, Any]:
+        """
+        Run a GraphQL query.
+
+        A single GraphQL query can replace several REST calls and is charged
+        against the rate limit per query rather than per object fetched.
+
+        Args:
+            query: GraphQL query document
+            variables: Query variables
+
+        Returns:
+            The ``data`` member of the GraphQL response
+
+        Raises:
+            AuthenticationError: If not authenticated
+            GithubException: If the query fails or returns errors
+        """
+        if not self.is_authenticated():
+            raise AuthenticationError("GitHub client not authenticated")
+
+        _, response = self._pick_client().requester.graphql_query(query, variables or {})
+        return response["data"]
 
     def get_rate_limit(self) -> dict[str, Any]:
         """
         Get current rate limit information.
 
+        The answer is reused for a few seconds, so polling callers don't
+        request ``/rate_limit`` every time.
+
         Returns:
-            Dictionary with rate limit details
+            Dictionary with rate limit details; ``reset`` is the Unix epoch
+            second when the window resets
         """
         if not self.is_authenticated():
             return {"authenticated": False}
 
-        rate_limit = self.client.get_rate_limit()
-        rate = rate_limit.rate
+        cached = self._rate_limit_info
+        if cached and time.monotonic() - cached[1] < _RATE_LIMIT_INFO_TTL:
+            return dict(cached[0])
 
-        return {
+        # Read the core limit straight from the JSON rather than building
+        # PyGithub's RateLimit objects for every resource
+        _, data = self.client.requester.requestJsonAndCheck("GET", "/rate_limit")
+        core = data["resources"]["core"]
+        info = {
             "authenticated": True,
-            "limit": rate.limit,
-            "remaining": rate.remaining,
-            "reset": rate.reset.isoformat(),
-            "used": rate.limit - rate.remaining,
+            "limit": core["limit"],
+            "remaining": core["remaining"],
+            "reset": core["reset"],
+            "used": core["limit"] - core["remaining"],
         }
+        self._rate_limit_info = (info, time.monotonic())
+        return dict(info)
@@ -1,68 +1,142 @@
 """GitHub tool implementations."""
 
-from .base import GitHubBaseTool
+import importlib
+from typing import Any, TYPE_CHECKING
 
-# Issue management tools (v1.0)
-from .issues import (
-    ListIssuesTool,
-    GetIssueTool,
-    CreateIssueTool,
-    UpdateIssueTool,
-    CommentIssueTool,
-)
+if TYPE_CHECKING:
+    from .base import GitHubBaseTool
 
-# Pull request management tools (v1.1)
-from .pull_requests import (
-    ListPullRequestsTool,
-    GetPullRequestTool,
-    CreatePullRequestTool,
-    UpdatePullRequestTool,
-    MergePullRequestTool,
-    ReviewPullRequestTool,
-)
+    # Issue management tools (v1.0)
+    from .issues import (
+        ListIssuesTool,
+        GetIssueTool,
+        CreateIssueTool,
+        UpdateIssueTool,
+        CommentIssueTool,
+    )
 
-# Repository management tools (v1.2)
-from .repositories import (
-    GetRepositoryTool,
-    ListRepositoriesTool,
-    CreateRepositoryTool,
-    GetFileContentTool,
-    ListRepositoryContentsTool,
-)
+    # Pull request management tools (v1.1)
+    from .pull_requests import (
+        ListPullRequestsTool,
+        GetPullRequestTool,
+        CreatePullRequestTool,
+        UpdatePullRequestTool,
+        MergePullRequestTool,
+        ReviewPullRequestTool,
+    )
 
-# Commit management tools (v1.3)
-from .commits import (
-    ListCommitsTool,
-    GetCommitTool,
-)
+    # Repository management tools (v1.2)
+    from .repositories import (
+        GetRepositoryTool,
+        ListRepositoriesTool,
+        CreateRepositoryTool,
+        GetFileContentTool,
+        ListRepositoryContentsTool,
+    )
 
-# Branch management tools (v1.3)
-from .branches import (
-    ListBranchesTool,
-    GetBranchTool,
-    CreateBranchTool,
-    CompareBranchesTool,
-)
+    # Commit management tools (v1.3)
+    from .commits import (
+        ListCommitsTool,
+        GetCommitTool,
+    )
 
-# Release and tag management tools (v1.4)
-from .releases import (
-    ListReleasesTool,
-    GetReleaseTool,
-    CreateReleaseTool,
-    ListTagsTool,
-    CreateTagTool,
-)
+    # Branch management tools (v1.3)
+    from .branches import (
+        ListBranchesTool,
+        GetBranchTool,
+        CreateBranchTool,
+        CompareBranchesTool,
+    )
+
+    # Release and tag management tools (v1.4)
+    from .releases import (
+        ListReleasesTool,
+        GetReleaseTool,
+        CreateReleaseTool,
+        ListTagsTool,
+        CreateTagTool,
+    )
+
+    # GitHub Actions and workflow tools (v1.5)
+    from .actions import (
+        ListWorkflowsTool,
+        GetWorkflowTool,
+        TriggerWorkflowTool,
+        ListWorkflowRunsTool,
+        GetWorkflowRunTool,
+        CancelWorkflowRunTool,
+        CancelWorkflowRunsTool,
+        RerunWorkflowTool,
+    )
+
+# Each tool group pulls in PyGithub, so tool classes are imported from their
+# subpackage on first use (PEP 562) rather than when this package is imported.
+_SUBMODULES = {
+    ".base": ("GitHubBaseTool",),
+    ".issues": (
+        "ListIssuesTool",
+        "GetIssueTool",
+        "CreateIssueTool",
+        "UpdateIssueTool",
+        "CommentIssueTool",
+    ),
+    ".pull_requests": (
+        "ListPullRequestsTool",
+        "GetPullRequestTool",
+        "CreatePullRequestTool",
+        "UpdatePullRequestTool",
+        "MergePullRequestTool",
+        "ReviewPullRequestTool",
+    ),
+    ".repositories": (
+        "GetRepositoryTool",
+        "ListRepositoriesTool",
+        "CreateRepositoryTool",
+        "GetFileContentTool",
+        "ListRepositoryContentsTool",
+    ),
+    ".commits": (
+        "ListCommitsTool",
+        "GetCommitTool",
+    ),
+    ".branches": (
+        "ListBranchesTool",
+        "GetBranchTool",
+        "CreateBranchTool",
+        "CompareBranchesTool",
+    ),
+    ".releases": (
+        "ListReleasesTool",
+        "GetReleaseTool",
+        "CreateReleaseTool",
+        "ListTagsTool",
+        "CreateTagTool",
+    ),
+    ".actions": (
+        "ListWorkflowsTool",
+        "GetWorkflowTool",
+        "TriggerWorkflowTool",
+        "ListWorkflowRunsTool",
+        "GetWorkflowRunTool",
+        "CancelWorkflowRunTool",
+        "CancelWorkflowRunsTool",
+        "RerunWorkflowTool",
+    ),
+}
+
+_LAZY_IMPORTS = {
+    name: module_name for module_name, names in _SUBMODULES.items() for name in names
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
-# GitHub Actions and workflow tools (v1.5)
-from .actions import (
-    ListWorkflowsTool,
-    GetWorkflowTool,
-    TriggerWorkflowTool,
-    ListWorkflowRunsTool,
-    GetWorkflowRunTool,
-    CancelWorkflowRunTool,
-    RerunWorkflowTool,
-)
 
 __all__ = [
     "GitHubBaseTool",
@@ -106,5 +180,6 @@ __all__ = [
     "ListWorkflowRunsTool",
     "GetWorkflowRunTool",
     "CancelWorkflowRunTool",
+    "CancelWorkflowRunsTool",
     "RerunWorkflowTool",
 ]
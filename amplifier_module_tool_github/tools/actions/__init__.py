@@ -6,6 +6,7 @@ from .trigger_workflow import TriggerWorkflowTool
 from .list_runs import ListWorkflowRunsTool
 from .get_run import GetWorkflowRunTool
 from .cancel_run import CancelWorkflowRunTool
+from .cancel_runs import CancelWorkflowRunsTool
 from .rerun import RerunWorkflowTool
 
 __all__ = [
@@ -15,5 +16,6 @@ __all__ = [
     "ListWorkflowRunsTool",
     "GetWorkflowRunTool",
     "CancelWorkflowRunTool",
+    "CancelWorkflowRunsTool",
     "RerunWorkflowTool",
 ]
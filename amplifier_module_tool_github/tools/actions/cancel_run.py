@@ -1,51 +1,41 @@
 """Cancel a workflow run."""
 
 from typing import Any
-from ..base import GitHubBaseTool, ToolResult
-from ...exceptions import (
-    RepositoryNotFoundError,
-    RateLimitError,
-    PermissionError,
-    GitHubError,
-)
-
-try:
-    from github.GithubException import GithubException
-except ImportError:
-    GithubException = Exception
+from ..base import GitHubBaseTool, ToolResult, github_api_errors
 
 
 class CancelWorkflowRunTool(GitHubBaseTool):
     """Tool to cancel a running GitHub Actions workflow."""
 
-    @property
-    def name(self) -> str:
-        return "github_cancel_workflow_run"
-
-    @property
-    def description(self) -> str:
-        return (
-            "Cancel a running GitHub Actions workflow run. Only works for runs that are "
-            "in 'queued' or 'in_progress' status. Requires write access to the repository."
-        )
-
-    @property
-    def input_schema(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "repository": {
-                    "type": "string",
-                    "description": "Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode')"
-                },
-                "run_id": {
-                    "type": "integer",
-                    "description": "Workflow run ID to cancel (required)"
-                }
+    # GitHub API error status -> (error code, message template)
+    _ERROR_BY_STATUS = {
+        404: ("RUN_NOT_FOUND", "Workflow run #{run_id} not found in repository '{repository}'"),
+        409: ("RUN_ALREADY_COMPLETED", "Workflow run #{run_id} is already completed and cannot be cancelled"),
+    }
+
+    name = "github_cancel_workflow_run"
+
+    description = (
+        "Cancel a running GitHub Actions workflow run. Only works for runs that are "
+        "in 'queued' or 'in_progress' status. Requires write access to the repository."
+    )
+
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "repository": {
+                "type": "string",
+                "description": "Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode')"
             },
-            "required": ["repository", "run_id"]
-        }
-
+            "run_id": {
+                "type": "integer",
+                "description": "Workflow run ID to cancel (required)"
+            }
+        },
+        "required": ["repository", "run_id"]
+    }
+
+    @github_api_errors(_ERROR_BY_STATUS, permission="cancel workflow run")
     async def execute(self, input_data: dict[str, Any]) -> ToolResult:
         """Cancel a workflow run."""
         # Check authentication
@@ -65,77 +55,34 @@ class CancelWorkflowRunTool(GitHubBaseTool):
                 }
             )
 
-        try:
-            repo = self.manager.get_repository(repository)
-            run = repo.get_workflow_run(run_id)
+        repo = await self._run(self.manager.get_repository, repository)
 
-            # Check if run can be cancelled
-            if run.status == "completed":
-                return ToolResult(
-                    success=False,
-                    error={
-                        "message": f"Workflow run #{run_id} is already completed and cannot be cancelled",
-                        "code": "RUN_ALREADY_COMPLETED"
-                    }
-                )
+        await self._cancel(repo, run_id)
 
-            # Cancel the run
-            result = run.cancel()
-
-            return ToolResult(
-                success=True,
-                output={
-                    "repository": repository,
-                    "run": {
-                        "id": run.id,
-                        "name": run.name,
-                        "status": "cancelling",
-                    },
-                    "message": f"Workflow run #{run_id} cancellation requested"
-                }
-            )
-
-        except GithubException as e:
-            if e.status == 404:
-                return ToolResult(
-                    success=False,
-                    error={
-                        "message": f"Workflow run #{run_id} not found in repository '{repository}'",
-                        "code": "RUN_NOT_FOUND"
-                    }
-                )
-            elif e.status == 403:
-                return ToolResult(
-                    success=False,
-                    error=PermissionError("cancel workflow run").to_dict()
-                )
-            elif e.status == 409:
-                return ToolResult(
-                    success=False,
-                    error={
-                        "message": "Workflow run cannot be cancelled (may already be cancelled or completed)",
-                        "code": "CANNOT_CANCEL"
-                    }
-                )
-            return ToolResult(
-                success=False,
-                error={
-                    "message": f"GitHub API error: {str(e)}",
-                    "code": "GITHUB_API_ERROR"
-                }
-            )
+        return ToolResult(
+            success=True,
+            output={
+                "repository": repository,
+                "run": {
+                    "id": run_id,
+                    "status": "cancelling",
+                },
+                "message": f"Workflow run #{run_id} cancellation requested"
+            }
+        )
 
-        except RepositoryNotFoundError as e:
-            return ToolResult(success=False, error=e.to_dict())
+    async def _cancel(self, repo, run_id: int) -> None:
+        """
+        Request cancellation of a workflow run.
 
-        except RateLimitError as e:
-            return ToolResult(success=False, error=e.to_dict())
+        The cancel endpoint is called directly; GitHub answers 409 for runs
+        that have already completed, so there is no need to fetch the run first.
 
-        except Exception as e:
-            return ToolResult(
-                success=False,
-                error={
-                    "message": f"Unexpected error: {str(e)}",
-                    "code": "UNEXPECTED_ERROR"
-                }
-            )
+        Raises:
+            GithubException: If GitHub rejects the request
+        """
+        await self._run(
+            repo.requester.requestJsonAndCheck,
+            "POST",
+            f"{repo.url}/actions/runs/{run_id}/cancel",
+        )
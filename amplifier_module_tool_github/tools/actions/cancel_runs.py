@@ -0,0 +1,89 @@
+"""Cancel several workflow runs at once."""
+
+import asyncio
+from typing import Any
+from ..base import ToolResult, github_api_errors, _api_error
+from .cancel_run import CancelWorkflowRunTool
+from ...exceptions import GitHubError
+from ..._github_compat import GithubException
+
+
+class CancelWorkflowRunsTool(CancelWorkflowRunTool):
+    """Tool to cancel several running GitHub Actions workflows in one call."""
+
+    name = "github_cancel_workflow_runs"
+
+    description = (
+        "Cancel several running GitHub Actions workflow runs in one call. The "
+        "cancellations are sent concurrently and each run's outcome is reported "
+        "separately. Requires write access to the repository."
+    )
+
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "repository": {
+                "type": "string",
+                "description": "Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode')"
+            },
+            "run_ids": {
+                "type": "array",
+                "items": {"type": "integer"},
+                "description": "Workflow run IDs to cancel (required, max: 100)",
+                "minItems": 1,
+                "maxItems": 100
+            }
+        },
+        "required": ["repository", "run_ids"]
+    }
+
+    @github_api_errors()
+    async def execute(self, input_data: dict[str, Any]) -> ToolResult:
+        """Cancel several workflow runs."""
+        # Check authentication
+        auth_error = self._check_authentication()
+        if auth_error:
+            return auth_error
+
+        repository = input_data.get("repository")
+        run_ids = input_data.get("run_ids")
+
+        if not repository or not run_ids:
+            return ToolResult(
+                success=False,
+                error={
+                    "message": "repository and run_ids parameters are required",
+                    "code": "MISSING_PARAMETER"
+                }
+            )
+
+        repo = await self._run(self.manager.get_repository, repository)
+
+        # The manager caps how many of these are in flight at once
+        runs = await asyncio.gather(
+            *(self._cancel_one(repo, repository, run_id) for run_id in dict.fromkeys(run_ids))
+        )
+        cancelled = sum(1 for run in runs if "error" not in run)
+
+        return ToolResult(
+            success=True,
+            output={
+                "repository": repository,
+                "count": len(runs),
+                "cancelled": cancelled,
+                "failed": len(runs) - cancelled,
+                "runs": runs,
+            }
+        )
+
+    async def _cancel_one(self, repo, repository: str, run_id: int) -> dict[str, Any]:
+        """Cancel one run, reporting a rejection in the result instead of raising."""
+        try:
+            await self._cancel(repo, run_id)
+        except GithubException as e:
+            fields = {"repository": repository, "run_id": run_id}
+            error = _api_error(e, self._ERROR_BY_STATUS, fields, "cancel workflow run")
+            return {"id": run_id, "error": error}
+        except GitHubError as e:
+            return {"id": run_id, "error": e.to_dict()}
+        return {"id": run_id, "status": "cancelling"}
@@ -1,55 +1,56 @@
 """Get workflow run details."""
 
+import asyncio
 from typing import Any
-from ..base import GitHubBaseTool, ToolResult
-from ...exceptions import (
-    RepositoryNotFoundError,
-    RateLimitError,
-    GitHubError,
-)
-
-try:
-    from github.GithubException import GithubException
-except ImportError:
-    GithubException = Exception
+from ..base import GitHubBaseTool, ToolResult, github_api_errors, _api_error, _iso
+from ...exceptions import GitHubError
+from ..._github_compat import GithubException
 
 
 class GetWorkflowRunTool(GitHubBaseTool):
     """Tool to get detailed information about a specific workflow run."""
 
-    @property
-    def name(self) -> str:
-        return "github_get_workflow_run"
-
-    @property
-    def description(self) -> str:
-        return (
-            "Get detailed information about a specific GitHub Actions workflow run. "
-            "Returns run metadata, jobs, steps, and logs information."
-        )
-
-    @property
-    def input_schema(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "repository": {
-                    "type": "string",
-                    "description": "Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode')"
-                },
-                "run_id": {
-                    "type": "integer",
-                    "description": "Workflow run ID (required)"
-                },
-                "include_jobs": {
-                    "type": "boolean",
-                    "description": "Include job details (default: true)",
-                    "default": True
-                }
+    # GitHub API error status -> (error code, message template)
+    _ERROR_BY_STATUS = {
+        404: ("RUN_NOT_FOUND", "Workflow run #{run_id} not found in repository '{repository}'"),
+    }
+
+    name = "github_get_workflow_run"
+
+    description = (
+        "Get detailed information about a specific GitHub Actions workflow run. "
+        "Returns run metadata, jobs, steps, and logs information. "
+        "Pass run_ids instead of run_id to look up several runs at once."
+    )
+
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "repository": {
+                "type": "string",
+                "description": "Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode')"
             },
-            "required": ["repository", "run_id"]
-        }
+            "run_id": {
+                "type": "integer",
+                "description": "Workflow run ID (required unless run_ids is given)"
+            },
+            "run_ids": {
+                "type": "array",
+                "items": {"type": "integer"},
+                "description": "Several workflow run IDs to look up together (max: 100)",
+                "minItems": 1,
+                "maxItems": 100
+            },
+            "include_jobs": {
+                "type": "boolean",
+                "description": "Include job details (default: true)",
+                "default": True
+            }
+        },
+        "required": ["repository"]
+    }
 
+    @github_api_errors(_ERROR_BY_STATUS)
     async def execute(self, input_data: dict[str, Any]) -> ToolResult:
         """Get workflow run details."""
         # Check authentication
@@ -59,109 +60,112 @@ class GetWorkflowRunTool(GitHubBaseTool):
 
         repository = input_data.get("repository")
         run_id = input_data.get("run_id")
+        run_ids = input_data.get("run_ids")
         include_jobs = input_data.get("include_jobs", True)
 
-        if not repository or run_id is None:
+        if not repository or (run_id is None and not run_ids):
             return ToolResult(
                 success=False,
                 error={
-                    "message": "repository and run_id parameters are required",
+                    "message": "repository and run_id (or run_ids) parameters are required",
                     "code": "MISSING_PARAMETER"
                 }
             )
 
-        try:
-            repo = self.manager.get_repository(repository)
-            run = repo.get_workflow_run(run_id)
-
-            run_data = {
-                "id": run.id,
-                "name": run.name,
-                "status": run.status,
-                "conclusion": run.conclusion,
-                "workflow_id": run.workflow_id,
-                "run_number": run.run_number,
-                "event": run.event,
-                "head_branch": run.head_branch,
-                "head_sha": run.head_sha,
-                "created_at": run.created_at.isoformat() if run.created_at else None,
-                "updated_at": run.updated_at.isoformat() if run.updated_at else None,
-                "run_started_at": run.run_started_at.isoformat() if hasattr(run, 'run_started_at') and run.run_started_at else None,
-                "actor": run.actor.login if run.actor else None,
-                "url": run.html_url,
-                "logs_url": run.logs_url,
-                "cancel_url": run.cancel_url,
-                "rerun_url": run.rerun_url,
-            }
-
-            # Include jobs if requested
-            if include_jobs:
-                jobs = []
-                for job in run.jobs():
-                    job_data = {
-                        "id": job.id,
-                        "name": job.name,
-                        "status": job.status,
-                        "conclusion": job.conclusion,
-                        "started_at": job.started_at.isoformat() if job.started_at else None,
-                        "completed_at": job.completed_at.isoformat() if job.completed_at else None,
-                        "url": job.html_url,
-                    }
-
-                    # Include steps
-                    steps = []
-                    for step in job.steps:
-                        steps.append({
-                            "name": step.name,
-                            "status": step.status,
-                            "conclusion": step.conclusion,
-                            "number": step.number,
-                            "started_at": step.started_at.isoformat() if step.started_at else None,
-                            "completed_at": step.completed_at.isoformat() if step.completed_at else None,
-                        })
-                    job_data["steps"] = steps
-
-                    jobs.append(job_data)
-
-                run_data["jobs"] = jobs
-                run_data["jobs_count"] = len(jobs)
+        repo = await self._run(self.manager.get_repository, repository)
 
+        if run_ids:
+            # The manager caps how many of these are in flight at once
+            runs = await asyncio.gather(
+                *(self._get_one(repo, repository, rid, include_jobs) for rid in run_ids)
+            )
+            found = sum(1 for run in runs if "error" not in run)
             return ToolResult(
                 success=True,
                 output={
                     "repository": repository,
-                    "run": run_data,
+                    "count": len(runs),
+                    "found": found,
+                    "failed": len(runs) - found,
+                    "runs": runs,
                 }
             )
 
-        except GithubException as e:
-            if e.status == 404:
-                return ToolResult(
-                    success=False,
-                    error={
-                        "message": f"Workflow run #{run_id} not found in repository '{repository}'",
-                        "code": "RUN_NOT_FOUND"
-                    }
-                )
-            return ToolResult(
-                success=False,
-                error={
-                    "message": f"GitHub API error: {str(e)}",
-                    "code": "GITHUB_API_ERROR"
-                }
+        return ToolResult(
+            success=True,
+            output={
+                "repository": repository,
+                "run": await self._get_run(repo, run_id, include_jobs),
+            }
+        )
+
+    async def _get_run(self, repo, run_id: int, include_jobs: bool) -> dict[str, Any]:
+        """Fetch one run (and optionally its jobs) and build its output."""
+        lookup = self._run(self.manager.get_workflow_run, repo, run_id)
+        if include_jobs:
+            # The jobs listing doesn't depend on the run, so fetch both at once
+            run, jobs = await asyncio.gather(
+                lookup,
+                self._collect_all(self.manager.get_workflow_run_jobs(repo, run_id)),
             )
+        else:
+            run = await lookup
+
+        run_data = {
+            "id": run.id,
+            "name": run.name,
+            "status": run.status,
+            "conclusion": run.conclusion,
+            "workflow_id": run.workflow_id,
+            "run_number": run.run_number,
+            "event": run.event,
+            "head_branch": run.head_branch,
+            "head_sha": run.head_sha,
+            "created_at": _iso(run.created_at),
+            "updated_at": _iso(run.updated_at),
+            "run_started_at": _iso(run.run_started_at),
+            "actor": run.actor.login if run.actor else None,
+            "url": run.html_url,
+            "logs_url": run.logs_url,
+            "cancel_url": run.cancel_url,
+            "rerun_url": run.rerun_url,
+        }
 
-        except RepositoryNotFoundError as e:
-            return ToolResult(success=False, error=e.to_dict())
+        # Include jobs if requested
+        if include_jobs:
+            run_data["jobs"] = [
+                {
+                    "id": job.id,
+                    "name": job.name,
+                    "status": job.status,
+                    "conclusion": job.conclusion,
+                    "started_at": _iso(job.started_at),
+                    "completed_at": _iso(job.completed_at),
+                    "url": job.html_url,
+                    "steps": [
+                        {
+                            "name": step.name,
+                            "status": step.status,
+                            "conclusion": step.conclusion,
+                            "number": step.number,
+                            "started_at": _iso(step.started_at),
+                            "completed_at": _iso(step.completed_at),
+                        }
+                        for step in job.steps
+                    ],
+                }
+                for job in jobs
+            ]
+            run_data["jobs_count"] = len(jobs)
 
-        except RateLimitError as e:
-            return ToolResult(success=False, error=e.to_dict())
+        return run_data
 
-        except Exception as e:
-            return ToolResult(
-                success=False,
-                error={
-                    "message": f"Unexpected error: {str(e)}",
-                    "code": "UNEXPECTED_ERROR"
-                }
-            )
+    async def _get_one(self, repo, repository: str, run_id: int, include_jobs: bool) -> dict[str, Any]:
+        """Fetch one run of a bulk lookup, reporting a failure in the result instead of raising."""
+        try:
+            return await self._get_run(repo, run_id, include_jobs)
+        except GithubException as e:
+            fields = {"repository": repository, "run_id": run_id}
+            return {"id": run_id, "error": _api_error(e, self._ERROR_BY_STATUS, fields)}
+        except GitHubError as e:
+            return {"id": run_id, "error": e.to_dict()}
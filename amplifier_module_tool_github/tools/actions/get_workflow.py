@@ -1,50 +1,40 @@
 """Get workflow details."""
 
 from typing import Any
-from ..base import GitHubBaseTool, ToolResult
-from ...exceptions import (
-    RepositoryNotFoundError,
-    RateLimitError,
-    GitHubError,
-)
-
-try:
-    from github.GithubException import GithubException
-except ImportError:
-    GithubException = Exception
+from ..base import GitHubBaseTool, ToolResult, github_api_errors, _iso
 
 
 class GetWorkflowTool(GitHubBaseTool):
     """Tool to get detailed information about a specific workflow."""
 
-    @property
-    def name(self) -> str:
-        return "github_get_workflow"
+    # GitHub API error status -> (error code, message template)
+    _ERROR_BY_STATUS = {
+        404: ("WORKFLOW_NOT_FOUND", "Workflow '{workflow_id}' not found in repository '{repository}'"),
+    }
 
-    @property
-    def description(self) -> str:
-        return (
-            "Get detailed information about a specific GitHub Actions workflow. "
-            "Returns workflow metadata, configuration, and statistics."
-        )
+    name = "github_get_workflow"
 
-    @property
-    def input_schema(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "repository": {
-                    "type": "string",
-                    "description": "Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode')"
-                },
-                "workflow_id": {
-                    "type": ["integer", "string"],
-                    "description": "Workflow ID or workflow file name (e.g., 'main.yml')"
-                }
+    description = (
+        "Get detailed information about a specific GitHub Actions workflow. "
+        "Returns workflow metadata, configuration, and statistics."
+    )
+
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "repository": {
+                "type": "string",
+                "description": "Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode')"
             },
-            "required": ["repository", "workflow_id"]
-        }
+            "workflow_id": {
+                "type": ["integer", "string"],
+                "description": "Workflow ID or workflow file name (e.g., 'main.yml')"
+            }
+        },
+        "required": ["repository", "workflow_id"]
+    }
 
+    @github_api_errors(_ERROR_BY_STATUS)
     async def execute(self, input_data: dict[str, Any]) -> ToolResult:
         """Get workflow details."""
         # Check authentication
@@ -64,57 +54,24 @@ class GetWorkflowTool(GitHubBaseTool):
                 }
             )
 
-        try:
-            repo = self.manager.get_repository(repository)
-            workflow = repo.get_workflow(workflow_id)
+        repo = await self._run(self.manager.get_repository, repository)
+        workflow = await self._run(self.manager.get_workflow, repo, workflow_id)
+
+        workflow_data = {
+            "id": workflow.id,
+            "name": workflow.name,
+            "path": workflow.path,
+            "state": workflow.state,
+            "created_at": _iso(workflow.created_at),
+            "updated_at": _iso(workflow.updated_at),
+            "url": workflow.html_url,
+            "badge_url": workflow.badge_url,
+        }
 
-            workflow_data = {
-                "id": workflow.id,
-                "name": workflow.name,
-                "path": workflow.path,
-                "state": workflow.state,
-                "created_at": workflow.created_at.isoformat() if workflow.created_at else None,
-                "updated_at": workflow.updated_at.isoformat() if workflow.updated_at else None,
-                "url": workflow.html_url,
-                "badge_url": workflow.badge_url,
+        return ToolResult(
+            success=True,
+            output={
+                "repository": repository,
+                "workflow": workflow_data,
             }
-
-            return ToolResult(
-                success=True,
-                output={
-                    "repository": repository,
-                    "workflow": workflow_data,
-                }
-            )
-
-        except GithubException as e:
-            if e.status == 404:
-                return ToolResult(
-                    success=False,
-                    error={
-                        "message": f"Workflow '{workflow_id}' not found in repository '{repository}'",
-                        "code": "WORKFLOW_NOT_FOUND"
-                    }
-                )
-            return ToolResult(
-                success=False,
-                error={
-                    "message": f"GitHub API error: {str(e)}",
-                    "code": "GITHUB_API_ERROR"
-                }
-            )
-
-        except RepositoryNotFoundError as e:
-            return ToolResult(success=False, error=e.to_dict())
-
-        except RateLimitError as e:
-            return ToolResult(success=False, error=e.to_dict())
-
-        except Exception as e:
-            return ToolResult(
-                success=False,
-                error={
-                    "message": f"Unexpected error: {str(e)}",
-                    "code": "UNEXPECTED_ERROR"
-                }
-            )
+        )
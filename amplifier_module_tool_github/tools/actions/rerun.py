@@ -1,56 +1,46 @@
 """Rerun a workflow."""
 
 from typing import Any
-from ..base import GitHubBaseTool, ToolResult
-from ...exceptions import (
-    RepositoryNotFoundError,
-    RateLimitError,
-    PermissionError,
-    GitHubError,
-)
-
-try:
-    from github.GithubException import GithubException
-except ImportError:
-    GithubException = Exception
+from ..base import GitHubBaseTool, ToolResult, github_api_errors
 
 
 class RerunWorkflowTool(GitHubBaseTool):
     """Tool to rerun a GitHub Actions workflow."""
 
-    @property
-    def name(self) -> str:
-        return "github_rerun_workflow"
-
-    @property
-    def description(self) -> str:
-        return (
-            "Rerun a GitHub Actions workflow run. Can rerun all jobs or only failed jobs. "
-            "Requires write access to the repository."
-        )
-
-    @property
-    def input_schema(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "repository": {
-                    "type": "string",
-                    "description": "Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode')"
-                },
-                "run_id": {
-                    "type": "integer",
-                    "description": "Workflow run ID to rerun (required)"
-                },
-                "failed_jobs_only": {
-                    "type": "boolean",
-                    "description": "Rerun only failed jobs (default: false, rerun all jobs)",
-                    "default": False
-                }
+    # GitHub API error status -> (error code, message template)
+    _ERROR_BY_STATUS = {
+        404: ("RUN_NOT_FOUND", "Workflow run #{run_id} not found in repository '{repository}'"),
+        409: ("CANNOT_RERUN", "Workflow run cannot be rerun (may already be running)"),
+    }
+
+    name = "github_rerun_workflow"
+
+    description = (
+        "Rerun a GitHub Actions workflow run. Can rerun all jobs or only failed jobs. "
+        "Requires write access to the repository."
+    )
+
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "repository": {
+                "type": "string",
+                "description": "Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode')"
             },
-            "required": ["repository", "run_id"]
-        }
-
+            "run_id": {
+                "type": "integer",
+                "description": "Workflow run ID to rerun (required)"
+            },
+            "failed_jobs_only": {
+                "type": "boolean",
+                "description": "Rerun only failed jobs (default: false, rerun all jobs)",
+                "default": False
+            }
+        },
+        "required": ["repository", "run_id"]
+    }
+
+    @github_api_errors(_ERROR_BY_STATUS, permission="rerun workflow")
     async def execute(self, input_data: dict[str, Any]) -> ToolResult:
         """Rerun a workflow."""
         # Check authentication
@@ -71,82 +61,40 @@ class RerunWorkflowTool(GitHubBaseTool):
                 }
             )
 
-        try:
-            repo = self.manager.get_repository(repository)
-            run = repo.get_workflow_run(run_id)
-
-            # Check if run is in a state that can be rerun
-            if run.status != "completed":
-                return ToolResult(
-                    success=False,
-                    error={
-                        "message": f"Workflow run #{run_id} is not completed and cannot be rerun",
-                        "code": "RUN_NOT_COMPLETED"
-                    }
-                )
-
-            # Rerun the workflow
-            if failed_jobs_only:
-                result = run.rerun_failed_jobs()
-                message = f"Workflow run #{run_id} rerun requested for failed jobs"
-            else:
-                result = run.rerun()
-                message = f"Workflow run #{run_id} rerun requested for all jobs"
-
-            return ToolResult(
-                success=True,
-                output={
-                    "repository": repository,
-                    "run": {
-                        "id": run.id,
-                        "name": run.name,
-                        "failed_jobs_only": failed_jobs_only,
-                    },
-                    "message": message
-                }
-            )
-
-        except GithubException as e:
-            if e.status == 404:
-                return ToolResult(
-                    success=False,
-                    error={
-                        "message": f"Workflow run #{run_id} not found in repository '{repository}'",
-                        "code": "RUN_NOT_FOUND"
-                    }
-                )
-            elif e.status == 403:
-                return ToolResult(
-                    success=False,
-                    error=PermissionError("rerun workflow").to_dict()
-                )
-            elif e.status == 409:
-                return ToolResult(
-                    success=False,
-                    error={
-                        "message": "Workflow run cannot be rerun (may already be running)",
-                        "code": "CANNOT_RERUN"
-                    }
-                )
-            return ToolResult(
-                success=False,
-                error={
-                    "message": f"GitHub API error: {str(e)}",
-                    "code": "GITHUB_API_ERROR"
-                }
-            )
+        repo = await self._run(self.manager.get_repository, repository)
+
+        # Rerun the workflow
+        if failed_jobs_only:
+            await self._rerun(repo, run_id, "rerun-failed-jobs")
+            message = f"Workflow run #{run_id} rerun requested for failed jobs"
+        else:
+            await self._rerun(repo, run_id, "rerun")
+            message = f"Workflow run #{run_id} rerun requested for all jobs"
+
+        return ToolResult(
+            success=True,
+            output={
+                "repository": repository,
+                "run": {
+                    "id": run_id,
+                    "failed_jobs_only": failed_jobs_only,
+                },
+                "message": message
+            }
+        )
 
-        except RepositoryNotFoundError as e:
-            return ToolResult(success=False, error=e.to_dict())
+    async def _rerun(self, repo, run_id: int, action: str) -> None:
+        """
+        Request a rerun of a workflow run.
 
-        except RateLimitError as e:
-            return ToolResult(success=False, error=e.to_dict())
+        The rerun endpoint is called directly; GitHub answers 409 for runs
+        that cannot be rerun yet, so there is no need to fetch the run first.
 
-        except Exception as e:
-            return ToolResult(
-                success=False,
-                error={
-                    "message": f"Unexpected error: {str(e)}",
-                    "code": "UNEXPECTED_ERROR"
-                }
-            )
+        Raises:
+            GithubException: If GitHub rejects the request
+        """
+        await self._run(
+            repo.requester.requestJsonAndCheck,
+            "POST",
+            f"{repo.url}/actions/runs/{run_id}/{action}",
+        )
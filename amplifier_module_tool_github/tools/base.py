@@ -1,18 +1,29 @@
 """Base class for GitHub tools."""
 
+import asyncio
+import functools
 import logging
-from typing import Any, TYPE_CHECKING
+from collections import defaultdict
+from itertools import islice
+from typing import Any, Callable, ClassVar, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..manager import GitHubManager
 
-from ..exceptions import AuthenticationError, PermissionError
+from .._github_compat import GithubException, PaginatedList
+from ..exceptions import (
+    AuthenticationError,
+    GitHubError,
+    PermissionError,
+)
 
 try:
     from amplifier_core import ToolResult
 except ImportError:
     # Fallback for testing without amplifier-core
     class ToolResult:
+        __slots__ = ("success", "output", "error")
+
         def __init__(self, success: bool, output: dict | None = None, error: dict | None = None):
             self.success = success
             self.output = output or {}
@@ -20,10 +31,144 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Most pages requested at once when a list spans several pages
+_MAX_PAGE_FANOUT = 8
+
+
+def _take(items, limit: int, keep: Callable[[Any], bool] | None) -> list:
+    """Collect up to ``limit`` items from an iterable, optionally filtered."""
+    if keep is not None:
+        items = filter(keep, items)
+    return list(islice(items, limit))
+
+
+def _iso(value) -> str | None:
+    """Format an optional datetime as ISO 8601, passing None through."""
+    return value.isoformat() if value else None
+
+
+def _api_error(
+    e: GithubException,
+    errors: dict[int, tuple[str, str]],
+    fields: dict[str, Any],
+    permission: str | None = None,
+) -> dict[str, Any]:
+    """
+    Build the error payload for a GitHub API error.
+
+    Args:
+        e: The API error
+        errors: Status -> (error code, message template); templates are
+            formatted with ``fields`` plus ``error``
+        fields: Values for the message template, usually the tool input
+        permission: Action named in the PermissionError reported for 403
+
+    Returns:
+        Error dict for a failed ToolResult
+    """
+    if e.status == 403 and permission:
+        return PermissionError(permission).to_dict()
+    code, message = errors.get(e.status, ("GITHUB_API_ERROR", "GitHub API error: {error}"))
+    return {
+        "message": message.format_map(defaultdict(lambda: None, fields, error=e)),
+        "code": code
+    }
+
+
+def github_api_errors(
+    errors: dict[int, tuple[str, str]] | None = None,
+    *,
+    permission: str | None = None,
+):
+    """
+    Turn exceptions escaping a tool's ``execute`` into failed ToolResults.
+
+    Args:
+        errors: GitHub API error status -> (error code, message template);
+            templates are formatted with the tool input plus ``error``
+        permission: Action named in the PermissionError reported for 403
+
+    Returns:
+        Decorator for ``execute``
+    """
+    errors = errors or {}
+
+    def decorator(execute):
+        @functools.wraps(execute)
+        async def wrapper(self, input_data: dict[str, Any]) -> ToolResult:
+            try:
+                return await execute(self, input_data)
+
+            except GithubException as e:
+                return ToolResult(success=False, error=_api_error(e, errors, input_data, permission))
+
+            except GitHubError as e:
+                return ToolResult(success=False, error=e.to_dict())
+
+            except Exception as e:
+                return ToolResult(
+                    success=False,
+                    error={
+                        "message": f"Unexpected error: {str(e)}",
+                        "code": "UNEXPECTED_ERROR"
+                    }
+                )
+
+        return wrapper
+
+    return decorator
+
+
+def required_params(*names: str):
+    """
+    Check authentication and required parameters before a tool's ``execute``.
+
+    The authentication error takes precedence, so the decorated ``execute``
+    need not call ``_check_authentication`` itself.
+
+    Args:
+        names: Input parameters that must be present and non-empty
+
+    Returns:
+        Decorator for ``execute``
+    """
+    if len(names) == 1:
+        message = f"{names[0]} parameter is required"
+    elif len(names) == 2:
+        message = f"{names[0]} and {names[1]} parameters are required"
+    else:
+        message = f"{', '.join(names[:-1])}, and {names[-1]} parameters are required"
+
+    def decorator(execute):
+        @functools.wraps(execute)
+        async def wrapper(self, input_data: dict[str, Any]) -> ToolResult:
+            auth_error = self._check_authentication()
+            if auth_error:
+                return auth_error
+
+            if not all(input_data.get(name) for name in names):
+                return ToolResult(
+                    success=False,
+                    error={
+                        "message": message,
+                        "code": "MISSING_PARAMETER"
+                    }
+                )
+            return await execute(self, input_data)
+
+        return wrapper
+
+    return decorator
+
 
 class GitHubBaseTool:
     """Base class for all GitHub tools."""
 
+    # Set by every subclass; plain class attributes, built once at import
+    name: ClassVar[str]  # Tool name
+    description: ClassVar[str]  # Tool description
+    input_schema: ClassVar[dict[str, Any]]  # JSON schema for tool input
+
     def __init__(self, manager: "GitHubManager"):
         """
         Initialize the tool.
@@ -33,21 +178,6 @@ class GitHubBaseTool:
         """
         self.manager = manager
 
-    @property
-    def name(self) -> str:
-        """Tool name - must be implemented by subclasses."""
-        raise NotImplementedError
-
-    @property
-    def description(self) -> str:
-        """Tool description - must be implemented by subclasses."""
-        raise NotImplementedError
-
-    @property
-    def input_schema(self) -> dict[str, Any]:
-        """JSON schema for tool input - must be implemented by subclasses."""
-        raise NotImplementedError
-
     async def execute(self, input_data: dict[str, Any]) -> ToolResult:
         """
         Execute the tool - must be implemented by subclasses.
@@ -60,6 +190,96 @@ class GitHubBaseTool:
         """
         raise NotImplementedError
 
+    async def _run(self, fn, /, *args, **kwargs):
+        """
+        Run a blocking PyGithub call without blocking the event loop.
+
+        Args:
+            fn: Callable to run, followed by its arguments
+
+        Returns:
+            Whatever ``fn`` returns
+        """
+        return await self.manager.run(fn, *args, **kwargs)
+
+    async def _collect(
+        self,
+        items,
+        limit: int,
+        keep: Callable[[Any], bool] | None = None,
+    ) -> list:
+        """
+        Collect up to ``limit`` items from a PyGithub paginated list.
+
+        The first page is fetched on its own; when more items are needed, the
+        remaining pages are requested concurrently instead of one after another.
+
+        Args:
+            items: PaginatedList (or any iterable) to collect from
+            limit: Maximum number of items to return
+            keep: Optional predicate; items it rejects are skipped
+
+        Returns:
+            List of at most ``limit`` items, in the order GitHub returned them
+        """
+        if PaginatedList is None or not isinstance(items, PaginatedList):
+            return await self._run(_take, items, limit, keep)
+
+        per_page = self.manager.per_page
+        collected: list = []
+        page = 0
+        batch = 1
+        while True:
+            pages = await asyncio.gather(
+                *(self._run(items.get_page, number) for number in range(page, page + batch))
+            )
+            for chunk in pages:
+                collected.extend(_take(chunk, per_page, keep))
+                if len(collected) >= limit:
+                    return collected[:limit]
+                if len(chunk) < per_page:
+                    # A short page is the last one
+                    return collected
+            page += batch
+            missing_pages = -(-(limit - len(collected)) // per_page)
+            batch = min(missing_pages, _MAX_PAGE_FANOUT)
+
+    async def _collect_all(self, items) -> list:
+        """
+        Collect every item from a PyGithub paginated list.
+
+        Pages are fetched until one comes back short. After the first page
+        they are requested in concurrent batches that double up to
+        ``_MAX_PAGE_FANOUT``, so a long list isn't followed link by link and
+        a short one requests at most a page or two past its end. The total
+        isn't read up front: for endpoints returning a plain JSON array,
+        ``totalCount`` costs an extra request of its own.
+
+        Args:
+            items: PaginatedList (or any iterable) to collect from
+
+        Returns:
+            List of all items, in the order GitHub returned them
+        """
+        if PaginatedList is None or not isinstance(items, PaginatedList):
+            return await self._run(list, items)
+
+        per_page = self.manager.per_page
+        collected: list = []
+        page = 0
+        batch = 1
+        while True:
+            pages = await asyncio.gather(
+                *(self._run(items.get_page, number) for number in range(page, page + batch))
+            )
+            for chunk in pages:
+                collected.extend(chunk)
+                if len(chunk) < per_page:
+                    # A short page is the last one
+                    return collected
+            page += batch
+            batch = min(batch * 2, _MAX_PAGE_FANOUT)
+
     def _check_authentication(self) -> ToolResult | None:
         """
         Check if GitHub client is authenticated.
@@ -1,118 +1,137 @@
 """Compare two branches."""
 
 from typing import Any
-from ..base import GitHubBaseTool, ToolResult
-from ...exceptions import (
-    RepositoryNotFoundError,
-    RateLimitError,
-    GitHubError,
-)
+from ..base import GitHubBaseTool, ToolResult, github_api_errors, required_params, _iso, _take
 
-try:
-    from github.GithubException import GithubException
-except ImportError:
-    GithubException = Exception
+
+# Column names of the commits list when output_format is "columns"
+_COMMIT_FIELDS = ("sha", "message", "author_name", "author_email", "date", "username", "url")
 
 
 class CompareBranchesTool(GitHubBaseTool):
     """Tool to compare two branches in a GitHub repository."""
 
-    @property
-    def name(self) -> str:
-        return "github_compare_branches"
-
-    @property
-    def description(self) -> str:
-        return (
-            "Compare two branches (or commits/tags) in a GitHub repository. Returns the diff "
-            "between them including files changed, commit history, and statistics. "
-            "Shows what changes exist in the head ref that don't exist in the base ref."
-        )
-
-    @property
-    def input_schema(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "repository": {
-                    "type": "string",
-                    "description": "Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode')"
-                },
-                "base": {
-                    "type": "string",
-                    "description": "Base branch/commit/tag to compare from (required)"
-                },
-                "head": {
-                    "type": "string",
-                    "description": "Head branch/commit/tag to compare to (required)"
-                },
-                "include_files": {
-                    "type": "boolean",
-                    "description": "Include list of files changed (default: true)",
-                    "default": True
-                },
-                "include_commits": {
-                    "type": "boolean",
-                    "description": "Include list of commits (default: true)",
-                    "default": True
-                }
+    # GitHub API error status -> (error code, message template)
+    _ERROR_BY_STATUS = {
+        404: ("REF_NOT_FOUND", "One or both references not found: base='{base}', head='{head}'"),
+    }
+
+    name = "github_compare_branches"
+
+    description = (
+        "Compare two branches (or commits/tags) in a GitHub repository. Returns the diff "
+        "between them including files changed, commit history, and statistics. "
+        "Shows what changes exist in the head ref that don't exist in the base ref."
+    )
+
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "repository": {
+                "type": "string",
+                "description": "Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode')"
             },
-            "required": ["repository", "base", "head"]
-        }
+            "base": {
+                "type": "string",
+                "description": "Base branch/commit/tag to compare from (required)"
+            },
+            "head": {
+                "type": "string",
+                "description": "Head branch/commit/tag to compare to (required)"
+            },
+            "include_files": {
+                "type": "boolean",
+                "description": "Include list of files changed (default: true)",
+                "default": True
+            },
+            "include_commits": {
+                "type": "boolean",
+                "description": "Include list of commits (default: true)",
+                "default": True
+            },
+            "max_files": {
+                "type": "integer",
+                "description": "Maximum number of files to return (default: 300, max: 300)",
+                "default": 300,
+                "minimum": 1,
+                "maximum": 300
+            },
+            "max_commits": {
+                "type": "integer",
+                "description": "Maximum number of commits to return (default: 300, max: 10000)",
+                "default": 300,
+                "minimum": 1,
+                "maximum": 10000
+            },
+            "output_format": {
+                "type": "string",
+                "enum": ["rows", "columns"],
+                "description": (
+                    "Shape of the files and commits lists: 'rows' gives one object per "
+                    "entry, 'columns' gives one list per field, which is much smaller "
+                    "for large comparisons (default: rows)"
+                ),
+                "default": "rows"
+            }
+        },
+        "required": ["repository", "base", "head"]
+    }
 
+    @github_api_errors(_ERROR_BY_STATUS)
+    @required_params("repository", "base", "head")
     async def execute(self, input_data: dict[str, Any]) -> ToolResult:
         """Compare two branches."""
-        # Check authentication
-        auth_error = self._check_authentication()
-        if auth_error:
-            return auth_error
-
         repository = input_data.get("repository")
         base = input_data.get("base")
         head = input_data.get("head")
         include_files = input_data.get("include_files", True)
         include_commits = input_data.get("include_commits", True)
+        max_files = input_data.get("max_files", 300)
+        max_commits = input_data.get("max_commits", 300)
+        columnar = input_data.get("output_format", "rows") == "columns"
 
-        if not repository or not base or not head:
-            return ToolResult(
-                success=False,
-                error={
-                    "message": "repository, base, and head parameters are required",
-                    "code": "MISSING_PARAMETER"
-                }
-            )
-
-        try:
-            repo = self.manager.get_repository(repository)
-
-            # Compare the refs
-            comparison = repo.compare(base, head)
-
-            comparison_data = {
-                "base": {
-                    "ref": base,
-                    "sha": comparison.base_commit.sha,
-                },
-                "head": {
-                    "ref": head,
-                    "sha": comparison.head_commit.sha,
-                },
-                "status": comparison.status,
-                "ahead_by": comparison.ahead_by,
-                "behind_by": comparison.behind_by,
-                "total_commits": comparison.total_commits,
-                "stats": {
-                    "additions": comparison.additions if hasattr(comparison, 'additions') else 0,
-                    "deletions": comparison.deletions if hasattr(comparison, 'deletions') else 0,
-                    "total": comparison.total_commits,
-                },
-                "url": comparison.html_url,
-            }
+        repo = await self._run(self.manager.get_repository, repository)
 
-            # Include files changed if requested
-            if include_files:
-                files = []
-                for file in comparison.files:
+        # Compare the refs; a repeat comparison is revalidated with its ETag
+        comparison = await self._run(self.manager.get_comparison, repo, base, head)
+
+        comparison_data = {
+            "base": {
+                "ref": base,
+                "sha": comparison.base_commit.sha,
+            },
+            "head": {
+                "ref": head,
+                "sha": comparison.head_commit.sha,
+            },
+            "status": comparison.status,
+            "ahead_by": comparison.ahead_by,
+            "behind_by": comparison.behind_by,
+            "total_commits": comparison.total_commits,
+            "stats": {
+                "additions": getattr(comparison, 'additions', 0),
+                "deletions": getattr(comparison, 'deletions', 0),
+                "total": comparison.total_commits,
+            },
+            "url": comparison.html_url,
+        }
+
+        # Include files changed if requested
+        if include_files:
+            changed_files = comparison.files
+            files = changed_files[:max_files]
+            if columnar:
+                comparison_data["files"] = {
+                    "filename": [file.filename for file in files],
+                    "status": [file.status for file in files],
+                    "additions": [file.additions for file in files],
+                    "deletions": [file.deletions for file in files],
+                    "changes": [file.changes for file in files],
+                    "patch": [getattr(file, 'patch', None) for file in files],
+                }
+            else:
+                file_rows = []
+                for file in files:
                     file_data = {
                         "filename": file.filename,
                         "status": file.status,
@@ -121,65 +140,62 @@ class CompareBranchesTool(GitHubBaseTool):
                         "changes": file.changes,
                     }
                     # Include patch if available
-                    if hasattr(file, 'patch') and file.patch:
-                        file_data["patch"] = file.patch
-                    files.append(file_data)
-                comparison_data["files"] = files
-                comparison_data["files_changed"] = len(files)
-
-            # Include commits if requested
-            if include_commits:
-                commits = []
-                for commit in comparison.commits:
-                    commits.append({
-                        "sha": commit.sha,
-                        "message": commit.commit.message if commit.commit else None,
+                    patch = getattr(file, 'patch', None)
+                    if patch:
+                        file_data["patch"] = patch
+                    file_rows.append(file_data)
+                comparison_data["files"] = file_rows
+            comparison_data["files_changed"] = len(files)
+            comparison_data["files_truncated"] = len(changed_files) > max_files
+
+        # Include commits if requested
+        if include_commits:
+            # Commits are paginated past the first page (which came with the
+            # comparison); only fetch further pages while under the cap
+            commits = await self._run(_take, comparison.commits, max_commits, None)
+            commit_rows = [self._commit_row(commit) for commit in commits]
+            if columnar:
+                comparison_data["commits"] = {
+                    field: [row[index] for row in commit_rows]
+                    for index, field in enumerate(_COMMIT_FIELDS)
+                }
+            else:
+                comparison_data["commits"] = [
+                    {
+                        "sha": sha,
+                        "message": message,
                         "author": {
-                            "name": commit.commit.author.name if commit.commit and commit.commit.author else None,
-                            "email": commit.commit.author.email if commit.commit and commit.commit.author else None,
-                            "date": commit.commit.author.date.isoformat() if commit.commit and commit.commit.author and commit.commit.author.date else None,
-                            "username": commit.author.login if commit.author else None,
+                            "name": name,
+                            "email": email,
+                            "date": date,
+                            "username": username,
                         },
-                        "url": commit.html_url,
-                    })
-                comparison_data["commits"] = commits
-
-            return ToolResult(
-                success=True,
-                output={
-                    "repository": repository,
-                    "comparison": comparison_data,
-                }
-            )
-
-        except GithubException as e:
-            if e.status == 404:
-                return ToolResult(
-                    success=False,
-                    error={
-                        "message": f"One or both references not found: base='{base}', head='{head}'",
-                        "code": "REF_NOT_FOUND"
+                        "url": url,
                     }
-                )
-            return ToolResult(
-                success=False,
-                error={
-                    "message": f"GitHub API error: {str(e)}",
-                    "code": "GITHUB_API_ERROR"
-                }
-            )
-
-        except RepositoryNotFoundError as e:
-            return ToolResult(success=False, error=e.to_dict())
-
-        except RateLimitError as e:
-            return ToolResult(success=False, error=e.to_dict())
+                    for sha, message, name, email, date, username, url in commit_rows
+                ]
+            comparison_data["commits_truncated"] = comparison.total_commits > len(commits)
+
+        return ToolResult(
+            success=True,
+            output={
+                "repository": repository,
+                "comparison": comparison_data,
+            }
+        )
 
-        except Exception as e:
-            return ToolResult(
-                success=False,
-                error={
-                    "message": f"Unexpected error: {str(e)}",
-                    "code": "UNEXPECTED_ERROR"
-                }
-            )
+    @staticmethod
+    def _commit_row(commit) -> tuple:
+        """Read one compared commit's fields, in _COMMIT_FIELDS order."""
+        git_commit = commit.commit
+        git_author = git_commit.author if git_commit else None
+        author = commit.author
+        return (
+            commit.sha,
+            git_commit.message if git_commit else None,
+            git_author.name if git_author else None,
+            git_author.email if git_author else None,
+            _iso(git_author.date) if git_author else None,
+            author.login if author else None,
+            commit.html_url,
+        )
@@ -1,57 +1,42 @@
 """List branches in a repository."""
 
 from typing import Any
-from ..base import GitHubBaseTool, ToolResult
-from ...exceptions import (
-    RepositoryNotFoundError,
-    RateLimitError,
-    GitHubError,
-)
-
-try:
-    from github.GithubException import GithubException
-except ImportError:
-    GithubException = Exception
+from ..base import GitHubBaseTool, ToolResult, github_api_errors
 
 
 class ListBranchesTool(GitHubBaseTool):
     """Tool to list branches in a GitHub repository."""
 
-    @property
-    def name(self) -> str:
-        return "github_list_branches"
+    name = "github_list_branches"
 
-    @property
-    def description(self) -> str:
-        return (
-            "List all branches in a GitHub repository. Returns branch names, SHAs, "
-            "and protection status for each branch."
-        )
+    description = (
+        "List all branches in a GitHub repository. Returns branch names, SHAs, "
+        "and protection status for each branch."
+    )
 
-    @property
-    def input_schema(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "repository": {
-                    "type": "string",
-                    "description": "[Required] Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode'). This is a repository-specific operation."
-                },
-                "protected": {
-                    "type": "boolean",
-                    "description": "Filter by protection status (true=protected only, false=unprotected only, null=all)"
-                },
-                "limit": {
-                    "type": "integer",
-                    "description": "Maximum number of branches to return (default: 100, max: 100)",
-                    "default": 100,
-                    "minimum": 1,
-                    "maximum": 100
-                }
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "repository": {
+                "type": "string",
+                "description": "[Required] Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode'). This is a repository-specific operation."
             },
-            "required": ["repository"]
-        }
-
+            "protected": {
+                "type": "boolean",
+                "description": "Filter by protection status (true=protected only, false=unprotected only, null=all)"
+            },
+            "limit": {
+                "type": "integer",
+                "description": "Maximum number of branches to return (default: 100, max: 100)",
+                "default": 100,
+                "minimum": 1,
+                "maximum": 100
+            }
+        },
+        "required": ["repository"]
+    }
+
+    @github_api_errors()
     async def execute(self, input_data: dict[str, Any]) -> ToolResult:
         """List branches in a repository."""
         # Check authentication
@@ -69,75 +54,40 @@ class ListBranchesTool(GitHubBaseTool):
                 error={"message": "repository parameter is required", "code": "MISSING_PARAMETER"}
             )
 
-        try:
-            repo = self.manager.get_repository(repository)
-            branches = repo.get_branches()
-
-            # Collect branch data
-            branch_list = []
-            count = 0
-            for branch in branches:
-                if count >= limit:
-                    break
-
-                # Check protection status
-                is_protected = branch.protected
-
-                # Filter by protection status if specified
-                if protected is not None:
-                    if protected and not is_protected:
-                        continue
-                    if not protected and is_protected:
-                        continue
-
-                branch_data = {
-                    "name": branch.name,
-                    "sha": branch.commit.sha,
-                    "protected": is_protected,
-                }
-
-                # Get commit info
-                try:
-                    commit = branch.commit
-                    branch_data["commit"] = {
-                        "sha": commit.sha,
-                        "url": commit.html_url if hasattr(commit, 'html_url') else None,
-                    }
-                except Exception:
-                    pass
-
-                branch_list.append(branch_data)
-                count += 1
+        repo = await self._run(self.manager.get_repository, repository)
 
-            return ToolResult(
-                success=True,
-                output={
-                    "repository": repository,
-                    "count": len(branch_list),
-                    "branches": branch_list,
-                }
-            )
+        # Filter by protection status if specified
+        keep = None
+        if protected is not None:
+            def keep(branch) -> bool:
+                return branch.protected == protected
 
-        except RepositoryNotFoundError as e:
-            return ToolResult(success=False, error=e.to_dict())
+        branches = await self._collect(repo.get_branches(), limit, keep)
 
-        except RateLimitError as e:
-            return ToolResult(success=False, error=e.to_dict())
+        # The listing only carries each commit's SHA and API URL; reading
+        # html_url would fetch the whole commit, so build the link instead
+        commit_url = f"{repo.html_url}/commit/"
+        branch_list = [self._branch_data(branch, commit_url) for branch in branches]
 
-        except GithubException as e:
-            return ToolResult(
-                success=False,
-                error={
-                    "message": f"GitHub API error: {str(e)}",
-                    "code": "GITHUB_API_ERROR"
-                }
-            )
+        return ToolResult(
+            success=True,
+            output={
+                "repository": repository,
+                "count": len(branch_list),
+                "branches": branch_list,
+            }
+        )
 
-        except Exception as e:
-            return ToolResult(
-                success=False,
-                error={
-                    "message": f"Unexpected error: {str(e)}",
-                    "code": "UNEXPECTED_ERROR"
-                }
-            )
+    @staticmethod
+    def _branch_data(branch, commit_url: str) -> dict[str, Any]:
+        """Build the output entry for one branch."""
+        sha = branch.commit.sha
+        return {
+            "name": branch.name,
+            "sha": sha,
+            "protected": branch.protected,
+            "commit": {
+                "sha": sha,
+                "url": commit_url + sha,
+            },
+        }
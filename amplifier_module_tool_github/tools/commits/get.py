@@ -1,55 +1,64 @@
 """Get commit details."""
 
+import asyncio
+import hashlib
 from typing import Any
-from ..base import GitHubBaseTool, ToolResult
-from ...exceptions import (
-    RepositoryNotFoundError,
-    RateLimitError,
-    GitHubError,
-)
+from ..base import GitHubBaseTool, ToolResult, github_api_errors, _iso
 
-try:
-    from github.GithubException import GithubException
-except ImportError:
-    GithubException = Exception
+
+def _patch_url(commit_url: str, filename: str) -> str:
+    """Link to one file's diff on a commit page (GitHub anchors it by the path's SHA-256)."""
+    return f"{commit_url}#diff-{hashlib.sha256(filename.encode()).hexdigest()}"
 
 
 class GetCommitTool(GitHubBaseTool):
     """Tool to get detailed information about a specific commit."""
 
-    @property
-    def name(self) -> str:
-        return "github_get_commit"
-
-    @property
-    def description(self) -> str:
-        return (
-            "Get detailed information about a specific commit in a GitHub repository. "
-            "Returns commit message, author, stats, and list of files changed with diffs."
-        )
-
-    @property
-    def input_schema(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "repository": {
-                    "type": "string",
-                    "description": "Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode')"
-                },
-                "sha": {
-                    "type": "string",
-                    "description": "Commit SHA (required)"
-                },
-                "include_files": {
-                    "type": "boolean",
-                    "description": "Include list of files changed (default: true)",
-                    "default": True
-                }
+    # GitHub API error status -> (error code, message template)
+    _ERROR_BY_STATUS = {
+        404: ("COMMIT_NOT_FOUND", "Commit '{sha}' not found in repository '{repository}'"),
+        422: ("INVALID_SHA", "Invalid commit SHA: {sha}"),
+    }
+
+    name = "github_get_commit"
+
+    description = (
+        "Get detailed information about a specific commit in a GitHub repository. "
+        "Returns commit message, author, stats, and list of files changed with diffs."
+    )
+
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "repository": {
+                "type": "string",
+                "description": "Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode')"
             },
-            "required": ["repository", "sha"]
-        }
+            "sha": {
+                "type": "string",
+                "description": "Commit SHA (required)"
+            },
+            "include_files": {
+                "type": "boolean",
+                "description": "Include list of files changed (default: true)",
+                "default": True
+            },
+            "include_patches": {
+                "type": "boolean",
+                "description": "Include each file's diff; when false, files carry a patch_url instead (default: true)",
+                "default": True
+            },
+            "max_patch_length": {
+                "type": "integer",
+                "description": "Truncate each file's diff to this many characters; truncated files carry patch_truncated and a patch_url (default: 65536)",
+                "default": 65536,
+                "minimum": 1
+            }
+        },
+        "required": ["repository", "sha"]
+    }
 
+    @github_api_errors(_ERROR_BY_STATUS)
     async def execute(self, input_data: dict[str, Any]) -> ToolResult:
         """Get commit details."""
         # Check authentication
@@ -60,6 +69,8 @@ class GetCommitTool(GitHubBaseTool):
         repository = input_data.get("repository")
         sha = input_data.get("sha")
         include_files = input_data.get("include_files", True)
+        include_patches = input_data.get("include_patches", True)
+        max_patch_length = input_data.get("max_patch_length", 65536)
 
         if not repository or not sha:
             return ToolResult(
@@ -70,115 +81,102 @@ class GetCommitTool(GitHubBaseTool):
                 }
             )
 
-        try:
-            repo = self.manager.get_repository(repository)
-            commit = repo.get_commit(sha)
-
-            commit_data = {
-                "sha": commit.sha,
-                "message": commit.commit.message,
-                "author": {
-                    "name": commit.commit.author.name if commit.commit.author else None,
-                    "email": commit.commit.author.email if commit.commit.author else None,
-                    "date": commit.commit.author.date.isoformat() if commit.commit.author and commit.commit.author.date else None,
-                    "username": commit.author.login if commit.author else None,
-                    "avatar_url": commit.author.avatar_url if commit.author else None,
-                },
-                "committer": {
-                    "name": commit.commit.committer.name if commit.commit.committer else None,
-                    "email": commit.commit.committer.email if commit.commit.committer else None,
-                    "date": commit.commit.committer.date.isoformat() if commit.commit.committer and commit.commit.committer.date else None,
-                    "username": commit.committer.login if commit.committer else None,
-                    "avatar_url": commit.committer.avatar_url if commit.committer else None,
-                },
-                "url": commit.html_url,
-                "comment_count": commit.commit.comment_count if hasattr(commit.commit, 'comment_count') else 0,
-                "stats": {
-                    "additions": commit.stats.additions,
-                    "deletions": commit.stats.deletions,
-                    "total": commit.stats.total,
-                },
-                "parents": [{"sha": parent.sha, "url": parent.html_url} for parent in commit.parents],
-            }
-
-            # Include files changed if requested
-            if include_files:
-                files = []
-                for file in commit.files:
-                    file_data = {
-                        "filename": file.filename,
-                        "status": file.status,
-                        "additions": file.additions,
-                        "deletions": file.deletions,
-                        "changes": file.changes,
-                    }
-                    # Include patch if available and not too large
-                    if hasattr(file, 'patch') and file.patch:
-                        file_data["patch"] = file.patch
-                    files.append(file_data)
-                commit_data["files"] = files
-
-            # Get commit comments if any
-            try:
-                comments = []
-                for comment in commit.get_comments():
-                    comments.append({
-                        "id": comment.id,
-                        "user": comment.user.login if comment.user else None,
-                        "body": comment.body,
-                        "path": comment.path if hasattr(comment, 'path') else None,
-                        "position": comment.position if hasattr(comment, 'position') else None,
-                        "line": comment.line if hasattr(comment, 'line') else None,
-                        "created_at": comment.created_at.isoformat() if comment.created_at else None,
-                    })
-                commit_data["comments"] = comments
-            except Exception:
-                commit_data["comments"] = []
+        repo = await self._run(self.manager.get_repository, repository)
+        commit = await self._run(self.manager.get_commit, repo, sha)
+
+        git_commit = commit.commit
+        git_author = git_commit.author
+        git_committer = git_commit.committer
+        author = commit.author
+        committer = commit.committer
+        stats = commit.stats
+        commit_data = {
+            "sha": commit.sha,
+            "message": git_commit.message,
+            "author": {
+                "name": git_author.name if git_author else None,
+                "email": git_author.email if git_author else None,
+                "date": _iso(git_author.date) if git_author else None,
+                "username": author.login if author else None,
+                "avatar_url": author.avatar_url if author else None,
+            },
+            "committer": {
+                "name": git_committer.name if git_committer else None,
+                "email": git_committer.email if git_committer else None,
+                "date": _iso(git_committer.date) if git_committer else None,
+                "username": committer.login if committer else None,
+                "avatar_url": committer.avatar_url if committer else None,
+            },
+            "url": commit.html_url,
+            "comment_count": getattr(git_commit, 'comment_count', 0),
+            "stats": {
+                "additions": stats.additions,
+                "deletions": stats.deletions,
+                "total": stats.total,
+            },
+            "parents": [{"sha": parent.sha, "url": parent.html_url} for parent in commit.parents],
+        }
 
-            return ToolResult(
-                success=True,
-                output={
-                    "repository": repository,
-                    "commit": commit_data,
-                }
+        # Later file pages and the comments are separate requests, so
+        # fetch them together
+        comments_lookup = self._get_comments(commit)
+        if include_files:
+            files, comments = await asyncio.gather(
+                self._run(list, commit.files), comments_lookup
             )
-
-        except GithubException as e:
-            if e.status == 404:
-                return ToolResult(
-                    success=False,
-                    error={
-                        "message": f"Commit '{sha}' not found in repository '{repository}'",
-                        "code": "COMMIT_NOT_FOUND"
-                    }
-                )
-            elif e.status == 422:
-                return ToolResult(
-                    success=False,
-                    error={
-                        "message": f"Invalid commit SHA: {sha}",
-                        "code": "INVALID_SHA"
-                    }
-                )
-            return ToolResult(
-                success=False,
-                error={
-                    "message": f"GitHub API error: {str(e)}",
-                    "code": "GITHUB_API_ERROR"
+        else:
+            comments = await comments_lookup
+
+        # Include files changed if requested
+        if include_files:
+            file_list = []
+            for file in files:
+                file_data = {
+                    "filename": file.filename,
+                    "status": file.status,
+                    "additions": file.additions,
+                    "deletions": file.deletions,
+                    "changes": file.changes,
                 }
-            )
-
-        except RepositoryNotFoundError as e:
-            return ToolResult(success=False, error=e.to_dict())
-
-        except RateLimitError as e:
-            return ToolResult(success=False, error=e.to_dict())
+                # Include patch if available, cut to max_patch_length; a
+                # link to the diff stands in for what was left out
+                patch = getattr(file, 'patch', None)
+                if patch:
+                    if not include_patches:
+                        file_data["patch_url"] = _patch_url(commit.html_url, file.filename)
+                    elif len(patch) > max_patch_length:
+                        file_data["patch"] = patch[:max_patch_length]
+                        file_data["patch_truncated"] = True
+                        file_data["patch_url"] = _patch_url(commit.html_url, file.filename)
+                    else:
+                        file_data["patch"] = patch
+                file_list.append(file_data)
+            commit_data["files"] = file_list
+
+        commit_data["comments"] = [
+            {
+                "id": comment.id,
+                "user": comment.user.login if comment.user else None,
+                "body": comment.body,
+                "path": getattr(comment, 'path', None),
+                "position": getattr(comment, 'position', None),
+                "line": getattr(comment, 'line', None),
+                "created_at": _iso(comment.created_at),
+            }
+            for comment in comments
+        ]
+
+        return ToolResult(
+            success=True,
+            output={
+                "repository": repository,
+                "commit": commit_data,
+            }
+        )
 
-        except Exception as e:
-            return ToolResult(
-                success=False,
-                error={
-                    "message": f"Unexpected error: {str(e)}",
-                    "code": "UNEXPECTED_ERROR"
-                }
-            )
+    async def _get_comments(self, commit) -> list:
+        """Fetch a commit's comments; comments are optional, so failures give none."""
+        try:
+            return await self._collect_all(commit.get_comments())
+        except Exception:
+            return []
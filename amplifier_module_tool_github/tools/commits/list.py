@@ -1,74 +1,71 @@
 """List commits in a repository."""
 
+import asyncio
+from datetime import datetime
 from typing import Any
-from ..base import GitHubBaseTool, ToolResult
-from ...exceptions import (
-    RepositoryNotFoundError,
-    RateLimitError,
-    GitHubError,
-)
-
-try:
-    from github.GithubException import GithubException
-except ImportError:
-    GithubException = Exception
+from ..base import GitHubBaseTool, ToolResult, github_api_errors, _iso
 
 
 class ListCommitsTool(GitHubBaseTool):
     """Tool to list commits in a GitHub repository."""
 
-    @property
-    def name(self) -> str:
-        return "github_list_commits"
-
-    @property
-    def description(self) -> str:
-        return (
-            "List commits in a GitHub repository. Returns commit information including SHA, "
-            "message, author, date, and stats. Supports filtering by author, path, date range, "
-            "and branch/ref."
-        )
-
-    @property
-    def input_schema(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "repository": {
-                    "type": "string",
-                    "description": "[Required] Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode'). This is a repository-specific operation."
-                },
-                "sha": {
-                    "type": "string",
-                    "description": "Branch name, tag, or commit SHA to start listing from (default: default branch)"
-                },
-                "path": {
-                    "type": "string",
-                    "description": "Only show commits that affected this file path"
-                },
-                "author": {
-                    "type": "string",
-                    "description": "GitHub username or email to filter by author"
-                },
-                "since": {
-                    "type": "string",
-                    "description": "Only commits after this date (ISO 8601 format: YYYY-MM-DDTHH:MM:SSZ)"
-                },
-                "until": {
-                    "type": "string",
-                    "description": "Only commits before this date (ISO 8601 format: YYYY-MM-DDTHH:MM:SSZ)"
-                },
-                "limit": {
-                    "type": "integer",
-                    "description": "Maximum number of commits to return (default: 30, max: 100)",
-                    "default": 30,
-                    "minimum": 1,
-                    "maximum": 100
-                }
+    # GitHub API error status -> (error code, message template)
+    _ERROR_BY_STATUS = {
+        404: ("NOT_FOUND", "Reference or path not found in repository '{repository}'"),
+    }
+
+    name = "github_list_commits"
+
+    description = (
+        "List commits in a GitHub repository. Returns commit information including SHA, "
+        "message, author, date, and optionally stats. Supports filtering by author, path, "
+        "date range, and branch/ref."
+    )
+
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "repository": {
+                "type": "string",
+                "description": "[Required] Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode'). This is a repository-specific operation."
             },
-            "required": ["repository"]
-        }
-
+            "sha": {
+                "type": "string",
+                "description": "Branch name, tag, or commit SHA to start listing from (default: default branch)"
+            },
+            "path": {
+                "type": "string",
+                "description": "Only show commits that affected this file path"
+            },
+            "author": {
+                "type": "string",
+                "description": "GitHub username or email to filter by author"
+            },
+            "since": {
+                "type": "string",
+                "description": "Only commits after this date (ISO 8601 format: YYYY-MM-DDTHH:MM:SSZ)"
+            },
+            "until": {
+                "type": "string",
+                "description": "Only commits before this date (ISO 8601 format: YYYY-MM-DDTHH:MM:SSZ)"
+            },
+            "include_stats": {
+                "type": "boolean",
+                "description": "Include additions/deletions for each commit; costs one extra request per commit (default: false)",
+                "default": False
+            },
+            "limit": {
+                "type": "integer",
+                "description": "Maximum number of commits to return (default: 30, max: 100)",
+                "default": 30,
+                "minimum": 1,
+                "maximum": 100
+            }
+        },
+        "required": ["repository"]
+    }
+
+    @github_api_errors(_ERROR_BY_STATUS)
     async def execute(self, input_data: dict[str, Any]) -> ToolResult:
         """List commits in a repository."""
         # Check authentication
@@ -83,6 +80,7 @@ class ListCommitsTool(GitHubBaseTool):
         since = input_data.get("since")
         until = input_data.get("until")
         limit = input_data.get("limit", 30)
+        include_stats = input_data.get("include_stats", False)
 
         if not repository:
             return ToolResult(
@@ -90,101 +88,13 @@ class ListCommitsTool(GitHubBaseTool):
                 error={"message": "repository parameter is required", "code": "MISSING_PARAMETER"}
             )
 
+        # Build kwargs for get_commits; fromisoformat reads the "Z" suffix itself
+        kwargs = {}
         try:
-            repo = self.manager.get_repository(repository)
-
-            # Build kwargs for get_commits
-            kwargs = {}
-            if sha:
-                kwargs["sha"] = sha
-            if path:
-                kwargs["path"] = path
-            if author:
-                kwargs["author"] = author
             if since:
-                from datetime import datetime
-                kwargs["since"] = datetime.fromisoformat(since.replace('Z', '+00:00'))
+                kwargs["since"] = datetime.fromisoformat(since)
             if until:
-                from datetime import datetime
-                kwargs["until"] = datetime.fromisoformat(until.replace('Z', '+00:00'))
-
-            commits = repo.get_commits(**kwargs)
-
-            # Collect commit data
-            commit_list = []
-            count = 0
-            for commit in commits:
-                if count >= limit:
-                    break
-
-                commit_data = {
-                    "sha": commit.sha,
-                    "message": commit.commit.message,
-                    "author": {
-                        "name": commit.commit.author.name if commit.commit.author else None,
-                        "email": commit.commit.author.email if commit.commit.author else None,
-                        "date": commit.commit.author.date.isoformat() if commit.commit.author and commit.commit.author.date else None,
-                        "username": commit.author.login if commit.author else None,
-                    },
-                    "committer": {
-                        "name": commit.commit.committer.name if commit.commit.committer else None,
-                        "email": commit.commit.committer.email if commit.commit.committer else None,
-                        "date": commit.commit.committer.date.isoformat() if commit.commit.committer and commit.commit.committer.date else None,
-                        "username": commit.committer.login if commit.committer else None,
-                    },
-                    "url": commit.html_url,
-                    "comment_count": commit.commit.comment_count if hasattr(commit.commit, 'comment_count') else 0,
-                }
-
-                # Add stats if available
-                try:
-                    commit_data["stats"] = {
-                        "additions": commit.stats.additions,
-                        "deletions": commit.stats.deletions,
-                        "total": commit.stats.total,
-                    }
-                except Exception:
-                    pass
-
-                # Add parent SHAs
-                commit_data["parents"] = [parent.sha for parent in commit.parents]
-
-                commit_list.append(commit_data)
-                count += 1
-
-            return ToolResult(
-                success=True,
-                output={
-                    "repository": repository,
-                    "sha": sha or repo.default_branch,
-                    "count": len(commit_list),
-                    "commits": commit_list,
-                }
-            )
-
-        except RepositoryNotFoundError as e:
-            return ToolResult(success=False, error=e.to_dict())
-
-        except RateLimitError as e:
-            return ToolResult(success=False, error=e.to_dict())
-
-        except GithubException as e:
-            if e.status == 404:
-                return ToolResult(
-                    success=False,
-                    error={
-                        "message": f"Reference or path not found in repository '{repository}'",
-                        "code": "NOT_FOUND"
-                    }
-                )
-            return ToolResult(
-                success=False,
-                error={
-                    "message": f"GitHub API error: {str(e)}",
-                    "code": "GITHUB_API_ERROR"
-                }
-            )
-
+                kwargs["until"] = datetime.fromisoformat(until)
         except ValueError as e:
             return ToolResult(
                 success=False,
@@ -194,11 +104,74 @@ class ListCommitsTool(GitHubBaseTool):
                 }
             )
 
-        except Exception as e:
-            return ToolResult(
-                success=False,
-                error={
-                    "message": f"Unexpected error: {str(e)}",
-                    "code": "UNEXPECTED_ERROR"
-                }
+        if sha:
+            kwargs["sha"] = sha
+        if path:
+            kwargs["path"] = path
+        if author:
+            kwargs["author"] = author
+
+        repo = await self._run(self.manager.get_repository, repository)
+        commits = await self._collect(repo.get_commits(**kwargs), limit)
+        commit_list = [self._commit_data(commit) for commit in commits]
+
+        # The list endpoint leaves stats out, so each commit's stats cost
+        # a request; fetch them together
+        if include_stats:
+            stats = await asyncio.gather(
+                *(self._run(self._commit_stats, commit) for commit in commits)
             )
+            for commit_data, commit_stats in zip(commit_list, stats):
+                if commit_stats is not None:
+                    commit_data["stats"] = commit_stats
+
+        return ToolResult(
+            success=True,
+            output={
+                "repository": repository,
+                "sha": sha or repo.default_branch,
+                "count": len(commit_list),
+                "commits": commit_list,
+            }
+        )
+
+    @staticmethod
+    def _commit_data(commit) -> dict[str, Any]:
+        """Build the output entry for one commit."""
+        git_commit = commit.commit
+        git_author = git_commit.author
+        git_committer = git_commit.committer
+        author = commit.author
+        committer = commit.committer
+        return {
+            "sha": commit.sha,
+            "message": git_commit.message,
+            "author": {
+                "name": git_author.name if git_author else None,
+                "email": git_author.email if git_author else None,
+                "date": _iso(git_author.date) if git_author else None,
+                "username": author.login if author else None,
+            },
+            "committer": {
+                "name": git_committer.name if git_committer else None,
+                "email": git_committer.email if git_committer else None,
+                "date": _iso(git_committer.date) if git_committer else None,
+                "username": committer.login if committer else None,
+            },
+            "url": commit.html_url,
+            "comment_count": getattr(git_commit, 'comment_count', 0),
+            "parents": [parent.sha for parent in commit.parents],
+        }
+
+    @staticmethod
+    def _commit_stats(commit) -> dict[str, Any] | None:
+        """Read one commit's stats, or None if they are unavailable."""
+        try:
+            stats = commit.stats
+            return {
+                "additions": stats.additions,
+                "deletions": stats.deletions,
+                "total": stats.total,
+            }
+        except Exception:
+            return None
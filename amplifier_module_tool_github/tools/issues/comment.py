@@ -5,53 +5,41 @@ from ..base import GitHubBaseTool, ToolResult
 from ...exceptions import (
     RepositoryNotFoundError,
     IssueNotFoundError,
-    RateLimitError,
     PermissionError,
     ValidationError,
     GitHubError,
 )
-
-try:
-    from github.GithubException import GithubException, UnknownObjectException
-except ImportError:
-    GithubException = Exception
-    UnknownObjectException = Exception
+from ..._github_compat import GithubException, UnknownObjectException
 
 
 class CommentIssueTool(GitHubBaseTool):
     """Tool to add a comment to an issue."""
 
-    @property
-    def name(self) -> str:
-        return "github_comment_issue"
-
-    @property
-    def description(self) -> str:
-        return (
-            "Add a comment to a GitHub issue. Requires write access to the repository. "
-            "The comment body supports Markdown formatting."
-        )
-
-    @property
-    def input_schema(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "repository": {
-                    "type": "string",
-                    "description": "Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode')"
-                },
-                "issue_number": {
-                    "type": "integer",
-                    "description": "Issue number"
-                },
-                "body": {
-                    "type": "string",
-                    "description": "Comment body/text (supports Markdown)"
-                }
+    name = "github_comment_issue"
+
+    description = (
+        "Add a comment to a GitHub issue. Requires write access to the repository. "
+        "The comment body supports Markdown formatting."
+    )
+
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "repository": {
+                "type": "string",
+                "description": "Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode')"
+            },
+            "issue_number": {
+                "type": "integer",
+                "description": "Issue number"
             },
-            "required": ["repository", "issue_number", "body"]
-        }
+            "body": {
+                "type": "string",
+                "description": "Comment body/text (supports Markdown)"
+            }
+        },
+        "required": ["repository", "issue_number", "body"]
+    }
 
     async def execute(self, input_data: dict[str, Any]) -> ToolResult:
         """Add a comment to an issue."""
@@ -80,8 +68,8 @@ class CommentIssueTool(GitHubBaseTool):
             )
 
         try:
-            repo = self.manager.get_repository(repository)
-            issue = repo.get_issue(number=issue_number)
+            repo = await self._run(self.manager.get_repository, repository)
+            issue = await self._run(self.manager.get_issue, repo, issue_number)
 
             # Check if it's actually a pull request
             if issue.pull_request:
@@ -94,7 +82,7 @@ class CommentIssueTool(GitHubBaseTool):
                 )
 
             # Add the comment
-            comment = issue.create_comment(body=body)
+            comment = await self._run(issue.create_comment, body=body)
 
             return ToolResult(
                 success=True,
@@ -121,7 +109,7 @@ class CommentIssueTool(GitHubBaseTool):
         except RepositoryNotFoundError as e:
             return ToolResult(success=False, error=e.to_dict())
 
-        except RateLimitError as e:
+        except GitHubError as e:
             return ToolResult(success=False, error=e.to_dict())
 
         except GithubException as e:
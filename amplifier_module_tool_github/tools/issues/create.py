@@ -4,66 +4,55 @@ from typing import Any
 from ..base import GitHubBaseTool, ToolResult
 from ...exceptions import (
     RepositoryNotFoundError,
-    RateLimitError,
     PermissionError,
     ValidationError,
     GitHubError,
 )
-
-try:
-    from github.GithubException import GithubException
-except ImportError:
-    GithubException = Exception
+from ..._github_compat import GithubException
 
 
 class CreateIssueTool(GitHubBaseTool):
     """Tool to create a new issue in a GitHub repository."""
 
-    @property
-    def name(self) -> str:
-        return "github_create_issue"
-
-    @property
-    def description(self) -> str:
-        return (
-            "Create a new issue in a GitHub repository. Requires write access to the repository. "
-            "Can set title, body, labels, assignees, and milestone."
-        )
-
-    @property
-    def input_schema(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "repository": {
-                    "type": "string",
-                    "description": "Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode')"
-                },
-                "title": {
-                    "type": "string",
-                    "description": "Issue title (required)"
-                },
-                "body": {
-                    "type": "string",
-                    "description": "Issue body/description (supports Markdown)"
-                },
-                "labels": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Labels to add to the issue"
-                },
-                "assignees": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Usernames to assign to the issue"
-                },
-                "milestone": {
-                    "type": "integer",
-                    "description": "Milestone number to associate with the issue"
-                }
+    name = "github_create_issue"
+
+    description = (
+        "Create a new issue in a GitHub repository. Requires write access to the repository. "
+        "Can set title, body, labels, assignees, and milestone."
+    )
+
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "repository": {
+                "type": "string",
+                "description": "Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode')"
+            },
+            "title": {
+                "type": "string",
+                "description": "Issue title (required)"
+            },
+            "body": {
+                "type": "string",
+                "description": "Issue body/description (supports Markdown)"
+            },
+            "labels": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Labels to add to the issue"
+            },
+            "assignees": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Usernames to assign to the issue"
             },
-            "required": ["repository", "title"]
-        }
+            "milestone": {
+                "type": "integer",
+                "description": "Milestone number to associate with the issue"
+            }
+        },
+        "required": ["repository", "title"]
+    }
 
     async def execute(self, input_data: dict[str, Any]) -> ToolResult:
         """Create a new issue."""
@@ -95,13 +84,13 @@ class CreateIssueTool(GitHubBaseTool):
             )
 
         try:
-            repo = self.manager.get_repository(repository)
+            repo = await self._run(self.manager.get_repository, repository)
 
             # Get milestone object if specified
             milestone = None
             if milestone_number is not None:
                 try:
-                    milestone = repo.get_milestone(number=milestone_number)
+                    milestone = await self._run(repo.get_milestone, number=milestone_number)
                 except Exception:
                     return ToolResult(
                         success=False,
@@ -112,7 +101,8 @@ class CreateIssueTool(GitHubBaseTool):
                     )
 
             # Create the issue
-            issue = repo.create_issue(
+            issue = await self._run(
+                repo.create_issue,
                 title=title,
                 body=body or "",
                 labels=labels if labels else None,
@@ -138,7 +128,7 @@ class CreateIssueTool(GitHubBaseTool):
         except RepositoryNotFoundError as e:
             return ToolResult(success=False, error=e.to_dict())
 
-        except RateLimitError as e:
+        except GitHubError as e:
             return ToolResult(success=False, error=e.to_dict())
 
         except GithubException as e:
@@ -1,64 +1,53 @@
 """Get details of a specific issue."""
 
+import asyncio
 from typing import Any
 from ..base import GitHubBaseTool, ToolResult
 from ...exceptions import (
     RepositoryNotFoundError,
     IssueNotFoundError,
-    RateLimitError,
     GitHubError,
 )
-
-try:
-    from github.GithubException import GithubException, UnknownObjectException
-except ImportError:
-    GithubException = Exception
-    UnknownObjectException = Exception
+from ..._github_compat import GithubException, UnknownObjectException
 
 
 class GetIssueTool(GitHubBaseTool):
     """Tool to get details of a specific issue."""
 
-    @property
-    def name(self) -> str:
-        return "github_get_issue"
-
-    @property
-    def description(self) -> str:
-        return (
-            "Get detailed information about a specific GitHub issue including title, "
-            "body, state, labels, assignees, comments count, and metadata. "
-            "Useful for examining individual issues in detail."
-        )
-
-    @property
-    def input_schema(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "repository": {
-                    "type": "string",
-                    "description": "Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode')"
-                },
-                "issue_number": {
-                    "type": "integer",
-                    "description": "Issue number"
-                },
-                "include_comments": {
-                    "type": "boolean",
-                    "description": "Include issue comments in the response (default: false)",
-                    "default": False
-                },
-                "comments_limit": {
-                    "type": "integer",
-                    "description": "Maximum number of comments to return if include_comments is true (default: 10)",
-                    "default": 10,
-                    "minimum": 1,
-                    "maximum": 100
-                }
+    name = "github_get_issue"
+
+    description = (
+        "Get detailed information about a specific GitHub issue including title, "
+        "body, state, labels, assignees, comments count, and metadata. "
+        "Useful for examining individual issues in detail."
+    )
+
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "repository": {
+                "type": "string",
+                "description": "Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode')"
             },
-            "required": ["repository", "issue_number"]
-        }
+            "issue_number": {
+                "type": "integer",
+                "description": "Issue number"
+            },
+            "include_comments": {
+                "type": "boolean",
+                "description": "Include issue comments in the response (default: false)",
+                "default": False
+            },
+            "comments_limit": {
+                "type": "integer",
+                "description": "Maximum number of comments to return if include_comments is true (default: 10)",
+                "default": 10,
+                "minimum": 1,
+                "maximum": 100
+            }
+        },
+        "required": ["repository", "issue_number"]
+    }
 
     async def execute(self, input_data: dict[str, Any]) -> ToolResult:
         """Get issue details."""
@@ -82,8 +71,16 @@ class GetIssueTool(GitHubBaseTool):
             )
 
         try:
-            repo = self.manager.get_repository(repository)
-            issue = repo.get_issue(number=issue_number)
+            repo = await self._run(self.manager.get_repository, repository)
+            lookup = self._run(self.manager.get_issue, repo, issue_number)
+            if include_comments:
+                # The comments listing doesn't depend on the issue, so fetch both at once
+                issue, comments = await asyncio.gather(
+                    lookup,
+                    self._collect(self.manager.get_issue_comments(repo, issue_number), comments_limit),
+                )
+            else:
+                issue = await lookup
 
             # Check if it's actually a pull request
             if issue.pull_request:
@@ -132,13 +129,8 @@ class GetIssueTool(GitHubBaseTool):
 
             # Include comments if requested
             if include_comments and issue.comments > 0:
-                comments = issue.get_comments()
-                comment_list = []
-                count = 0
-                for comment in comments:
-                    if count >= comments_limit:
-                        break
-                    comment_data = {
+                issue_data["comments"] = [
+                    {
                         "id": comment.id,
                         "author": comment.user.login if comment.user else None,
                         "body": comment.body,
@@ -146,9 +138,8 @@ class GetIssueTool(GitHubBaseTool):
                         "updated_at": comment.updated_at.isoformat() if comment.updated_at else None,
                         "url": comment.html_url,
                     }
-                    comment_list.append(comment_data)
-                    count += 1
-                issue_data["comments"] = comment_list
+                    for comment in comments
+                ]
 
             return ToolResult(
                 success=True,
@@ -167,7 +158,7 @@ class GetIssueTool(GitHubBaseTool):
         except RepositoryNotFoundError as e:
             return ToolResult(success=False, error=e.to_dict())
 
-        except RateLimitError as e:
+        except GitHubError as e:
             return ToolResult(success=False, error=e.to_dict())
 
         except GithubException as e:
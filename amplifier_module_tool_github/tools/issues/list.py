@@ -4,89 +4,90 @@ from typing import Any
 from ..base import GitHubBaseTool, ToolResult
 from ...exceptions import (
     RepositoryNotFoundError,
-    RateLimitError,
     GitHubError,
 )
+from ..._github_compat import GithubException
 
-try:
-    from github.GithubException import GithubException
-except ImportError:
-    GithubException = Exception
+
+def _is_issue(issue) -> bool:
+    """
+    Tell issues from pull requests in an issue listing.
+
+    Pull requests in the listing carry a ``pull_request`` key but real issues
+    don't, so reading ``issue.pull_request`` on an issue makes PyGithub fetch
+    it in full to look for the key. The item's own web URL ends in
+    ``/pull/<number>`` only for a pull request, whatever the repo is called.
+    """
+    return not issue.html_url.endswith(f"/pull/{issue.number}")
 
 
 class ListIssuesTool(GitHubBaseTool):
     """Tool to list issues in a GitHub repository."""
 
-    @property
-    def name(self) -> str:
-        return "github_list_issues"
-
-    @property
-    def description(self) -> str:
-        return (
-            "List issues in a GitHub repository. Returns a list of issues with their "
-            "basic information including number, title, state, author, labels, and dates. "
-            "Supports filtering by state (open/closed/all), labels, assignee, and more."
-        )
-
-    @property
-    def input_schema(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "repository": {
-                    "type": "string",
-                    "description": (
-                        "Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode'). "
-                        "Optional if repositories are configured - will search across all configured repositories. "
-                        "If provided, searches only this specific repository."
-                    )
-                },
-                "state": {
-                    "type": "string",
-                    "enum": ["open", "closed", "all"],
-                    "description": "Filter by issue state (default: open)",
-                    "default": "open"
-                },
-                "labels": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Filter by labels (must have all specified labels)"
-                },
-                "assignee": {
-                    "type": "string",
-                    "description": "Filter by assignee username (use 'none' for unassigned, '*' for any assigned)"
-                },
-                "creator": {
-                    "type": "string",
-                    "description": "Filter by issue creator username"
-                },
-                "mentioned": {
-                    "type": "string",
-                    "description": "Filter by username mentioned in the issue"
-                },
-                "sort": {
-                    "type": "string",
-                    "enum": ["created", "updated", "comments"],
-                    "description": "Sort field (default: created)",
-                    "default": "created"
-                },
-                "direction": {
-                    "type": "string",
-                    "enum": ["asc", "desc"],
-                    "description": "Sort direction (default: desc)",
-                    "default": "desc"
-                },
-                "limit": {
-                    "type": "integer",
-                    "description": "Maximum number of issues to return (default: 30, max: 100)",
-                    "default": 30,
-                    "minimum": 1,
-                    "maximum": 100
-                }
+    name = "github_list_issues"
+
+    description = (
+        "List issues in a GitHub repository. Returns a list of issues with their "
+        "basic information including number, title, state, author, labels, and dates. "
+        "Supports filtering by state (open/closed/all), labels, assignee, and more."
+    )
+
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "repository": {
+                "type": "string",
+                "description": (
+                    "Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode'). "
+                    "Optional if repositories are configured - will search across all configured repositories. "
+                    "If provided, searches only this specific repository."
+                )
+            },
+            "state": {
+                "type": "string",
+                "enum": ["open", "closed", "all"],
+                "description": "Filter by issue state (default: open)",
+                "default": "open"
+            },
+            "labels": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Filter by labels (must have all specified labels)"
+            },
+            "assignee": {
+                "type": "string",
+                "description": "Filter by assignee username (use 'none' for unassigned, '*' for any assigned)"
             },
-            "required": []
-        }
+            "creator": {
+                "type": "string",
+                "description": "Filter by issue creator username"
+            },
+            "mentioned": {
+                "type": "string",
+                "description": "Filter by username mentioned in the issue"
+            },
+            "sort": {
+                "type": "string",
+                "enum": ["created", "updated", "comments"],
+                "description": "Sort field (default: created)",
+                "default": "created"
+            },
+            "direction": {
+                "type": "string",
+                "enum": ["asc", "desc"],
+                "description": "Sort direction (default: desc)",
+                "default": "desc"
+            },
+            "limit": {
+                "type": "integer",
+                "description": "Maximum number of issues to return (default: 30, max: 100)",
+                "default": 30,
+                "minimum": 1,
+                "maximum": 100
+            }
+        },
+        "required": []
+    }
 
     async def execute(self, input_data: dict[str, Any]) -> ToolResult:
         """List issues in a repository or across all configured repositories."""
@@ -135,7 +136,7 @@ class ListIssuesTool(GitHubBaseTool):
             # Query each repository
             for repo_name in repositories_to_query:
                 try:
-                    repo = self.manager.get_repository(repo_name)
+                    repo = await self._run(self.manager.get_repository, repo_name)
 
                     # Get issues with filters
                     issues = repo.get_issues(
@@ -148,15 +149,11 @@ class ListIssuesTool(GitHubBaseTool):
                         direction=direction,
                     )
 
+                    # Skip pull requests (GitHub's API returns PRs as issues)
+                    issues = await self._collect(issues, limit - len(all_issues), _is_issue)
+
                     # Collect issue data
                     for issue in issues:
-                        if len(all_issues) >= limit:
-                            break
-                        
-                        # Skip pull requests (GitHub's API returns PRs as issues)
-                        if issue.pull_request:
-                            continue
-
                         issue_data = {
                             "repository": repo_name,
                             "number": issue.number,
@@ -198,7 +195,7 @@ class ListIssuesTool(GitHubBaseTool):
         except RepositoryNotFoundError as e:
             return ToolResult(success=False, error=e.to_dict())
 
-        except RateLimitError as e:
+        except GitHubError as e:
             return ToolResult(success=False, error=e.to_dict())
 
         except GithubException as e:
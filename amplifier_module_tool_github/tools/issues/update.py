@@ -5,76 +5,64 @@ from ..base import GitHubBaseTool, ToolResult
 from ...exceptions import (
     RepositoryNotFoundError,
     IssueNotFoundError,
-    RateLimitError,
     PermissionError,
     GitHubError,
 )
-
-try:
-    from github.GithubException import GithubException, UnknownObjectException
-except ImportError:
-    GithubException = Exception
-    UnknownObjectException = Exception
+from ..._github_compat import GithubException, UnknownObjectException
 
 
 class UpdateIssueTool(GitHubBaseTool):
     """Tool to update an existing issue."""
 
-    @property
-    def name(self) -> str:
-        return "github_update_issue"
-
-    @property
-    def description(self) -> str:
-        return (
-            "Update an existing GitHub issue. Requires write access to the repository. "
-            "Can update title, body, state, labels, assignees, and milestone. "
-            "Only include fields you want to change."
-        )
-
-    @property
-    def input_schema(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "repository": {
-                    "type": "string",
-                    "description": "Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode')"
-                },
-                "issue_number": {
-                    "type": "integer",
-                    "description": "Issue number"
-                },
-                "title": {
-                    "type": "string",
-                    "description": "New issue title"
-                },
-                "body": {
-                    "type": "string",
-                    "description": "New issue body/description (supports Markdown)"
-                },
-                "state": {
-                    "type": "string",
-                    "enum": ["open", "closed"],
-                    "description": "New issue state"
-                },
-                "labels": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Labels to set on the issue (replaces existing labels)"
-                },
-                "assignees": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Usernames to assign to the issue (replaces existing assignees)"
-                },
-                "milestone": {
-                    "type": "integer",
-                    "description": "Milestone number to associate with the issue (use 0 to remove milestone)"
-                }
+    name = "github_update_issue"
+
+    description = (
+        "Update an existing GitHub issue. Requires write access to the repository. "
+        "Can update title, body, state, labels, assignees, and milestone. "
+        "Only include fields you want to change."
+    )
+
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "repository": {
+                "type": "string",
+                "description": "Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode')"
+            },
+            "issue_number": {
+                "type": "integer",
+                "description": "Issue number"
+            },
+            "title": {
+                "type": "string",
+                "description": "New issue title"
+            },
+            "body": {
+                "type": "string",
+                "description": "New issue body/description (supports Markdown)"
+            },
+            "state": {
+                "type": "string",
+                "enum": ["open", "closed"],
+                "description": "New issue state"
+            },
+            "labels": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Labels to set on the issue (replaces existing labels)"
+            },
+            "assignees": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Usernames to assign to the issue (replaces existing assignees)"
             },
-            "required": ["repository", "issue_number"]
-        }
+            "milestone": {
+                "type": "integer",
+                "description": "Milestone number to associate with the issue (use 0 to remove milestone)"
+            }
+        },
+        "required": ["repository", "issue_number"]
+    }
 
     async def execute(self, input_data: dict[str, Any]) -> ToolResult:
         """Update an issue."""
@@ -102,8 +90,8 @@ class UpdateIssueTool(GitHubBaseTool):
             )
 
         try:
-            repo = self.manager.get_repository(repository)
-            issue = repo.get_issue(number=issue_number)
+            repo = await self._run(self.manager.get_repository, repository)
+            issue = await self._run(repo.get_issue, number=issue_number)
 
             # Check if it's actually a pull request
             if issue.pull_request:
@@ -139,7 +127,7 @@ class UpdateIssueTool(GitHubBaseTool):
                     edit_params["milestone"] = None
                 else:
                     try:
-                        milestone = repo.get_milestone(number=milestone_number)
+                        milestone = await self._run(repo.get_milestone, number=milestone_number)
                         edit_params["milestone"] = milestone
                     except Exception:
                         return ToolResult(
@@ -151,10 +139,10 @@ class UpdateIssueTool(GitHubBaseTool):
                         )
 
             # Update the issue
-            issue.edit(**edit_params)
+            await self._run(issue.edit, **edit_params)
 
             # Refresh to get updated data
-            issue = repo.get_issue(number=issue_number)
+            issue = await self._run(repo.get_issue, number=issue_number)
 
             return ToolResult(
                 success=True,
@@ -180,7 +168,7 @@ class UpdateIssueTool(GitHubBaseTool):
         except RepositoryNotFoundError as e:
             return ToolResult(success=False, error=e.to_dict())
 
-        except RateLimitError as e:
+        except GitHubError as e:
             return ToolResult(success=False, error=e.to_dict())
 
         except GithubException as e:
@@ -4,90 +4,79 @@ from typing import Any
 from ..base import GitHubBaseTool, ToolResult
 from ...exceptions import (
     RepositoryNotFoundError,
-    RateLimitError,
     PermissionError,
     ValidationError,
     GitHubError,
 )
-
-try:
-    from github.GithubException import GithubException
-except ImportError:
-    GithubException = Exception
+from ..._github_compat import GithubException
 
 
 class CreatePullRequestTool(GitHubBaseTool):
     """Tool to create a new pull request in a GitHub repository."""
 
-    @property
-    def name(self) -> str:
-        return "github_create_pull_request"
-
-    @property
-    def description(self) -> str:
-        return (
-            "Create a new pull request in a GitHub repository. Requires write access. "
-            "Can set title, body, base branch, head branch, reviewers, labels, and draft status."
-        )
-
-    @property
-    def input_schema(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "repository": {
-                    "type": "string",
-                    "description": "Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode')"
-                },
-                "title": {
-                    "type": "string",
-                    "description": "Pull request title (required)"
-                },
-                "head": {
-                    "type": "string",
-                    "description": "The name of the branch where changes are (required)"
-                },
-                "base": {
-                    "type": "string",
-                    "description": "The name of the branch to merge into (required)"
-                },
-                "body": {
-                    "type": "string",
-                    "description": "Pull request body/description (supports Markdown)"
-                },
-                "draft": {
-                    "type": "boolean",
-                    "description": "Create as draft PR (default: false)",
-                    "default": False
-                },
-                "maintainer_can_modify": {
-                    "type": "boolean",
-                    "description": "Allow maintainers to modify the PR (default: true)",
-                    "default": True
-                },
-                "labels": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Labels to add to the PR"
-                },
-                "assignees": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Usernames to assign to the PR"
-                },
-                "reviewers": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Usernames to request reviews from"
-                },
-                "team_reviewers": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Team slugs to request reviews from"
-                }
+    name = "github_create_pull_request"
+
+    description = (
+        "Create a new pull request in a GitHub repository. Requires write access. "
+        "Can set title, body, base branch, head branch, reviewers, labels, and draft status."
+    )
+
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "repository": {
+                "type": "string",
+                "description": "Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode')"
+            },
+            "title": {
+                "type": "string",
+                "description": "Pull request title (required)"
+            },
+            "head": {
+                "type": "string",
+                "description": "The name of the branch where changes are (required)"
+            },
+            "base": {
+                "type": "string",
+                "description": "The name of the branch to merge into (required)"
+            },
+            "body": {
+                "type": "string",
+                "description": "Pull request body/description (supports Markdown)"
+            },
+            "draft": {
+                "type": "boolean",
+                "description": "Create as draft PR (default: false)",
+                "default": False
+            },
+            "maintainer_can_modify": {
+                "type": "boolean",
+                "description": "Allow maintainers to modify the PR (default: true)",
+                "default": True
+            },
+            "labels": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Labels to add to the PR"
+            },
+            "assignees": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Usernames to assign to the PR"
+            },
+            "reviewers": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Usernames to request reviews from"
             },
-            "required": ["repository", "title", "head", "base"]
-        }
+            "team_reviewers": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Team slugs to request reviews from"
+            }
+        },
+        "required": ["repository", "title", "head", "base"]
+    }
 
     async def execute(self, input_data: dict[str, Any]) -> ToolResult:
         """Create a new pull request."""
@@ -184,7 +173,7 @@ class CreatePullRequestTool(GitHubBaseTool):
         except RepositoryNotFoundError as e:
             return ToolResult(success=False, error=e.to_dict())
 
-        except RateLimitError as e:
+        except GitHubError as e:
             return ToolResult(success=False, error=e.to_dict())
 
         except GithubException as e:
@@ -4,61 +4,50 @@ from typing import Any
 from ..base import GitHubBaseTool, ToolResult
 from ...exceptions import (
     RepositoryNotFoundError,
-    RateLimitError,
     GitHubError,
 )
-
-try:
-    from github.GithubException import GithubException
-except ImportError:
-    GithubException = Exception
+from ..._github_compat import GithubException
 
 
 class GetPullRequestTool(GitHubBaseTool):
     """Tool to get detailed information about a pull request."""
 
-    @property
-    def name(self) -> str:
-        return "github_get_pull_request"
-
-    @property
-    def description(self) -> str:
-        return (
-            "Get detailed information about a specific pull request in a GitHub repository. "
-            "Includes PR metadata, files changed, review comments, and status checks."
-        )
-
-    @property
-    def input_schema(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "repository": {
-                    "type": "string",
-                    "description": "Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode')"
-                },
-                "pull_number": {
-                    "type": "integer",
-                    "description": "Pull request number"
-                },
-                "include_files": {
-                    "type": "boolean",
-                    "description": "Include list of files changed (default: true)",
-                    "default": True
-                },
-                "include_reviews": {
-                    "type": "boolean",
-                    "description": "Include review comments (default: true)",
-                    "default": True
-                },
-                "include_commits": {
-                    "type": "boolean",
-                    "description": "Include list of commits (default: false)",
-                    "default": False
-                }
+    name = "github_get_pull_request"
+
+    description = (
+        "Get detailed information about a specific pull request in a GitHub repository. "
+        "Includes PR metadata, files changed, review comments, and status checks."
+    )
+
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "repository": {
+                "type": "string",
+                "description": "Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode')"
+            },
+            "pull_number": {
+                "type": "integer",
+                "description": "Pull request number"
             },
-            "required": ["repository", "pull_number"]
-        }
+            "include_files": {
+                "type": "boolean",
+                "description": "Include list of files changed (default: true)",
+                "default": True
+            },
+            "include_reviews": {
+                "type": "boolean",
+                "description": "Include review comments (default: true)",
+                "default": True
+            },
+            "include_commits": {
+                "type": "boolean",
+                "description": "Include list of commits (default: false)",
+                "default": False
+            }
+        },
+        "required": ["repository", "pull_number"]
+    }
 
     async def execute(self, input_data: dict[str, Any]) -> ToolResult:
         """Get pull request details."""
@@ -133,7 +122,7 @@ class GetPullRequestTool(GitHubBaseTool):
                         "additions": file.additions,
                         "deletions": file.deletions,
                         "changes": file.changes,
-                        "patch": file.patch if hasattr(file, 'patch') else None,
+                        "patch": getattr(file, 'patch', None),
                     })
                 pr_data["files"] = files
 
@@ -159,7 +148,7 @@ class GetPullRequestTool(GitHubBaseTool):
                         "body": comment.body,
                         "path": comment.path,
                         "position": comment.position,
-                        "line": comment.line if hasattr(comment, 'line') else None,
+                        "line": getattr(comment, 'line', None),
                         "created_at": comment.created_at.isoformat() if comment.created_at else None,
                     })
                 pr_data["review_comments_details"] = review_comments
@@ -220,7 +209,7 @@ class GetPullRequestTool(GitHubBaseTool):
         except RepositoryNotFoundError as e:
             return ToolResult(success=False, error=e.to_dict())
 
-        except RateLimitError as e:
+        except GitHubError as e:
             return ToolResult(success=False, error=e.to_dict())
 
         except Exception as e:
@@ -4,81 +4,70 @@ from typing import Any
 from ..base import GitHubBaseTool, ToolResult
 from ...exceptions import (
     RepositoryNotFoundError,
-    RateLimitError,
     GitHubError,
 )
-
-try:
-    from github.GithubException import GithubException
-except ImportError:
-    GithubException = Exception
+from ..._github_compat import GithubException
 
 
 class ListPullRequestsTool(GitHubBaseTool):
     """Tool to list pull requests in a GitHub repository."""
 
-    @property
-    def name(self) -> str:
-        return "github_list_pull_requests"
-
-    @property
-    def description(self) -> str:
-        return (
-            "List pull requests in a GitHub repository. Returns a list of PRs with their "
-            "basic information including number, title, state, author, labels, and dates. "
-            "Supports filtering by state (open/closed/all), labels, and sorting options. "
-            "Includes draft PRs in results."
-        )
-
-    @property
-    def input_schema(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "repository": {
-                    "type": "string",
-                    "description": (
-                        "Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode'). "
-                        "Optional if repositories are configured - will search across all configured repositories. "
-                        "If provided, searches only this specific repository."
-                    )
-                },
-                "state": {
-                    "type": "string",
-                    "enum": ["open", "closed", "all"],
-                    "description": "Filter by PR state (default: open)",
-                    "default": "open"
-                },
-                "head": {
-                    "type": "string",
-                    "description": "Filter by head branch (format: 'user:branch')"
-                },
-                "base": {
-                    "type": "string",
-                    "description": "Filter by base branch"
-                },
-                "sort": {
-                    "type": "string",
-                    "enum": ["created", "updated", "popularity", "long-running"],
-                    "description": "Sort field (default: created)",
-                    "default": "created"
-                },
-                "direction": {
-                    "type": "string",
-                    "enum": ["asc", "desc"],
-                    "description": "Sort direction (default: desc)",
-                    "default": "desc"
-                },
-                "limit": {
-                    "type": "integer",
-                    "description": "Maximum number of PRs to return (default: 30, max: 100)",
-                    "default": 30,
-                    "minimum": 1,
-                    "maximum": 100
-                }
+    name = "github_list_pull_requests"
+
+    description = (
+        "List pull requests in a GitHub repository. Returns a list of PRs with their "
+        "basic information including number, title, state, author, labels, and dates. "
+        "Supports filtering by state (open/closed/all), labels, and sorting options. "
+        "Includes draft PRs in results."
+    )
+
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "repository": {
+                "type": "string",
+                "description": (
+                    "Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode'). "
+                    "Optional if repositories are configured - will search across all configured repositories. "
+                    "If provided, searches only this specific repository."
+                )
+            },
+            "state": {
+                "type": "string",
+                "enum": ["open", "closed", "all"],
+                "description": "Filter by PR state (default: open)",
+                "default": "open"
+            },
+            "head": {
+                "type": "string",
+                "description": "Filter by head branch (format: 'user:branch')"
+            },
+            "base": {
+                "type": "string",
+                "description": "Filter by base branch"
+            },
+            "sort": {
+                "type": "string",
+                "enum": ["created", "updated", "popularity", "long-running"],
+                "description": "Sort field (default: created)",
+                "default": "created"
+            },
+            "direction": {
+                "type": "string",
+                "enum": ["asc", "desc"],
+                "description": "Sort direction (default: desc)",
+                "default": "desc"
             },
-            "required": []
-        }
+            "limit": {
+                "type": "integer",
+                "description": "Maximum number of PRs to return (default: 30, max: 100)",
+                "default": 30,
+                "minimum": 1,
+                "maximum": 100
+            }
+        },
+        "required": []
+    }
 
     async def execute(self, input_data: dict[str, Any]) -> ToolResult:
         """List pull requests in a repository or across all configured repositories."""
@@ -198,7 +187,7 @@ class ListPullRequestsTool(GitHubBaseTool):
         except RepositoryNotFoundError as e:
             return ToolResult(success=False, error=e.to_dict())
 
-        except RateLimitError as e:
+        except GitHubError as e:
             return ToolResult(success=False, error=e.to_dict())
 
         except GithubException as e:
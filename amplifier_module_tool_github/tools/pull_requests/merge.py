@@ -4,71 +4,60 @@ from typing import Any
 from ..base import GitHubBaseTool, ToolResult
 from ...exceptions import (
     RepositoryNotFoundError,
-    RateLimitError,
     PermissionError,
     GitHubError,
 )
-
-try:
-    from github.GithubException import GithubException
-except ImportError:
-    GithubException = Exception
+from ..._github_compat import GithubException
 
 
 class MergePullRequestTool(GitHubBaseTool):
     """Tool to merge a pull request."""
 
-    @property
-    def name(self) -> str:
-        return "github_merge_pull_request"
-
-    @property
-    def description(self) -> str:
-        return (
-            "Merge a pull request in a GitHub repository. Supports different merge strategies: "
-            "merge (standard merge commit), squash (squash and merge), or rebase (rebase and merge). "
-            "Can optionally delete the branch after merging. Requires write access."
-        )
-
-    @property
-    def input_schema(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "repository": {
-                    "type": "string",
-                    "description": "Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode')"
-                },
-                "pull_number": {
-                    "type": "integer",
-                    "description": "Pull request number"
-                },
-                "merge_method": {
-                    "type": "string",
-                    "enum": ["merge", "squash", "rebase"],
-                    "description": "Merge method to use (default: merge)",
-                    "default": "merge"
-                },
-                "commit_title": {
-                    "type": "string",
-                    "description": "Custom commit title for the merge"
-                },
-                "commit_message": {
-                    "type": "string",
-                    "description": "Custom commit message for the merge"
-                },
-                "sha": {
-                    "type": "string",
-                    "description": "SHA that pull request head must match to allow merge"
-                },
-                "delete_branch": {
-                    "type": "boolean",
-                    "description": "Delete the branch after merging (default: false)",
-                    "default": False
-                }
+    name = "github_merge_pull_request"
+
+    description = (
+        "Merge a pull request in a GitHub repository. Supports different merge strategies: "
+        "merge (standard merge commit), squash (squash and merge), or rebase (rebase and merge). "
+        "Can optionally delete the branch after merging. Requires write access."
+    )
+
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "repository": {
+                "type": "string",
+                "description": "Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode')"
+            },
+            "pull_number": {
+                "type": "integer",
+                "description": "Pull request number"
             },
-            "required": ["repository", "pull_number"]
-        }
+            "merge_method": {
+                "type": "string",
+                "enum": ["merge", "squash", "rebase"],
+                "description": "Merge method to use (default: merge)",
+                "default": "merge"
+            },
+            "commit_title": {
+                "type": "string",
+                "description": "Custom commit title for the merge"
+            },
+            "commit_message": {
+                "type": "string",
+                "description": "Custom commit message for the merge"
+            },
+            "sha": {
+                "type": "string",
+                "description": "SHA that pull request head must match to allow merge"
+            },
+            "delete_branch": {
+                "type": "boolean",
+                "description": "Delete the branch after merging (default: false)",
+                "default": False
+            }
+        },
+        "required": ["repository", "pull_number"]
+    }
 
     async def execute(self, input_data: dict[str, Any]) -> ToolResult:
         """Merge a pull request."""
@@ -200,7 +189,7 @@ class MergePullRequestTool(GitHubBaseTool):
         except RepositoryNotFoundError as e:
             return ToolResult(success=False, error=e.to_dict())
 
-        except RateLimitError as e:
+        except GitHubError as e:
             return ToolResult(success=False, error=e.to_dict())
 
         except Exception as e:
@@ -4,88 +4,77 @@ from typing import Any
 from ..base import GitHubBaseTool, ToolResult
 from ...exceptions import (
     RepositoryNotFoundError,
-    RateLimitError,
     PermissionError,
     ValidationError,
     GitHubError,
 )
-
-try:
-    from github.GithubException import GithubException
-except ImportError:
-    GithubException = Exception
+from ..._github_compat import GithubException
 
 
 class ReviewPullRequestTool(GitHubBaseTool):
     """Tool to review a pull request."""
 
-    @property
-    def name(self) -> str:
-        return "github_review_pull_request"
-
-    @property
-    def description(self) -> str:
-        return (
-            "Submit a review for a pull request. Can approve, request changes, or comment. "
-            "Can include inline comments on specific lines of code. Requires write access."
-        )
-
-    @property
-    def input_schema(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "repository": {
-                    "type": "string",
-                    "description": "Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode')"
-                },
-                "pull_number": {
-                    "type": "integer",
-                    "description": "Pull request number"
-                },
-                "event": {
-                    "type": "string",
-                    "enum": ["APPROVE", "REQUEST_CHANGES", "COMMENT"],
-                    "description": "Review action: APPROVE, REQUEST_CHANGES, or COMMENT (required)"
-                },
-                "body": {
-                    "type": "string",
-                    "description": "Review comment body (required for REQUEST_CHANGES and COMMENT)"
-                },
-                "comments": {
-                    "type": "array",
-                    "description": "Inline comments on specific lines of code",
-                    "items": {
-                        "type": "object",
-                        "properties": {
-                            "path": {
-                                "type": "string",
-                                "description": "File path to comment on"
-                            },
-                            "position": {
-                                "type": "integer",
-                                "description": "Position in the diff to comment on (deprecated, use line)"
-                            },
-                            "line": {
-                                "type": "integer",
-                                "description": "Line number in the file to comment on"
-                            },
-                            "side": {
-                                "type": "string",
-                                "enum": ["LEFT", "RIGHT"],
-                                "description": "Side of the diff (LEFT for deletion, RIGHT for addition)"
-                            },
-                            "body": {
-                                "type": "string",
-                                "description": "Comment body"
-                            }
+    name = "github_review_pull_request"
+
+    description = (
+        "Submit a review for a pull request. Can approve, request changes, or comment. "
+        "Can include inline comments on specific lines of code. Requires write access."
+    )
+
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "repository": {
+                "type": "string",
+                "description": "Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode')"
+            },
+            "pull_number": {
+                "type": "integer",
+                "description": "Pull request number"
+            },
+            "event": {
+                "type": "string",
+                "enum": ["APPROVE", "REQUEST_CHANGES", "COMMENT"],
+                "description": "Review action: APPROVE, REQUEST_CHANGES, or COMMENT (required)"
+            },
+            "body": {
+                "type": "string",
+                "description": "Review comment body (required for REQUEST_CHANGES and COMMENT)"
+            },
+            "comments": {
+                "type": "array",
+                "description": "Inline comments on specific lines of code",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "path": {
+                            "type": "string",
+                            "description": "File path to comment on"
                         },
-                        "required": ["path", "body"]
-                    }
+                        "position": {
+                            "type": "integer",
+                            "description": "Position in the diff to comment on (deprecated, use line)"
+                        },
+                        "line": {
+                            "type": "integer",
+                            "description": "Line number in the file to comment on"
+                        },
+                        "side": {
+                            "type": "string",
+                            "enum": ["LEFT", "RIGHT"],
+                            "description": "Side of the diff (LEFT for deletion, RIGHT for addition)"
+                        },
+                        "body": {
+                            "type": "string",
+                            "description": "Comment body"
+                        }
+                    },
+                    "required": ["path", "body"]
                 }
-            },
-            "required": ["repository", "pull_number", "event"]
-        }
+            }
+        },
+        "required": ["repository", "pull_number", "event"]
+    }
 
     async def execute(self, input_data: dict[str, Any]) -> ToolResult:
         """Review a pull request."""
@@ -216,7 +205,7 @@ class ReviewPullRequestTool(GitHubBaseTool):
         except RepositoryNotFoundError as e:
             return ToolResult(success=False, error=e.to_dict())
 
-        except RateLimitError as e:
+        except GitHubError as e:
             return ToolResult(success=False, error=e.to_dict())
 
         except Exception as e:
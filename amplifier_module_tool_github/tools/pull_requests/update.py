@@ -4,90 +4,79 @@ from typing import Any
 from ..base import GitHubBaseTool, ToolResult
 from ...exceptions import (
     RepositoryNotFoundError,
-    RateLimitError,
     PermissionError,
     ValidationError,
     GitHubError,
 )
-
-try:
-    from github.GithubException import GithubException
-except ImportError:
-    GithubException = Exception
+from ..._github_compat import GithubException
 
 
 class UpdatePullRequestTool(GitHubBaseTool):
     """Tool to update an existing pull request."""
 
-    @property
-    def name(self) -> str:
-        return "github_update_pull_request"
-
-    @property
-    def description(self) -> str:
-        return (
-            "Update an existing pull request in a GitHub repository. Can update title, body, "
-            "state (open/closed), base branch, labels, assignees, and reviewers. "
-            "Requires write access to the repository."
-        )
-
-    @property
-    def input_schema(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "repository": {
-                    "type": "string",
-                    "description": "Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode')"
-                },
-                "pull_number": {
-                    "type": "integer",
-                    "description": "Pull request number"
-                },
-                "title": {
-                    "type": "string",
-                    "description": "New title for the PR"
-                },
-                "body": {
-                    "type": "string",
-                    "description": "New body/description for the PR"
-                },
-                "state": {
-                    "type": "string",
-                    "enum": ["open", "closed"],
-                    "description": "Change PR state to open or closed"
-                },
-                "base": {
-                    "type": "string",
-                    "description": "Change the base branch"
-                },
-                "maintainer_can_modify": {
-                    "type": "boolean",
-                    "description": "Allow maintainers to modify the PR"
-                },
-                "labels": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Replace all labels with these (empty array to remove all)"
-                },
-                "assignees": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Replace all assignees with these (empty array to remove all)"
-                },
-                "add_reviewers": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Add reviewers to the PR"
-                },
-                "remove_reviewers": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Remove reviewers from the PR"
-                }
+    name = "github_update_pull_request"
+
+    description = (
+        "Update an existing pull request in a GitHub repository. Can update title, body, "
+        "state (open/closed), base branch, labels, assignees, and reviewers. "
+        "Requires write access to the repository."
+    )
+
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "repository": {
+                "type": "string",
+                "description": "Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode')"
+            },
+            "pull_number": {
+                "type": "integer",
+                "description": "Pull request number"
+            },
+            "title": {
+                "type": "string",
+                "description": "New title for the PR"
+            },
+            "body": {
+                "type": "string",
+                "description": "New body/description for the PR"
+            },
+            "state": {
+                "type": "string",
+                "enum": ["open", "closed"],
+                "description": "Change PR state to open or closed"
+            },
+            "base": {
+                "type": "string",
+                "description": "Change the base branch"
+            },
+            "maintainer_can_modify": {
+                "type": "boolean",
+                "description": "Allow maintainers to modify the PR"
+            },
+            "labels": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Replace all labels with these (empty array to remove all)"
+            },
+            "assignees": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Replace all assignees with these (empty array to remove all)"
+            },
+            "add_reviewers": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Add reviewers to the PR"
             },
-            "required": ["repository", "pull_number"]
-        }
+            "remove_reviewers": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Remove reviewers from the PR"
+            }
+        },
+        "required": ["repository", "pull_number"]
+    }
 
     async def execute(self, input_data: dict[str, Any]) -> ToolResult:
         """Update a pull request."""
@@ -224,7 +213,7 @@ class UpdatePullRequestTool(GitHubBaseTool):
         except RepositoryNotFoundError as e:
             return ToolResult(success=False, error=e.to_dict())
 
-        except RateLimitError as e:
+        except GitHubError as e:
             return ToolResult(success=False, error=e.to_dict())
 
         except Exception as e:
@@ -4,76 +4,65 @@ from typing import Any
 from ..base import GitHubBaseTool, ToolResult
 from ...exceptions import (
     RepositoryNotFoundError,
-    RateLimitError,
     PermissionError,
     ValidationError,
     GitHubError,
 )
-
-try:
-    from github.GithubException import GithubException
-except ImportError:
-    GithubException = Exception
+from ..._github_compat import GithubException
 
 
 class CreateReleaseTool(GitHubBaseTool):
     """Tool to create a new release in a GitHub repository."""
 
-    @property
-    def name(self) -> str:
-        return "github_create_release"
-
-    @property
-    def description(self) -> str:
-        return (
-            "Create a new release in a GitHub repository. Can set as draft or pre-release. "
-            "Requires write access. Note: Asset uploads are not supported through this tool; "
-            "use the GitHub API directly for uploading release assets."
-        )
-
-    @property
-    def input_schema(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "repository": {
-                    "type": "string",
-                    "description": "Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode')"
-                },
-                "tag_name": {
-                    "type": "string",
-                    "description": "Git tag for the release (required, will be created if doesn't exist)"
-                },
-                "name": {
-                    "type": "string",
-                    "description": "Release title/name"
-                },
-                "body": {
-                    "type": "string",
-                    "description": "Release description/notes (supports Markdown)"
-                },
-                "draft": {
-                    "type": "boolean",
-                    "description": "Create as draft release (default: false)",
-                    "default": False
-                },
-                "prerelease": {
-                    "type": "boolean",
-                    "description": "Mark as pre-release (default: false)",
-                    "default": False
-                },
-                "target_commitish": {
-                    "type": "string",
-                    "description": "Branch or commit SHA to create tag from (default: repository's default branch)"
-                },
-                "generate_release_notes": {
-                    "type": "boolean",
-                    "description": "Automatically generate release notes (default: false)",
-                    "default": False
-                }
+    name = "github_create_release"
+
+    description = (
+        "Create a new release in a GitHub repository. Can set as draft or pre-release. "
+        "Requires write access. Note: Asset uploads are not supported through this tool; "
+        "use the GitHub API directly for uploading release assets."
+    )
+
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "repository": {
+                "type": "string",
+                "description": "Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode')"
+            },
+            "tag_name": {
+                "type": "string",
+                "description": "Git tag for the release (required, will be created if doesn't exist)"
+            },
+            "name": {
+                "type": "string",
+                "description": "Release title/name"
             },
-            "required": ["repository", "tag_name"]
-        }
+            "body": {
+                "type": "string",
+                "description": "Release description/notes (supports Markdown)"
+            },
+            "draft": {
+                "type": "boolean",
+                "description": "Create as draft release (default: false)",
+                "default": False
+            },
+            "prerelease": {
+                "type": "boolean",
+                "description": "Mark as pre-release (default: false)",
+                "default": False
+            },
+            "target_commitish": {
+                "type": "string",
+                "description": "Branch or commit SHA to create tag from (default: repository's default branch)"
+            },
+            "generate_release_notes": {
+                "type": "boolean",
+                "description": "Automatically generate release notes (default: false)",
+                "default": False
+            }
+        },
+        "required": ["repository", "tag_name"]
+    }
 
     async def execute(self, input_data: dict[str, Any]) -> ToolResult:
         """Create a new release."""
@@ -152,7 +141,7 @@ class CreateReleaseTool(GitHubBaseTool):
         except RepositoryNotFoundError as e:
             return ToolResult(success=False, error=e.to_dict())
 
-        except RateLimitError as e:
+        except GitHubError as e:
             return ToolResult(success=False, error=e.to_dict())
 
         except GithubException as e:
@@ -4,70 +4,59 @@ from typing import Any
 from ..base import GitHubBaseTool, ToolResult
 from ...exceptions import (
     RepositoryNotFoundError,
-    RateLimitError,
     PermissionError,
     ValidationError,
     GitHubError,
 )
-
-try:
-    from github.GithubException import GithubException
-except ImportError:
-    GithubException = Exception
+from ..._github_compat import GithubException
 
 
 class CreateTagTool(GitHubBaseTool):
     """Tool to create a new tag in a GitHub repository."""
 
-    @property
-    def name(self) -> str:
-        return "github_create_tag"
-
-    @property
-    def description(self) -> str:
-        return (
-            "Create a new tag in a GitHub repository. Can create lightweight tags "
-            "or annotated tags with messages. Requires write access to the repository."
-        )
-
-    @property
-    def input_schema(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "repository": {
-                    "type": "string",
-                    "description": "Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode')"
-                },
-                "tag": {
-                    "type": "string",
-                    "description": "Tag name (required)"
-                },
-                "message": {
-                    "type": "string",
-                    "description": "Tag message (for annotated tags)"
-                },
-                "object_sha": {
-                    "type": "string",
-                    "description": "SHA of the object to tag (commit, tree, or blob). If not provided, tags HEAD of default branch"
-                },
-                "type": {
-                    "type": "string",
-                    "enum": ["commit", "tree", "blob"],
-                    "description": "Type of object being tagged (default: commit)",
-                    "default": "commit"
-                },
-                "tagger_name": {
-                    "type": "string",
-                    "description": "Name of the tagger (for annotated tags)"
-                },
-                "tagger_email": {
-                    "type": "string",
-                    "description": "Email of the tagger (for annotated tags)"
-                }
+    name = "github_create_tag"
+
+    description = (
+        "Create a new tag in a GitHub repository. Can create lightweight tags "
+        "or annotated tags with messages. Requires write access to the repository."
+    )
+
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "repository": {
+                "type": "string",
+                "description": "Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode')"
+            },
+            "tag": {
+                "type": "string",
+                "description": "Tag name (required)"
+            },
+            "message": {
+                "type": "string",
+                "description": "Tag message (for annotated tags)"
+            },
+            "object_sha": {
+                "type": "string",
+                "description": "SHA of the object to tag (commit, tree, or blob). If not provided, tags HEAD of default branch"
+            },
+            "type": {
+                "type": "string",
+                "enum": ["commit", "tree", "blob"],
+                "description": "Type of object being tagged (default: commit)",
+                "default": "commit"
+            },
+            "tagger_name": {
+                "type": "string",
+                "description": "Name of the tagger (for annotated tags)"
             },
-            "required": ["repository", "tag"]
-        }
+            "tagger_email": {
+                "type": "string",
+                "description": "Email of the tagger (for annotated tags)"
+            }
+        },
+        "required": ["repository", "tag"]
+    }
 
     async def execute(self, input_data: dict[str, Any]) -> ToolResult:
         """Create a new tag."""
@@ -192,7 +181,7 @@ class CreateTagTool(GitHubBaseTool):
         except RepositoryNotFoundError as e:
             return ToolResult(success=False, error=e.to_dict())
 
-        except RateLimitError as e:
+        except GitHubError as e:
             return ToolResult(success=False, error=e.to_dict())
 
         except Exception as e:
@@ -4,51 +4,40 @@ from typing import Any
 from ..base import GitHubBaseTool, ToolResult
 from ...exceptions import (
     RepositoryNotFoundError,
-    RateLimitError,
     GitHubError,
 )
-
-try:
-    from github.GithubException import GithubException
-except ImportError:
-    GithubException = Exception
+from ..._github_compat import GithubException
 
 
 class GetReleaseTool(GitHubBaseTool):
     """Tool to get detailed information about a specific release."""
 
-    @property
-    def name(self) -> str:
-        return "github_get_release"
-
-    @property
-    def description(self) -> str:
-        return (
-            "Get detailed information about a specific release in a GitHub repository. "
-            "Can retrieve by release ID or tag name. Returns release metadata, "
-            "description, assets, and download statistics."
-        )
-
-    @property
-    def input_schema(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "repository": {
-                    "type": "string",
-                    "description": "Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode')"
-                },
-                "release_id": {
-                    "type": "integer",
-                    "description": "Release ID (use either release_id or tag_name)"
-                },
-                "tag_name": {
-                    "type": "string",
-                    "description": "Tag name (use either release_id or tag_name, or 'latest' for latest release)"
-                }
+    name = "github_get_release"
+
+    description = (
+        "Get detailed information about a specific release in a GitHub repository. "
+        "Can retrieve by release ID or tag name. Returns release metadata, "
+        "description, assets, and download statistics."
+    )
+
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "repository": {
+                "type": "string",
+                "description": "Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode')"
             },
-            "required": ["repository"]
-        }
+            "release_id": {
+                "type": "integer",
+                "description": "Release ID (use either release_id or tag_name)"
+            },
+            "tag_name": {
+                "type": "string",
+                "description": "Tag name (use either release_id or tag_name, or 'latest' for latest release)"
+            }
+        },
+        "required": ["repository"]
+    }
 
     async def execute(self, input_data: dict[str, Any]) -> ToolResult:
         """Get release details."""
@@ -158,7 +147,7 @@ class GetReleaseTool(GitHubBaseTool):
         except RepositoryNotFoundError as e:
             return ToolResult(success=False, error=e.to_dict())
 
-        except RateLimitError as e:
+        except GitHubError as e:
             return ToolResult(success=False, error=e.to_dict())
 
         except Exception as e:
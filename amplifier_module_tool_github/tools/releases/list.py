@@ -1,63 +1,53 @@
 """List releases in a repository."""
 
+import asyncio
 from typing import Any
 from ..base import GitHubBaseTool, ToolResult
 from ...exceptions import (
     RepositoryNotFoundError,
-    RateLimitError,
     GitHubError,
 )
-
-try:
-    from github.GithubException import GithubException
-except ImportError:
-    GithubException = Exception
+from ..._github_compat import GithubException
 
 
 class ListReleasesTool(GitHubBaseTool):
     """Tool to list releases in a GitHub repository."""
 
-    @property
-    def name(self) -> str:
-        return "github_list_releases"
-
-    @property
-    def description(self) -> str:
-        return (
-            "List releases in a GitHub repository. Returns release information including "
-            "version tags, titles, descriptions, assets, and download counts. "
-            "Can include draft and pre-releases."
-        )
-
-    @property
-    def input_schema(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "repository": {
-                    "type": "string",
-                    "description": "Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode')"
-                },
-                "include_drafts": {
-                    "type": "boolean",
-                    "description": "Include draft releases (default: false)",
-                    "default": False
-                },
-                "include_prereleases": {
-                    "type": "boolean",
-                    "description": "Include pre-releases (default: true)",
-                    "default": True
-                },
-                "limit": {
-                    "type": "integer",
-                    "description": "Maximum number of releases to return (default: 30, max: 100)",
-                    "default": 30,
-                    "minimum": 1,
-                    "maximum": 100
-                }
+    name = "github_list_releases"
+
+    description = (
+        "List releases in a GitHub repository. Returns release information including "
+        "version tags, titles, descriptions, assets, and download counts. "
+        "Can include draft and pre-releases."
+    )
+
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "repository": {
+                "type": "string",
+                "description": "Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode')"
             },
-            "required": ["repository"]
-        }
+            "include_drafts": {
+                "type": "boolean",
+                "description": "Include draft releases (default: false)",
+                "default": False
+            },
+            "include_prereleases": {
+                "type": "boolean",
+                "description": "Include pre-releases (default: true)",
+                "default": True
+            },
+            "limit": {
+                "type": "integer",
+                "description": "Maximum number of releases to return (default: 30, max: 100)",
+                "default": 30,
+                "minimum": 1,
+                "maximum": 100
+            }
+        },
+        "required": ["repository"]
+    }
 
     async def execute(self, input_data: dict[str, Any]) -> ToolResult:
         """List releases in a repository."""
@@ -78,22 +68,26 @@ class ListReleasesTool(GitHubBaseTool):
             )
 
         try:
-            repo = self.manager.get_repository(repository)
-            releases = repo.get_releases()
-
-            # Collect release data
-            release_list = []
-            count = 0
-            for release in releases:
-                if count >= limit:
-                    break
+            repo = await self._run(self.manager.get_repository, repository)
 
+            def wanted(release) -> bool:
                 # Filter drafts and pre-releases
                 if release.draft and not include_drafts:
-                    continue
+                    return False
                 if release.prerelease and not include_prereleases:
-                    continue
+                    return False
+                return True
 
+            releases = await self._collect(repo.get_releases(), limit, keep=wanted)
+
+            # Each release needs its own assets request; issue them together
+            assets_per_release = await asyncio.gather(
+                *(self._run(list, release.get_assets()) for release in releases)
+            )
+
+            # Collect release data
+            release_list = []
+            for release, release_assets in zip(releases, assets_per_release):
                 release_data = {
                     "id": release.id,
                     "tag_name": release.tag_name,
@@ -110,7 +104,7 @@ class ListReleasesTool(GitHubBaseTool):
 
                 # Get assets
                 assets = []
-                for asset in release.get_assets():
+                for asset in release_assets:
                     assets.append({
                         "id": asset.id,
                         "name": asset.name,
@@ -125,7 +119,6 @@ class ListReleasesTool(GitHubBaseTool):
                 release_data["assets_count"] = len(assets)
 
                 release_list.append(release_data)
-                count += 1
 
             return ToolResult(
                 success=True,
@@ -139,7 +132,7 @@ class ListReleasesTool(GitHubBaseTool):
         except RepositoryNotFoundError as e:
             return ToolResult(success=False, error=e.to_dict())
 
-        except RateLimitError as e:
+        except GitHubError as e:
             return ToolResult(success=False, error=e.to_dict())
 
         except GithubException as e:
@@ -4,49 +4,38 @@ from typing import Any
 from ..base import GitHubBaseTool, ToolResult
 from ...exceptions import (
     RepositoryNotFoundError,
-    RateLimitError,
     GitHubError,
 )
-
-try:
-    from github.GithubException import GithubException
-except ImportError:
-    GithubException = Exception
+from ..._github_compat import GithubException
 
 
 class ListTagsTool(GitHubBaseTool):
     """Tool to list tags in a GitHub repository."""
 
-    @property
-    def name(self) -> str:
-        return "github_list_tags"
-
-    @property
-    def description(self) -> str:
-        return (
-            "List all tags in a GitHub repository. Returns tag names, commit SHAs, "
-            "and commit information for each tag."
-        )
-
-    @property
-    def input_schema(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "repository": {
-                    "type": "string",
-                    "description": "Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode')"
-                },
-                "limit": {
-                    "type": "integer",
-                    "description": "Maximum number of tags to return (default: 100, max: 100)",
-                    "default": 100,
-                    "minimum": 1,
-                    "maximum": 100
-                }
+    name = "github_list_tags"
+
+    description = (
+        "List all tags in a GitHub repository. Returns tag names, commit SHAs, "
+        "and commit information for each tag."
+    )
+
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "repository": {
+                "type": "string",
+                "description": "Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode')"
             },
-            "required": ["repository"]
-        }
+            "limit": {
+                "type": "integer",
+                "description": "Maximum number of tags to return (default: 100, max: 100)",
+                "default": 100,
+                "minimum": 1,
+                "maximum": 100
+            }
+        },
+        "required": ["repository"]
+    }
 
     async def execute(self, input_data: dict[str, Any]) -> ToolResult:
         """List tags in a repository."""
@@ -79,7 +68,7 @@ class ListTagsTool(GitHubBaseTool):
                     "name": tag.name,
                     "commit": {
                         "sha": tag.commit.sha,
-                        "url": tag.commit.html_url if hasattr(tag.commit, 'html_url') else None,
+                        "url": getattr(tag.commit, 'html_url', None),
                     },
                     "zipball_url": tag.zipball_url,
                     "tarball_url": tag.tarball_url,
@@ -100,7 +89,7 @@ class ListTagsTool(GitHubBaseTool):
         except RepositoryNotFoundError as e:
             return ToolResult(success=False, error=e.to_dict())
 
-        except RateLimitError as e:
+        except GitHubError as e:
             return ToolResult(success=False, error=e.to_dict())
 
         except GithubException as e:
@@ -3,106 +3,95 @@
 from typing import Any
 from ..base import GitHubBaseTool, ToolResult
 from ...exceptions import (
-    RateLimitError,
     PermissionError,
     ValidationError,
     GitHubError,
 )
-
-try:
-    from github.GithubException import GithubException
-except ImportError:
-    GithubException = Exception
+from ..._github_compat import GithubException
 
 
 class CreateRepositoryTool(GitHubBaseTool):
     """Tool to create a new GitHub repository."""
 
-    @property
-    def name(self) -> str:
-        return "github_create_repository"
-
-    @property
-    def description(self) -> str:
-        return (
-            "Create a new repository on GitHub. Can create repositories for the authenticated user "
-            "or for an organization (if user has permission). Supports setting visibility, "
-            "initialization with README, .gitignore, and license."
-        )
-
-    @property
-    def input_schema(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "name": {
-                    "type": "string",
-                    "description": "Repository name (required)"
-                },
-                "description": {
-                    "type": "string",
-                    "description": "Repository description"
-                },
-                "private": {
-                    "type": "boolean",
-                    "description": "Create as private repository (default: false)",
-                    "default": False
-                },
-                "organization": {
-                    "type": "string",
-                    "description": "Organization name (if creating for an organization)"
-                },
-                "auto_init": {
-                    "type": "boolean",
-                    "description": "Initialize with README.md (default: false)",
-                    "default": False
-                },
-                "gitignore_template": {
-                    "type": "string",
-                    "description": "gitignore template to use (e.g., 'Python', 'Node', 'Java')"
-                },
-                "license_template": {
-                    "type": "string",
-                    "description": "License template to use (e.g., 'mit', 'apache-2.0', 'gpl-3.0')"
-                },
-                "allow_squash_merge": {
-                    "type": "boolean",
-                    "description": "Allow squash merging (default: true)",
-                    "default": True
-                },
-                "allow_merge_commit": {
-                    "type": "boolean",
-                    "description": "Allow merge commits (default: true)",
-                    "default": True
-                },
-                "allow_rebase_merge": {
-                    "type": "boolean",
-                    "description": "Allow rebase merging (default: true)",
-                    "default": True
-                },
-                "delete_branch_on_merge": {
-                    "type": "boolean",
-                    "description": "Automatically delete branches after merge (default: false)",
-                    "default": False
-                },
-                "has_issues": {
-                    "type": "boolean",
-                    "description": "Enable issues (default: true)",
-                    "default": True
-                },
-                "has_projects": {
-                    "type": "boolean",
-                    "description": "Enable projects (default: true)",
-                    "default": True
-                },
-                "has_wiki": {
-                    "type": "boolean",
-                    "description": "Enable wiki (default: true)",
-                    "default": True
-                }
+    name = "github_create_repository"
+
+    description = (
+        "Create a new repository on GitHub. Can create repositories for the authenticated user "
+        "or for an organization (if user has permission). Supports setting visibility, "
+        "initialization with README, .gitignore, and license."
+    )
+
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "name": {
+                "type": "string",
+                "description": "Repository name (required)"
+            },
+            "description": {
+                "type": "string",
+                "description": "Repository description"
+            },
+            "private": {
+                "type": "boolean",
+                "description": "Create as private repository (default: false)",
+                "default": False
+            },
+            "organization": {
+                "type": "string",
+                "description": "Organization name (if creating for an organization)"
+            },
+            "auto_init": {
+                "type": "boolean",
+                "description": "Initialize with README.md (default: false)",
+                "default": False
+            },
+            "gitignore_template": {
+                "type": "string",
+                "description": "gitignore template to use (e.g., 'Python', 'Node', 'Java')"
             },
-            "required": ["name"]
-        }
+            "license_template": {
+                "type": "string",
+                "description": "License template to use (e.g., 'mit', 'apache-2.0', 'gpl-3.0')"
+            },
+            "allow_squash_merge": {
+                "type": "boolean",
+                "description": "Allow squash merging (default: true)",
+                "default": True
+            },
+            "allow_merge_commit": {
+                "type": "boolean",
+                "description": "Allow merge commits (default: true)",
+                "default": True
+            },
+            "allow_rebase_merge": {
+                "type": "boolean",
+                "description": "Allow rebase merging (default: true)",
+                "default": True
+            },
+            "delete_branch_on_merge": {
+                "type": "boolean",
+                "description": "Automatically delete branches after merge (default: false)",
+                "default": False
+            },
+            "has_issues": {
+                "type": "boolean",
+                "description": "Enable issues (default: true)",
+                "default": True
+            },
+            "has_projects": {
+                "type": "boolean",
+                "description": "Enable projects (default: true)",
+                "default": True
+            },
+            "has_wiki": {
+                "type": "boolean",
+                "description": "Enable wiki (default: true)",
+                "default": True
+            }
+        },
+        "required": ["name"]
+    }
 
     async def execute(self, input_data: dict[str, Any]) -> ToolResult:
         """Create a new repository."""
@@ -221,7 +210,7 @@ class CreateRepositoryTool(GitHubBaseTool):
                 }
             )
 
-        except RateLimitError as e:
+        except GitHubError as e:
             return ToolResult(success=False, error=e.to_dict())
 
         except Exception as e:
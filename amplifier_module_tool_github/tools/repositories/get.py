@@ -4,42 +4,31 @@ from typing import Any
 from ..base import GitHubBaseTool, ToolResult
 from ...exceptions import (
     RepositoryNotFoundError,
-    RateLimitError,
     GitHubError,
 )
-
-try:
-    from github.GithubException import GithubException
-except ImportError:
-    GithubException = Exception
+from ..._github_compat import GithubException
 
 
 class GetRepositoryTool(GitHubBaseTool):
     """Tool to get detailed information about a GitHub repository."""
 
-    @property
-    def name(self) -> str:
-        return "github_get_repository"
-
-    @property
-    def description(self) -> str:
-        return (
-            "Get detailed information about a GitHub repository. Returns repository metadata "
-            "including description, statistics, settings, and more."
-        )
-
-    @property
-    def input_schema(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "repository": {
-                    "type": "string",
-                    "description": "Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode')"
-                }
-            },
-            "required": ["repository"]
-        }
+    name = "github_get_repository"
+
+    description = (
+        "Get detailed information about a GitHub repository. Returns repository metadata "
+        "including description, statistics, settings, and more."
+    )
+
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "repository": {
+                "type": "string",
+                "description": "Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode')"
+            }
+        },
+        "required": ["repository"]
+    }
 
     async def execute(self, input_data: dict[str, Any]) -> ToolResult:
         """Get repository details."""
@@ -90,12 +79,13 @@ class GetRepositoryTool(GitHubBaseTool):
                 "has_downloads": repo.has_downloads,
                 "has_wiki": repo.has_wiki,
                 "has_pages": repo.has_pages,
-                "has_discussions": repo.has_discussions if hasattr(repo, 'has_discussions') else None,
+                "has_discussions": getattr(repo, 'has_discussions', None),
                 "license": repo.license.name if repo.license else None,
-                "topics": repo.get_topics() if hasattr(repo, 'get_topics') else [],
-                "visibility": repo.visibility if hasattr(repo, 'visibility') else None,
-                "allow_forking": repo.allow_forking if hasattr(repo, 'allow_forking') else None,
-                "is_template": repo.is_template if hasattr(repo, 'is_template') else None,
+                # Topics are part of the repository payload; get_topics() would cost another request
+                "topics": repo.topics or [],
+                "visibility": getattr(repo, 'visibility', None),
+                "allow_forking": getattr(repo, 'allow_forking', None),
+                "is_template": getattr(repo, 'is_template', None),
             }
 
             # Get permissions if available
@@ -120,7 +110,7 @@ class GetRepositoryTool(GitHubBaseTool):
         except RepositoryNotFoundError as e:
             return ToolResult(success=False, error=e.to_dict())
 
-        except RateLimitError as e:
+        except GitHubError as e:
             return ToolResult(success=False, error=e.to_dict())
 
         except GithubException as e:
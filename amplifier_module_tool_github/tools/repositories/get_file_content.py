@@ -4,56 +4,46 @@ from typing import Any
 from ..base import GitHubBaseTool, ToolResult
 from ...exceptions import (
     RepositoryNotFoundError,
-    RateLimitError,
     GitHubError,
 )
 import base64
 
-try:
-    from github.GithubException import GithubException
-except ImportError:
-    GithubException = Exception
+from ..._github_compat import GithubException
 
 
 class GetFileContentTool(GitHubBaseTool):
     """Tool to get file content from a GitHub repository."""
 
-    @property
-    def name(self) -> str:
-        return "github_get_file_content"
-
-    @property
-    def description(self) -> str:
-        return (
-            "Get the content of a file from a GitHub repository. Supports different refs "
-            "(branches, tags, commit SHAs). Returns file content, encoding, size, and metadata."
-        )
-
-    @property
-    def input_schema(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "repository": {
-                    "type": "string",
-                    "description": "Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode')"
-                },
-                "path": {
-                    "type": "string",
-                    "description": "Path to the file in the repository (e.g., 'src/main.py')"
-                },
-                "ref": {
-                    "type": "string",
-                    "description": "Git reference (branch, tag, or commit SHA). Defaults to repository's default branch"
-                },
-                "decode": {
-                    "type": "boolean",
-                    "description": "Decode the content from base64 to string (default: true)",
-                    "default": True
-                }
+    name = "github_get_file_content"
+
+    description = (
+        "Get the content of a file from a GitHub repository. Supports different refs "
+        "(branches, tags, commit SHAs). Returns file content, encoding, size, and metadata."
+    )
+
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "repository": {
+                "type": "string",
+                "description": "Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode')"
             },
-            "required": ["repository", "path"]
-        }
+            "path": {
+                "type": "string",
+                "description": "Path to the file in the repository (e.g., 'src/main.py')"
+            },
+            "ref": {
+                "type": "string",
+                "description": "Git reference (branch, tag, or commit SHA). Defaults to repository's default branch"
+            },
+            "decode": {
+                "type": "boolean",
+                "description": "Decode the content from base64 to string (default: true)",
+                "default": True
+            }
+        },
+        "required": ["repository", "path"]
+    }
 
     async def execute(self, input_data: dict[str, Any]) -> ToolResult:
         """Get file content from a repository."""
@@ -153,7 +143,7 @@ class GetFileContentTool(GitHubBaseTool):
         except RepositoryNotFoundError as e:
             return ToolResult(success=False, error=e.to_dict())
 
-        except RateLimitError as e:
+        except GitHubError as e:
             return ToolResult(success=False, error=e.to_dict())
 
         except Exception as e:
@@ -3,69 +3,58 @@
 from typing import Any
 from ..base import GitHubBaseTool, ToolResult
 from ...exceptions import (
-    RateLimitError,
     GitHubError,
 )
-
-try:
-    from github.GithubException import GithubException
-except ImportError:
-    GithubException = Exception
+from ..._github_compat import GithubException
 
 
 class ListRepositoriesTool(GitHubBaseTool):
     """Tool to list repositories for a user or organization."""
 
-    @property
-    def name(self) -> str:
-        return "github_list_repositories"
-
-    @property
-    def description(self) -> str:
-        return (
-            "[User-Level Operation] List repositories for a specific user or organization. "
-            "Returns basic information about each repository. Can filter by type (all, public, "
-            "private, forks, sources, member) and sort by various criteria. Use this to discover "
-            "repositories without needing a specific repository context."
-        )
-
-    @property
-    def input_schema(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "owner": {
-                    "type": "string",
-                    "description": "[Required] GitHub username or organization name to list repositories for"
-                },
-                "type": {
-                    "type": "string",
-                    "enum": ["all", "public", "private", "forks", "sources", "member"],
-                    "description": "Filter by repository type (default: all)",
-                    "default": "all"
-                },
-                "sort": {
-                    "type": "string",
-                    "enum": ["created", "updated", "pushed", "full_name"],
-                    "description": "Sort field (default: full_name)",
-                    "default": "full_name"
-                },
-                "direction": {
-                    "type": "string",
-                    "enum": ["asc", "desc"],
-                    "description": "Sort direction (default: asc)",
-                    "default": "asc"
-                },
-                "limit": {
-                    "type": "integer",
-                    "description": "Maximum number of repositories to return (default: 30, max: 100)",
-                    "default": 30,
-                    "minimum": 1,
-                    "maximum": 100
-                }
+    name = "github_list_repositories"
+
+    description = (
+        "[User-Level Operation] List repositories for a specific user or organization. "
+        "Returns basic information about each repository. Can filter by type (all, public, "
+        "private, forks, sources, member) and sort by various criteria. Use this to discover "
+        "repositories without needing a specific repository context."
+    )
+
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "owner": {
+                "type": "string",
+                "description": "[Required] GitHub username or organization name to list repositories for"
+            },
+            "type": {
+                "type": "string",
+                "enum": ["all", "public", "private", "forks", "sources", "member"],
+                "description": "Filter by repository type (default: all)",
+                "default": "all"
+            },
+            "sort": {
+                "type": "string",
+                "enum": ["created", "updated", "pushed", "full_name"],
+                "description": "Sort field (default: full_name)",
+                "default": "full_name"
+            },
+            "direction": {
+                "type": "string",
+                "enum": ["asc", "desc"],
+                "description": "Sort direction (default: asc)",
+                "default": "asc"
             },
-            "required": ["owner"]
-        }
+            "limit": {
+                "type": "integer",
+                "description": "Maximum number of repositories to return (default: 30, max: 100)",
+                "default": 30,
+                "minimum": 1,
+                "maximum": 100
+            }
+        },
+        "required": ["owner"]
+    }
 
     async def execute(self, input_data: dict[str, Any]) -> ToolResult:
         """List repositories for a user or organization."""
@@ -158,7 +147,7 @@ class ListRepositoriesTool(GitHubBaseTool):
                 }
             )
 
-        except RateLimitError as e:
+        except GitHubError as e:
             return ToolResult(success=False, error=e.to_dict())
 
         except Exception as e:
@@ -4,56 +4,45 @@ from typing import Any
 from ..base import GitHubBaseTool, ToolResult
 from ...exceptions import (
     RepositoryNotFoundError,
-    RateLimitError,
     GitHubError,
 )
-
-try:
-    from github.GithubException import GithubException
-except ImportError:
-    GithubException = Exception
+from ..._github_compat import GithubException
 
 
 class ListRepositoryContentsTool(GitHubBaseTool):
     """Tool to list contents of a directory in a GitHub repository."""
 
-    @property
-    def name(self) -> str:
-        return "github_list_repository_contents"
-
-    @property
-    def description(self) -> str:
-        return (
-            "List the contents of a directory in a GitHub repository. Returns files and "
-            "subdirectories with their metadata. Can optionally list contents recursively."
-        )
-
-    @property
-    def input_schema(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "repository": {
-                    "type": "string",
-                    "description": "Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode')"
-                },
-                "path": {
-                    "type": "string",
-                    "description": "Path to directory in repository (empty string or '/' for root)",
-                    "default": ""
-                },
-                "ref": {
-                    "type": "string",
-                    "description": "Git reference (branch, tag, or commit SHA). Defaults to repository's default branch"
-                },
-                "recursive": {
-                    "type": "boolean",
-                    "description": "List contents recursively (default: false)",
-                    "default": False
-                }
+    name = "github_list_repository_contents"
+
+    description = (
+        "List the contents of a directory in a GitHub repository. Returns files and "
+        "subdirectories with their metadata. Can optionally list contents recursively."
+    )
+
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "repository": {
+                "type": "string",
+                "description": "Full repository name in format 'owner/repo' (e.g., 'microsoft/vscode')"
+            },
+            "path": {
+                "type": "string",
+                "description": "Path to directory in repository (empty string or '/' for root)",
+                "default": ""
+            },
+            "ref": {
+                "type": "string",
+                "description": "Git reference (branch, tag, or commit SHA). Defaults to repository's default branch"
             },
-            "required": ["repository"]
-        }
+            "recursive": {
+                "type": "boolean",
+                "description": "List contents recursively (default: false)",
+                "default": False
+            }
+        },
+        "required": ["repository"]
+    }
 
     async def execute(self, input_data: dict[str, Any]) -> ToolResult:
         """List repository contents."""
@@ -152,7 +141,7 @@ class ListRepositoryContentsTool(GitHubBaseTool):
         except RepositoryNotFoundError as e:
             return ToolResult(success=False, error=e.to_dict())
 
-        except RateLimitError as e:
+        except GitHubError as e:
             return ToolResult(success=False, error=e.to_dict())
 
         except Exception as e:
@@ -26,20 +26,61 @@ from .tools import (
     ListReleasesTool, GetReleaseTool, CreateReleaseTool, ListTagsTool, CreateTagTool,
     # Actions
     ListWorkflowsTool, GetWorkflowTool, TriggerWorkflowTool,
-    ListWorkflowRunsTool, GetWorkflowRunTool, CancelWorkflowRunTool, RerunWorkflowTool,
+    ListWorkflowRunsTool, GetWorkflowRunTool, CancelWorkflowRunTool, CancelWorkflowRunsTool,
+    RerunWorkflowTool,
 )
 
-try:
-    from amplifier_core import ToolResult
-except ImportError:
-    class ToolResult:
-        def __init__(self, success: bool, output: dict | None = None, error: dict | None = None):
-            self.success = success
-            self.output = output or {}
-            self.error = error or {}
+# amplifier-core's ToolResult, or the slotted fallback used without it
+from .tools.base import ToolResult
 
 logger = logging.getLogger(__name__)
 
+# Operation name -> tool class, in the order operations are listed
+_TOOL_CLASSES: tuple[tuple[str, type], ...] = (
+    # Issues
+    ("list_issues", ListIssuesTool),
+    ("get_issue", GetIssueTool),
+    ("create_issue", CreateIssueTool),
+    ("update_issue", UpdateIssueTool),
+    ("comment_issue", CommentIssueTool),
+    # Pull Requests
+    ("list_pull_requests", ListPullRequestsTool),
+    ("get_pull_request", GetPullRequestTool),
+    ("create_pull_request", CreatePullRequestTool),
+    ("update_pull_request", UpdatePullRequestTool),
+    ("merge_pull_request", MergePullRequestTool),
+    ("review_pull_request", ReviewPullRequestTool),
+    # Repositories
+    ("get_repository", GetRepositoryTool),
+    ("list_repositories", ListRepositoriesTool),
+    ("create_repository", CreateRepositoryTool),
+    ("get_file_content", GetFileContentTool),
+    ("list_repository_contents", ListRepositoryContentsTool),
+    # Commits
+    ("list_commits", ListCommitsTool),
+    ("get_commit", GetCommitTool),
+    # Branches
+    ("list_branches", ListBranchesTool),
+    ("get_branch", GetBranchTool),
+    ("create_branch", CreateBranchTool),
+    ("compare_branches", CompareBranchesTool),
+    # Releases
+    ("list_releases", ListReleasesTool),
+    ("get_release", GetReleaseTool),
+    ("create_release", CreateReleaseTool),
+    ("list_tags", ListTagsTool),
+    ("create_tag", CreateTagTool),
+    # Actions
+    ("list_workflows", ListWorkflowsTool),
+    ("get_workflow", GetWorkflowTool),
+    ("trigger_workflow", TriggerWorkflowTool),
+    ("list_workflow_runs", ListWorkflowRunsTool),
+    ("get_workflow_run", GetWorkflowRunTool),
+    ("cancel_workflow_run", CancelWorkflowRunTool),
+    ("cancel_workflow_runs", CancelWorkflowRunsTool),
+    ("rerun_workflow", RerunWorkflowTool),
+)
+
 
 class GitHubUnifiedTool:
     """
@@ -54,49 +95,7 @@ class GitHubUnifiedTool:
         self.manager = manager
         
         # Initialize all individual tool instances
-        self._tools = {
-            # Issues
-            "list_issues": ListIssuesTool(manager),
-            "get_issue": GetIssueTool(manager),
-            "create_issue": CreateIssueTool(manager),
-            "update_issue": UpdateIssueTool(manager),
-            "comment_issue": CommentIssueTool(manager),
-            # Pull Requests
-            "list_pull_requests": ListPullRequestsTool(manager),
-            "get_pull_request": GetPullRequestTool(manager),
-            "create_pull_request": CreatePullRequestTool(manager),
-            "update_pull_request": UpdatePullRequestTool(manager),
-            "merge_pull_request": MergePullRequestTool(manager),
-            "review_pull_request": ReviewPullRequestTool(manager),
-            # Repositories
-            "get_repository": GetRepositoryTool(manager),
-            "list_repositories": ListRepositoriesTool(manager),
-            "create_repository": CreateRepositoryTool(manager),
-            "get_file_content": GetFileContentTool(manager),
-            "list_repository_contents": ListRepositoryContentsTool(manager),
-            # Commits
-            "list_commits": ListCommitsTool(manager),
-            "get_commit": GetCommitTool(manager),
-            # Branches
-            "list_branches": ListBranchesTool(manager),
-            "get_branch": GetBranchTool(manager),
-            "create_branch": CreateBranchTool(manager),
-            "compare_branches": CompareBranchesTool(manager),
-            # Releases
-            "list_releases": ListReleasesTool(manager),
-            "get_release": GetReleaseTool(manager),
-            "create_release": CreateReleaseTool(manager),
-            "list_tags": ListTagsTool(manager),
-            "create_tag": CreateTagTool(manager),
-            # Actions
-            "list_workflows": ListWorkflowsTool(manager),
-            "get_workflow": GetWorkflowTool(manager),
-            "trigger_workflow": TriggerWorkflowTool(manager),
-            "list_workflow_runs": ListWorkflowRunsTool(manager),
-            "get_workflow_run": GetWorkflowRunTool(manager),
-            "cancel_workflow_run": CancelWorkflowRunTool(manager),
-            "rerun_workflow": RerunWorkflowTool(manager),
-        }
+        self._tools = {operation: tool_class(manager) for operation, tool_class in _TOOL_CLASSES}
 
     @property
     def name(self) -> str:
@@ -109,7 +108,7 @@ class GitHubUnifiedTool:
         return (
             "Interact with GitHub repositories and resources. When repositories are configured in settings, "
             "many operations can query across ALL configured repos automatically. Otherwise, specify a repository "
-            "parameter to target a specific repo. Supports 34 operations for issues, PRs, commits, branches, "
+            "parameter to target a specific repo. Supports 35 operations for issues, PRs, commits, branches, "
             "workflows, releases, and more.\n\n"
             "IMPORTANT - Username Parameters:\n"
             "- When filtering by username (assignee, creator, mentioned, etc.), use the actual GitHub username\n"
@@ -241,7 +241,7 @@ async def main():
     print("GitHub Unified Tool Examples")
     print("="*70)
     print("\nThis script demonstrates the unified 'github' tool interface.")
-    print("All 34 GitHub operations are accessible through a single tool.\n")
+    print("All 35 GitHub operations are accessible through a single tool.\n")
     
     # Run examples
     await example_list_issues()
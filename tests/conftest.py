@@ -3,7 +3,7 @@
 import pytest
 import os
 from datetime import datetime
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 
 def create_mock_datetime(date_string):
@@ -14,6 +14,19 @@ def create_mock_datetime(date_string):
     return mock_dt
 
 
+def create_mock_manager():
+    """
+    Create a mock GitHubManager for tool tests.
+
+    ``run`` calls the wrapped function inline, so PyGithub calls the tools
+    offload to worker threads still hit the mocks set up by each test.
+    """
+    manager = Mock()
+    manager.run = AsyncMock(side_effect=lambda fn, *args, **kwargs: fn(*args, **kwargs))
+    manager.per_page = 30
+    return manager
+
+
 @pytest.fixture
 def mock_github_config():
     """Mock configuration for GitHub manager."""
@@ -1,8 +1,9 @@
 """Comprehensive tests for GitHub Branches, Commits, and Tags tools."""
 
 import pytest
-from unittest.mock import Mock, AsyncMock, MagicMock, patch
-from tests.conftest import create_mock_datetime
+from datetime import datetime, timezone
+from unittest.mock import Mock, AsyncMock, MagicMock, PropertyMock, patch
+from tests.conftest import create_mock_datetime, create_mock_manager
 from github.GithubException import GithubException, UnknownObjectException
 
 from amplifier_module_tool_github.tools.branches import (
@@ -22,7 +23,7 @@ class TestListBranchesToolComprehensive:
 
     def setup_method(self):
         """Set up test fixtures."""
-        self.manager = Mock()
+        self.manager = create_mock_manager()
         self.manager.is_authenticated.return_value = True
         self.tool = ListBranchesTool(self.manager)
 
@@ -84,12 +85,57 @@ class TestListBranchesToolComprehensive:
         assert result.output["branches"][0]["protected"] is True
 
 
+    @pytest.mark.asyncio
+    async def test_list_branches_filter_before_limit(self, test_username):
+        """Test that the protection filter is applied before the limit."""
+        mock_repo = Mock()
+        branches = []
+        for number in range(4):
+            branch = Mock()
+            branch.name = f"branch-{number}"
+            branch.commit.sha = f"sha{number}"
+            branch.protected = number % 2 == 1
+            branches.append(branch)
+        mock_repo.get_branches.return_value = branches
+        self.manager.get_repository.return_value = mock_repo
+
+        result = await self.tool.execute({
+            "repository": f"{test_username}/repo",
+            "protected": True,
+            "limit": 1
+        })
+
+        assert result.success
+        assert [b["name"] for b in result.output["branches"]] == ["branch-1"]
+
+    @pytest.mark.asyncio
+    async def test_list_branches_builds_commit_url(self, test_username):
+        """Test commit links are built from the SHA rather than fetched per branch."""
+        mock_repo = Mock()
+        mock_repo.html_url = f"https://github.com/{test_username}/repo"
+        mock_branch = Mock()
+        mock_branch.name = "main"
+        mock_branch.commit.sha = "abc123"
+        mock_branch.protected = False
+        type(mock_branch.commit).html_url = PropertyMock()
+        mock_repo.get_branches.return_value = [mock_branch]
+        self.manager.get_repository.return_value = mock_repo
+
+        result = await self.tool.execute({"repository": f"{test_username}/repo"})
+
+        assert result.success
+        assert result.output["branches"][0]["commit"] == {
+            "sha": "abc123",
+            "url": f"https://github.com/{test_username}/repo/commit/abc123",
+        }
+        type(mock_branch.commit).html_url.assert_not_called()
+
 class TestGetBranchToolComprehensive:
     """Comprehensive tests for GetBranchTool."""
 
     def setup_method(self):
         """Set up test fixtures."""
-        self.manager = Mock()
+        self.manager = create_mock_manager()
         self.manager.is_authenticated.return_value = True
         self.tool = GetBranchTool(self.manager)
 
@@ -130,12 +176,80 @@ class TestGetBranchToolComprehensive:
         assert not result.success
 
 
+    @pytest.mark.asyncio
+    async def test_get_branch_protection_details(self, test_username):
+        """Test protection rules are read from the loaded BranchProtection."""
+        mock_repo = Mock()
+        mock_branch = Mock()
+        mock_branch.name = "main"
+        mock_branch.protected = True
+        protection = mock_branch.get_protection.return_value
+        protection.required_status_checks = Mock(strict=True, contexts=["ci"])
+        protection.required_pull_request_reviews = None
+        protection.enforce_admins = True
+        protection.restrictions = {"users": [{"login": test_username}], "teams": [{"slug": "core"}]}
+        mock_repo.get_branch.return_value = mock_branch
+        self.manager.get_repository.return_value = mock_repo
+
+        result = await self.tool.execute({
+            "repository": f"{test_username}/repo",
+            "branch": "main"
+        })
+
+        assert result.success
+        assert result.output["branch"]["protection"] == {
+            "enabled": True,
+            "required_status_checks": {"strict": True, "contexts": ["ci"]},
+            "enforce_admins": True,
+            "restrictions": {"users": [test_username], "teams": ["core"]},
+        }
+
+    @pytest.mark.asyncio
+    async def test_get_branch_protection_unavailable(self, test_username):
+        """Test protection details are reported unavailable when they can't be read."""
+        mock_repo = Mock()
+        mock_branch = Mock()
+        mock_branch.protected = True
+        mock_branch.get_protection.side_effect = GithubException(403, {"message": "Forbidden"})
+        mock_repo.get_branch.return_value = mock_branch
+        self.manager.get_repository.return_value = mock_repo
+
+        result = await self.tool.execute({
+            "repository": f"{test_username}/repo",
+            "branch": "main"
+        })
+
+        assert result.success
+        assert result.output["branch"]["protection"] == {"enabled": True, "details_unavailable": True}
+
+    @pytest.mark.asyncio
+    async def test_get_branch_protection_rule_unavailable(self, test_username):
+        """Test a protection rule failing to load marks the details unavailable."""
+        mock_repo = Mock()
+        mock_branch = Mock()
+        mock_branch.protected = True
+        protection = mock_branch.get_protection.return_value
+        type(protection).required_status_checks = PropertyMock(
+            side_effect=GithubException(404, {"message": "Not Found"})
+        )
+        mock_repo.get_branch.return_value = mock_branch
+        self.manager.get_repository.return_value = mock_repo
+
+        result = await self.tool.execute({
+            "repository": f"{test_username}/repo",
+            "branch": "main"
+        })
+
+        assert result.success
+        assert result.output["branch"]["protection"] == {"enabled": True, "details_unavailable": True}
+        self.manager.run.assert_any_call(self.tool._protection_data, protection)
+
 class TestCreateBranchToolComprehensive:
     """Comprehensive tests for CreateBranchTool."""
 
     def setup_method(self):
         """Set up test fixtures."""
-        self.manager = Mock()
+        self.manager = create_mock_manager()
         self.manager.is_authenticated.return_value = True
         self.tool = CreateBranchTool(self.manager)
 
@@ -197,6 +311,43 @@ class TestCreateBranchToolComprehensive:
         
         assert result.success
 
+    @pytest.mark.asyncio
+    async def test_create_branch_resolves_from_ref_in_one_request(self, test_username):
+        """Test that from_ref is resolved through the commits endpoint alone."""
+        mock_repo = Mock()
+        mock_repo.get_commit.return_value.sha = "abc123"
+        mock_repo.create_git_ref.return_value.ref = "refs/heads/feature-copy"
+        self.manager.get_repository.return_value = mock_repo
+
+        result = await self.tool.execute({
+            "repository": f"{test_username}/repo",
+            "branch": "feature-copy",
+            "from_ref": "develop"
+        })
+
+        assert result.success
+        assert result.output["branch"]["sha"] == "abc123"
+        mock_repo.get_commit.assert_called_once_with("develop")
+        mock_repo.get_branch.assert_not_called()
+        mock_repo.create_git_ref.assert_called_once_with(ref="refs/heads/feature-copy", sha="abc123")
+
+    @pytest.mark.asyncio
+    async def test_create_branch_unknown_from_ref(self, test_username):
+        """Test that an unresolvable from_ref is reported as REF_NOT_FOUND."""
+        mock_repo = Mock()
+        mock_repo.get_commit.side_effect = GithubException(422, {"message": "No commit found"})
+        self.manager.get_repository.return_value = mock_repo
+
+        result = await self.tool.execute({
+            "repository": f"{test_username}/repo",
+            "branch": "feature-copy",
+            "from_ref": "nope"
+        })
+
+        assert not result.success
+        assert result.error["code"] == "REF_NOT_FOUND"
+        mock_repo.create_git_ref.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_create_branch_already_exists(self, test_username):
         """Test creating branch that already exists."""
@@ -221,7 +372,7 @@ class TestCompareBranchesToolComprehensive:
 
     def setup_method(self):
         """Set up test fixtures."""
-        self.manager = Mock()
+        self.manager = create_mock_manager()
         self.manager.is_authenticated.return_value = True
         self.tool = CompareBranchesTool(self.manager)
 
@@ -260,7 +411,7 @@ class TestCompareBranchesToolComprehensive:
         mock_file.changes = 15
         mock_comparison.files = [mock_file]
         
-        mock_repo.compare.return_value = mock_comparison
+        self.manager.get_comparison.return_value = mock_comparison
         self.manager.get_repository.return_value = mock_repo
 
         result = await self.tool.execute({
@@ -284,7 +435,7 @@ class TestCompareBranchesToolComprehensive:
         mock_comparison.status = "identical"
         mock_comparison.commits = []
         mock_comparison.files = []
-        mock_repo.compare.return_value = mock_comparison
+        self.manager.get_comparison.return_value = mock_comparison
         self.manager.get_repository.return_value = mock_repo
 
         result = await self.tool.execute({
@@ -307,7 +458,7 @@ class TestCompareBranchesToolComprehensive:
         mock_comparison.status = "diverged"
         mock_comparison.commits = []
         mock_comparison.files = []
-        mock_repo.compare.return_value = mock_comparison
+        self.manager.get_comparison.return_value = mock_comparison
         self.manager.get_repository.return_value = mock_repo
 
         result = await self.tool.execute({
@@ -320,12 +471,118 @@ class TestCompareBranchesToolComprehensive:
         assert result.output["comparison"]["status"] == "diverged"
 
 
+    @pytest.mark.asyncio
+    async def test_compare_branches_missing_parameter(self, test_username):
+        """Test that an empty required parameter is rejected before any API call."""
+        result = await self.tool.execute({
+            "repository": f"{test_username}/repo",
+            "base": "main",
+            "head": ""
+        })
+
+        assert not result.success
+        assert result.error["code"] == "MISSING_PARAMETER"
+        assert result.error["message"] == "repository, base, and head parameters are required"
+        self.manager.get_repository.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_compare_branches_caps_files_and_commits(self, test_username):
+        """Test that max_files and max_commits cap the lists and flag truncation."""
+        def make_commit(number):
+            commit = Mock()
+            commit.sha = f"sha{number}"
+            commit.commit.author.date = None
+            return commit
+
+        fetched = []
+
+        def commit_pages():
+            for number in range(10):
+                fetched.append(number)
+                yield make_commit(number)
+
+        mock_comparison = Mock()
+        mock_comparison.total_commits = 10
+        mock_comparison.commits = commit_pages()
+        mock_comparison.files = [Mock(patch=None) for _ in range(5)]
+        self.manager.get_repository.return_value = Mock()
+        self.manager.get_comparison.return_value = mock_comparison
+
+        result = await self.tool.execute({
+            "repository": f"{test_username}/repo",
+            "base": "main",
+            "head": "feature",
+            "max_files": 2,
+            "max_commits": 3
+        })
+
+        assert result.success
+        comparison = result.output["comparison"]
+        assert comparison["files_changed"] == 2
+        assert comparison["files_truncated"] is True
+        assert [c["sha"] for c in comparison["commits"]] == ["sha0", "sha1", "sha2"]
+        assert comparison["commits_truncated"] is True
+        # Iteration stopped at the cap instead of walking every page
+        assert fetched == [0, 1, 2]
+
+
+    @pytest.mark.asyncio
+    async def test_compare_branches_columns_output(self, test_username):
+        """Test that output_format=columns returns one list per field."""
+        commit = Mock()
+        commit.sha = "abc123"
+        commit.commit.message = "Fix bug"
+        commit.commit.author.name = "Test User"
+        commit.commit.author.email = "test@example.com"
+        commit.commit.author.date = None
+        commit.author.login = test_username
+        commit.html_url = "https://github.com/test/repo/commit/abc123"
+
+        file_a = Mock(filename="a.py", status="modified", additions=1, deletions=2, changes=3, patch="@@")
+        file_b = Mock(filename="b.py", status="added", additions=4, deletions=0, changes=4, patch=None)
+
+        mock_comparison = Mock()
+        mock_comparison.total_commits = 1
+        mock_comparison.commits = [commit]
+        mock_comparison.files = [file_a, file_b]
+        self.manager.get_repository.return_value = Mock()
+        self.manager.get_comparison.return_value = mock_comparison
+
+        result = await self.tool.execute({
+            "repository": f"{test_username}/repo",
+            "base": "main",
+            "head": "feature",
+            "output_format": "columns"
+        })
+
+        assert result.success
+        comparison = result.output["comparison"]
+        assert comparison["files"] == {
+            "filename": ["a.py", "b.py"],
+            "status": ["modified", "added"],
+            "additions": [1, 4],
+            "deletions": [2, 0],
+            "changes": [3, 4],
+            "patch": ["@@", None],
+        }
+        assert comparison["files_changed"] == 2
+        assert comparison["commits"] == {
+            "sha": ["abc123"],
+            "message": ["Fix bug"],
+            "author_name": ["Test User"],
+            "author_email": ["test@example.com"],
+            "date": [None],
+            "username": [test_username],
+            "url": ["https://github.com/test/repo/commit/abc123"],
+        }
+
+
 class TestListCommitsToolComprehensive:
     """Comprehensive tests for ListCommitsTool."""
 
     def setup_method(self):
         """Set up test fixtures."""
-        self.manager = Mock()
+        self.manager = create_mock_manager()
         self.manager.is_authenticated.return_value = True
         self.tool = ListCommitsTool(self.manager)
 
@@ -476,12 +733,67 @@ class TestListCommitsToolComprehensive:
         assert result.success
 
 
+    @pytest.mark.asyncio
+    async def test_list_commits_invalid_date(self, test_username):
+        """Test a malformed date is rejected before any API call."""
+        result = await self.tool.execute({
+            "repository": f"{test_username}/repo",
+            "since": "last tuesday"
+        })
+
+        assert not result.success
+        assert result.error["code"] == "INVALID_DATE_FORMAT"
+        self.manager.get_repository.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_list_commits_parses_utc_dates(self, test_username):
+        """Test ISO 8601 dates with a Z suffix are passed on as UTC datetimes."""
+        mock_repo = Mock()
+        mock_repo.get_commits.return_value = []
+        self.manager.get_repository.return_value = mock_repo
+
+        result = await self.tool.execute({
+            "repository": f"{test_username}/repo",
+            "since": "2024-01-01T00:00:00Z",
+            "until": "2024-02-01T12:30:00Z"
+        })
+
+        assert result.success
+        kwargs = mock_repo.get_commits.call_args.kwargs
+        assert kwargs["since"] == datetime(2024, 1, 1, tzinfo=timezone.utc)
+        assert kwargs["until"] == datetime(2024, 2, 1, 12, 30, tzinfo=timezone.utc)
+
+    @pytest.mark.asyncio
+    async def test_list_commits_stats_are_opt_in(self, test_username):
+        """Test stats are only read (one request per commit) when requested."""
+        mock_repo = Mock()
+        mock_commit = Mock()
+        mock_commit.sha = "abc123"
+        mock_commit.commit.author.date = None
+        mock_commit.commit.committer.date = None
+        mock_commit.parents = []
+        type(mock_commit).stats = PropertyMock(return_value=Mock(additions=5, deletions=2, total=7))
+        mock_repo.get_commits.return_value = [mock_commit]
+        self.manager.get_repository.return_value = mock_repo
+
+        result = await self.tool.execute({"repository": f"{test_username}/repo"})
+
+        assert result.success
+        assert "stats" not in result.output["commits"][0]
+        type(mock_commit).stats.assert_not_called()
+
+        result = await self.tool.execute({"repository": f"{test_username}/repo", "include_stats": True})
+
+        assert result.success
+        assert result.output["commits"][0]["stats"] == {"additions": 5, "deletions": 2, "total": 7}
+
+
 class TestGetCommitToolComprehensive:
     """Comprehensive tests for GetCommitTool."""
 
     def setup_method(self):
         """Set up test fixtures."""
-        self.manager = Mock()
+        self.manager = create_mock_manager()
         self.manager.is_authenticated.return_value = True
         self.tool = GetCommitTool(self.manager)
 
@@ -518,9 +830,10 @@ class TestGetCommitToolComprehensive:
         mock_file.additions = 30
         mock_file.deletions = 10
         mock_file.changes = 40
+        mock_file.patch = "@@ -1,10 +1,30 @@"
         mock_commit.files = [mock_file]
         
-        mock_repo.get_commit.return_value = mock_commit
+        self.manager.get_commit.return_value = mock_commit
         self.manager.get_repository.return_value = mock_repo
 
         result = await self.tool.execute({
@@ -556,15 +869,18 @@ class TestGetCommitToolComprehensive:
         mock_file1 = Mock()
         mock_file1.filename = "file1.py"
         mock_file1.status = "added"
+        mock_file1.patch = None
         mock_file2 = Mock()
         mock_file2.filename = "file2.py"
         mock_file2.status = "modified"
+        mock_file2.patch = None
         mock_file3 = Mock()
         mock_file3.filename = "file3.py"
         mock_file3.status = "deleted"
+        mock_file3.patch = None
         mock_commit.files = [mock_file1, mock_file2, mock_file3]
         
-        mock_repo.get_commit.return_value = mock_commit
+        self.manager.get_commit.return_value = mock_commit
         self.manager.get_repository.return_value = mock_repo
 
         result = await self.tool.execute({
@@ -575,11 +891,133 @@ class TestGetCommitToolComprehensive:
         assert result.success
         assert len(result.output["commit"]["files"]) == 3
 
+    @pytest.mark.asyncio
+    async def test_get_commit_files_and_comments(self, test_username):
+        """Test files and comments are both collected, and comment failures are tolerated."""
+        mock_commit = Mock()
+        mock_commit.sha = "abc123"
+        mock_commit.commit.author.date = None
+        mock_commit.commit.committer.date = None
+        mock_commit.parents = []
+        mock_commit.files = [Mock(filename="a.py", patch=None)]
+        comment = Mock(id=7, body="Nice", created_at=None)
+        comment.user.login = test_username
+        mock_commit.get_comments.return_value = [comment]
+        self.manager.get_commit.return_value = mock_commit
+        self.manager.get_repository.return_value = Mock()
+
+        result = await self.tool.execute({"repository": f"{test_username}/repo", "sha": "abc123"})
+
+        assert result.success
+        assert [f["filename"] for f in result.output["commit"]["files"]] == ["a.py"]
+        assert result.output["commit"]["comments"][0]["user"] == test_username
+
+        mock_commit.get_comments.side_effect = GithubException(500, {"message": "Server error"})
+        result = await self.tool.execute({"repository": f"{test_username}/repo", "sha": "abc123"})
+
+        assert result.success
+        assert result.output["commit"]["comments"] == []
+        assert len(result.output["commit"]["files"]) == 1
+
+    @pytest.mark.asyncio
+    async def test_get_commit_comment_pages_fetched_together(self, test_username):
+        """Test comment pages after the first are requested together, without a count request."""
+        from github.CommitComment import CommitComment
+        from github.PaginatedList import PaginatedList
+
+        url = f"https://api.github.com/repos/{test_username}/repo/commits/abc123/comments"
+        comments = [
+            {
+                "id": n,
+                "url": f"https://api.github.com/repos/{test_username}/repo/comments/{n}",
+                "body": f"Comment {n}",
+                "user": {"login": test_username},
+                "path": None,
+                "position": None,
+                "line": None,
+                "created_at": "2024-01-01T00:00:00Z",
+            }
+            for n in range(65)
+        ]
+
+        def request(method, request_url, parameters=None, headers=None):
+            # Commit comments come back as a plain JSON array
+            page = (parameters or {}).get("page", 1) - 1
+            return {}, comments[page * 30:(page + 1) * 30]
+
+        requester = Mock()
+        requester.per_page = 30
+        requester.requestJsonAndCheck.side_effect = request
+        mock_commit = Mock()
+        mock_commit.sha = "abc123"
+        mock_commit.commit.author.date = None
+        mock_commit.commit.committer.date = None
+        mock_commit.parents = []
+        mock_commit.get_comments.return_value = PaginatedList(CommitComment, requester, url, None)
+        self.manager.get_commit.return_value = mock_commit
+        self.manager.get_repository.return_value = Mock()
+
+        result = await self.tool.execute({
+            "repository": f"{test_username}/repo",
+            "sha": "abc123",
+            "include_files": False
+        })
+
+        assert result.success
+        assert [c["id"] for c in result.output["commit"]["comments"]] == list(range(65))
+        pages = [
+            call.kwargs["parameters"].get("page", 1)
+            for call in requester.requestJsonAndCheck.call_args_list
+        ]
+        assert pages == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_get_commit_patch_controls(self, test_username):
+        """Test patches can be truncated or replaced by a link to the diff."""
+        mock_commit = Mock()
+        mock_commit.sha = "abc123"
+        mock_commit.html_url = "https://github.com/test/repo/commit/abc123"
+        mock_commit.commit.author.date = None
+        mock_commit.commit.committer.date = None
+        mock_commit.parents = []
+        mock_commit.files = [
+            Mock(filename="small.py", patch="@@ -1 +1 @@"),
+            Mock(filename="big.py", patch="+" * 100),
+        ]
+        mock_commit.get_comments.return_value = []
+        self.manager.get_commit.return_value = mock_commit
+        self.manager.get_repository.return_value = Mock()
+
+        result = await self.tool.execute({
+            "repository": f"{test_username}/repo",
+            "sha": "abc123",
+            "max_patch_length": 20
+        })
+
+        assert result.success
+        small, big = result.output["commit"]["files"]
+        assert small["patch"] == "@@ -1 +1 @@"
+        assert "patch_truncated" not in small
+        assert big["patch"] == "+" * 20
+        assert big["patch_truncated"] is True
+        assert big["patch_url"].startswith("https://github.com/test/repo/commit/abc123#diff-")
+
+        result = await self.tool.execute({
+            "repository": f"{test_username}/repo",
+            "sha": "abc123",
+            "include_patches": False
+        })
+
+        assert result.success
+        for file_data in result.output["commit"]["files"]:
+            assert "patch" not in file_data
+            assert "#diff-" in file_data["patch_url"]
+
     @pytest.mark.asyncio
     async def test_get_commit_not_found(self, test_username):
         """Test getting a non-existent commit."""
         mock_repo = Mock()
-        mock_repo.get_commit.side_effect = GithubException(404, {"message": "Not Found"})
+        self.manager.get_commit.side_effect = GithubException(404, {"message": "Not Found"})
         self.manager.get_repository.return_value = mock_repo
 
         result = await self.tool.execute({
@@ -616,7 +1054,7 @@ class TestGetCommitToolComprehensive:
         mock_parent2.sha = "def456"
         mock_commit.parents = [mock_parent1, mock_parent2]
         
-        mock_repo.get_commit.return_value = mock_commit
+        self.manager.get_commit.return_value = mock_commit
         self.manager.get_repository.return_value = mock_repo
 
         result = await self.tool.execute({
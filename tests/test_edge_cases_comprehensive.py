@@ -2,6 +2,7 @@
 
 import pytest
 from unittest.mock import Mock, patch
+from tests.conftest import create_mock_manager
 from github.GithubException import (
     GithubException,
     UnknownObjectException,
@@ -12,9 +13,14 @@ from github.GithubException import (
 from amplifier_module_tool_github.tools.issues import CreateIssueTool
 from amplifier_module_tool_github.tools.pull_requests import CreatePullRequestTool
 from amplifier_module_tool_github.tools.repositories import CreateRepositoryTool
-from amplifier_module_tool_github.tools.branches import CreateBranchTool
+from amplifier_module_tool_github.tools.branches import (
+    CreateBranchTool,
+    GetBranchTool,
+    CompareBranchesTool,
+)
+from amplifier_module_tool_github.tools.commits import GetCommitTool
 from amplifier_module_tool_github.tools.releases import CreateReleaseTool
-from amplifier_module_tool_github.tools.actions import TriggerWorkflowTool
+from amplifier_module_tool_github.tools.actions import TriggerWorkflowTool, ListWorkflowRunsTool
 
 
 class TestAuthenticationEdgeCases:
@@ -23,7 +29,7 @@ class TestAuthenticationEdgeCases:
     @pytest.mark.asyncio
     async def test_no_authentication(self, test_username):
         """Test all tools fail gracefully without authentication."""
-        manager = Mock()
+        manager = create_mock_manager()
         manager.is_authenticated.return_value = False
         
         tools = [
@@ -43,7 +49,7 @@ class TestAuthenticationEdgeCases:
     @pytest.mark.asyncio
     async def test_bad_credentials(self, test_username):
         """Test handling of bad credentials."""
-        manager = Mock()
+        manager = create_mock_manager()
         manager.is_authenticated.return_value = True
         manager.get_repository.side_effect = BadCredentialsException(401, "Bad credentials")
         
@@ -58,7 +64,7 @@ class TestAuthenticationEdgeCases:
     @pytest.mark.asyncio
     async def test_token_expired(self, test_username):
         """Test handling of expired token."""
-        manager = Mock()
+        manager = create_mock_manager()
         manager.is_authenticated.return_value = True
         manager.get_repository.side_effect = GithubException(401, {"message": "Token expired"})
         
@@ -77,7 +83,7 @@ class TestRateLimitingEdgeCases:
     @pytest.mark.asyncio
     async def test_rate_limit_exceeded_primary(self, test_username):
         """Test handling primary rate limit exceeded."""
-        manager = Mock()
+        manager = create_mock_manager()
         manager.is_authenticated.return_value = True
         manager.get_repository.side_effect = RateLimitExceededException(
             403,
@@ -97,7 +103,7 @@ class TestRateLimitingEdgeCases:
     @pytest.mark.asyncio
     async def test_secondary_rate_limit(self, test_username):
         """Test handling secondary rate limit."""
-        manager = Mock()
+        manager = create_mock_manager()
         manager.is_authenticated.return_value = True
         manager.get_repository.side_effect = GithubException(
             403,
@@ -119,7 +125,7 @@ class TestPermissionEdgeCases:
     @pytest.mark.asyncio
     async def test_no_write_access(self, test_username):
         """Test operations requiring write access fail gracefully."""
-        manager = Mock()
+        manager = create_mock_manager()
         manager.is_authenticated.return_value = True
         mock_repo = Mock()
         mock_repo.create_issue.side_effect = GithubException(
@@ -140,7 +146,7 @@ class TestPermissionEdgeCases:
     @pytest.mark.asyncio
     async def test_read_only_repository(self, test_username):
         """Test operations on read-only repository."""
-        manager = Mock()
+        manager = create_mock_manager()
         manager.is_authenticated.return_value = True
         mock_repo = Mock()
         mock_repo.create_issue.side_effect = GithubException(
@@ -165,7 +171,7 @@ class TestValidationEdgeCases:
     async def test_invalid_repository_format(self, test_username):
         """Test various invalid repository formats."""
         from amplifier_module_tool_github.exceptions import RepositoryNotFoundError
-        manager = Mock()
+        manager = create_mock_manager()
         manager.is_authenticated.return_value = True
         tool = CreateIssueTool(manager)
         
@@ -190,7 +196,7 @@ class TestValidationEdgeCases:
     @pytest.mark.asyncio
     async def test_empty_required_fields(self, test_username):
         """Test tools with empty required fields."""
-        manager = Mock()
+        manager = create_mock_manager()
         manager.is_authenticated.return_value = True
         
         # Empty issue title
@@ -204,7 +210,7 @@ class TestValidationEdgeCases:
     @pytest.mark.asyncio
     async def test_extremely_long_inputs(self, test_username):
         """Test handling of extremely long inputs."""
-        manager = Mock()
+        manager = create_mock_manager()
         manager.is_authenticated.return_value = True
         mock_repo = Mock()
         
@@ -227,7 +233,7 @@ class TestValidationEdgeCases:
     @pytest.mark.asyncio
     async def test_special_characters_in_inputs(self, test_username):
         """Test handling special characters in inputs."""
-        manager = Mock()
+        manager = create_mock_manager()
         manager.is_authenticated.return_value = True
         mock_repo = Mock()
         mock_issue = Mock()
@@ -248,7 +254,7 @@ class TestValidationEdgeCases:
     @pytest.mark.asyncio
     async def test_null_optional_parameters(self, test_username):
         """Test handling of None values for optional parameters."""
-        manager = Mock()
+        manager = create_mock_manager()
         manager.is_authenticated.return_value = True
         mock_repo = Mock()
         mock_issue = Mock()
@@ -277,7 +283,7 @@ class TestRepositoryEdgeCases:
     async def test_repository_not_found(self, test_username):
         """Test handling of non-existent repositories."""
         from amplifier_module_tool_github.exceptions import RepositoryNotFoundError
-        manager = Mock()
+        manager = create_mock_manager()
         manager.is_authenticated.return_value = True
         repo_name = f"{test_username}/nonexistent-repo"
         manager.get_repository.side_effect = RepositoryNotFoundError(repo_name)
@@ -291,10 +297,34 @@ class TestRepositoryEdgeCases:
         assert not result.success
         assert "REPOSITORY_NOT_FOUND" in result.error["code"]
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("tool_class, extra_input", [
+        (ListWorkflowRunsTool, {}),
+        (GetBranchTool, {"branch": "main"}),
+        (GetCommitTool, {"sha": "abc123"}),
+        (CompareBranchesTool, {"base": "main", "head": "feature"}),
+        (CreateIssueTool, {"title": "Test"}),
+    ])
+    async def test_repository_not_configured(self, test_username, tool_class, extra_input):
+        """Test a repository outside the configured set is reported as a permission error."""
+        from amplifier_module_tool_github.exceptions import PermissionError
+        manager = create_mock_manager()
+        manager.is_authenticated.return_value = True
+        repo_name = f"{test_username}/other-repo"
+        manager.get_repository.side_effect = PermissionError(
+            f"access repository '{repo_name}' (not in configured repositories)"
+        )
+
+        tool = tool_class(manager)
+        result = await tool.execute({"repository": repo_name, **extra_input})
+
+        assert not result.success
+        assert result.error["code"] == "PERMISSION_DENIED"
+
     @pytest.mark.asyncio
     async def test_private_repository_no_access(self, test_username):
         """Test accessing private repository without permission."""
-        manager = Mock()
+        manager = create_mock_manager()
         manager.is_authenticated.return_value = True
         manager.get_repository.side_effect = UnknownObjectException(404, "Not Found")
         
@@ -309,7 +339,7 @@ class TestRepositoryEdgeCases:
     @pytest.mark.asyncio
     async def test_archived_repository(self, test_username):
         """Test operations on archived repository."""
-        manager = Mock()
+        manager = create_mock_manager()
         manager.is_authenticated.return_value = True
         mock_repo = Mock()
         mock_repo.archived = True
@@ -330,7 +360,7 @@ class TestRepositoryEdgeCases:
     @pytest.mark.asyncio
     async def test_disabled_repository(self, test_username):
         """Test operations on disabled repository."""
-        manager = Mock()
+        manager = create_mock_manager()
         manager.is_authenticated.return_value = True
         mock_repo = Mock()
         mock_repo.disabled = True
@@ -357,7 +387,7 @@ class TestNetworkEdgeCases:
     @pytest.mark.asyncio
     async def test_timeout(self, test_username):
         """Test handling of network timeout."""
-        manager = Mock()
+        manager = create_mock_manager()
         manager.is_authenticated.return_value = True
         manager.get_repository.side_effect = Exception("Timeout")
         
@@ -372,7 +402,7 @@ class TestNetworkEdgeCases:
     @pytest.mark.asyncio
     async def test_connection_error(self, test_username):
         """Test handling of connection errors."""
-        manager = Mock()
+        manager = create_mock_manager()
         manager.is_authenticated.return_value = True
         manager.get_repository.side_effect = ConnectionError("Connection refused")
         
@@ -391,7 +421,7 @@ class TestBranchEdgeCases:
     @pytest.mark.asyncio
     async def test_create_branch_invalid_characters(self, test_username):
         """Test creating branch with invalid characters."""
-        manager = Mock()
+        manager = create_mock_manager()
         manager.is_authenticated.return_value = True
         mock_repo = Mock()
         mock_repo.default_branch = "main"
@@ -415,7 +445,7 @@ class TestBranchEdgeCases:
     @pytest.mark.asyncio
     async def test_branch_not_found(self, test_username):
         """Test operations on non-existent branch."""
-        manager = Mock()
+        manager = create_mock_manager()
         manager.is_authenticated.return_value = True
         mock_repo = Mock()
         mock_repo.get_branch.side_effect = GithubException(404, {"message": "Branch not found"})
@@ -437,7 +467,7 @@ class TestPullRequestEdgeCases:
     @pytest.mark.asyncio
     async def test_pr_no_commits_between_branches(self, test_username):
         """Test creating PR when branches are identical."""
-        manager = Mock()
+        manager = create_mock_manager()
         manager.is_authenticated.return_value = True
         mock_repo = Mock()
         mock_repo.create_pull.side_effect = GithubException(
@@ -459,7 +489,7 @@ class TestPullRequestEdgeCases:
     @pytest.mark.asyncio
     async def test_pr_already_exists(self, test_username):
         """Test creating PR when one already exists."""
-        manager = Mock()
+        manager = create_mock_manager()
         manager.is_authenticated.return_value = True
         mock_repo = Mock()
         mock_repo.create_pull.side_effect = GithubException(
@@ -485,7 +515,7 @@ class TestWorkflowEdgeCases:
     @pytest.mark.asyncio
     async def test_workflow_not_found(self, test_username):
         """Test triggering non-existent workflow."""
-        manager = Mock()
+        manager = create_mock_manager()
         manager.is_authenticated.return_value = True
         mock_repo = Mock()
         mock_repo.get_workflow.side_effect = UnknownObjectException(404, "Not Found")
@@ -502,7 +532,7 @@ class TestWorkflowEdgeCases:
     @pytest.mark.asyncio
     async def test_workflow_disabled(self, test_username):
         """Test triggering disabled workflow."""
-        manager = Mock()
+        manager = create_mock_manager()
         manager.is_authenticated.return_value = True
         mock_repo = Mock()
         mock_workflow = Mock()
@@ -529,7 +559,7 @@ class TestConcurrencyEdgeCases:
     @pytest.mark.asyncio
     async def test_concurrent_modifications(self, test_username):
         """Test handling of concurrent modifications."""
-        manager = Mock()
+        manager = create_mock_manager()
         manager.is_authenticated.return_value = True
         mock_repo = Mock()
         mock_repo.create_issue.side_effect = GithubException(
@@ -553,7 +583,7 @@ class TestLabelAssigneeEdgeCases:
     @pytest.mark.asyncio
     async def test_nonexistent_labels(self, test_username):
         """Test creating issue with non-existent labels."""
-        manager = Mock()
+        manager = create_mock_manager()
         manager.is_authenticated.return_value = True
         mock_repo = Mock()
         # GitHub creates labels automatically if they don't exist (depending on permissions)
@@ -578,7 +608,7 @@ class TestLabelAssigneeEdgeCases:
     @pytest.mark.asyncio
     async def test_invalid_assignees(self, test_username):
         """Test creating issue with invalid assignees."""
-        manager = Mock()
+        manager = create_mock_manager()
         manager.is_authenticated.return_value = True
         mock_repo = Mock()
         mock_repo.create_issue.side_effect = GithubException(
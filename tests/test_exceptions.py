@@ -74,3 +74,20 @@ def test_tool_execution_error():
     assert "test_tool" in str(error)
     assert "Something went wrong" in str(error)
     assert error.code == "TOOL_EXECUTION_ERROR"
+
+
+def test_error_codes_are_class_constants():
+    """Test each error's code comes from its class-level CODE."""
+    assert GitHubError("Test error").code == GitHubError.CODE == "GITHUB_ERROR"
+    assert AuthenticationError().code is AuthenticationError.CODE
+    assert RateLimitError().code is RateLimitError.CODE
+
+
+def test_rate_limit_error_formats_epoch_lazily():
+    """Test RateLimitError keeps the raw reset epoch and formats it on demand."""
+    from datetime import datetime
+
+    error = RateLimitError(1704067200)
+    assert error.reset_time == 1704067200
+    assert datetime.fromtimestamp(1704067200).isoformat() in str(error)
+    assert error.to_dict()["code"] == "RATE_LIMIT_EXCEEDED"
@@ -1,8 +1,8 @@
 """Comprehensive tests for GitHub Issues tools covering all scenarios."""
 
 import pytest
-from unittest.mock import Mock, AsyncMock, MagicMock, patch
-from tests.conftest import create_mock_datetime
+from unittest.mock import Mock, AsyncMock, MagicMock, PropertyMock, patch
+from tests.conftest import create_mock_datetime, create_mock_manager
 from github.GithubException import GithubException, UnknownObjectException, BadCredentialsException
 
 from amplifier_module_tool_github.tools.issues import (
@@ -24,7 +24,7 @@ class TestListIssuesToolComprehensive:
 
     def setup_method(self):
         """Set up test fixtures."""
-        self.manager = Mock()
+        self.manager = create_mock_manager()
         self.manager.is_authenticated.return_value = True
         self.tool = ListIssuesTool(self.manager)
 
@@ -195,6 +195,52 @@ class TestListIssuesToolComprehensive:
         assert result.success
         assert len(result.output["issues"]) == 1
 
+    @pytest.mark.asyncio
+    async def test_list_issues_skips_pull_requests_without_fetching(self, test_username):
+        """Test pull requests are told apart by URL, without completing each issue."""
+        mock_repo = Mock()
+        mock_issue = Mock()
+        mock_issue.number = 1
+        mock_issue.html_url = f"https://github.com/{test_username}/repo/issues/1"
+        mock_issue.created_at = mock_issue.updated_at = mock_issue.closed_at = None
+        mock_issue.labels = []
+        mock_issue.assignees = []
+        mock_pr = Mock()
+        mock_pr.number = 2
+        mock_pr.html_url = f"https://github.com/{test_username}/repo/pull/2"
+        for item in (mock_issue, mock_pr):
+            type(item).pull_request = PropertyMock()
+        mock_repo.get_issues.return_value = [mock_pr, mock_issue]
+        self.manager.get_repository.return_value = mock_repo
+
+        result = await self.tool.execute({"repository": f"{test_username}/repo"})
+
+        assert result.success
+        assert [issue["number"] for issue in result.output["issues"]] == [1]
+        type(mock_issue).pull_request.assert_not_called()
+        type(mock_pr).pull_request.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_list_issues_in_repo_named_pull(self):
+        """Test issues of a repo named "pull" are not mistaken for pull requests."""
+        mock_repo = Mock()
+        mock_issue = Mock()
+        mock_issue.number = 3
+        mock_issue.html_url = "https://github.com/acme/pull/issues/3"
+        mock_issue.created_at = mock_issue.updated_at = mock_issue.closed_at = None
+        mock_issue.labels = []
+        mock_issue.assignees = []
+        mock_pr = Mock()
+        mock_pr.number = 4
+        mock_pr.html_url = "https://github.com/acme/pull/pull/4"
+        mock_repo.get_issues.return_value = [mock_issue, mock_pr]
+        self.manager.get_repository.return_value = mock_repo
+
+        result = await self.tool.execute({"repository": "acme/pull"})
+
+        assert result.success
+        assert [issue["number"] for issue in result.output["issues"]] == [3]
+
     @pytest.mark.asyncio
     async def test_list_issues_empty_result(self, test_username):
         """Test listing issues when none exist."""
@@ -247,7 +293,7 @@ class TestGetIssueToolComprehensive:
 
     def setup_method(self):
         """Set up test fixtures."""
-        self.manager = Mock()
+        self.manager = create_mock_manager()
         self.manager.is_authenticated.return_value = True
         self.tool = GetIssueTool(self.manager)
 
@@ -270,7 +316,7 @@ class TestGetIssueToolComprehensive:
         mock_issue.assignees = []
         mock_issue.milestone = None
         mock_issue.comments = 5
-        mock_repo.get_issue.return_value = mock_issue
+        self.manager.get_issue.return_value = mock_issue
         self.manager.get_repository.return_value = mock_repo
 
         result = await self.tool.execute({"repository": f"{test_username}/repo", "issue_number": 42})
@@ -281,6 +327,39 @@ class TestGetIssueToolComprehensive:
         assert result.output["issue"]["state"] == "open"
         assert result.output["issue"]["comments_count"] == 5
 
+    @pytest.mark.asyncio
+    async def test_get_issue_with_comments(self, test_username):
+        """Test comments are fetched alongside the issue and capped by comments_limit."""
+        mock_issue = Mock()
+        mock_issue.pull_request = None
+        mock_issue.created_at = mock_issue.updated_at = mock_issue.closed_at = None
+        mock_issue.milestone = None
+        mock_issue.labels = []
+        mock_issue.assignees = []
+        mock_issue.comments = 3
+        comments = []
+        for number in range(3):
+            comment = Mock(id=number, body=f"Comment {number}", created_at=None, updated_at=None)
+            comment.user.login = test_username
+            comments.append(comment)
+        self.manager.get_issue.return_value = mock_issue
+        self.manager.get_issue_comments.return_value = comments
+        self.manager.get_repository.return_value = Mock()
+
+        result = await self.tool.execute({
+            "repository": f"{test_username}/repo",
+            "issue_number": 42,
+            "include_comments": True,
+            "comments_limit": 2
+        })
+
+        assert result.success
+        assert [c["id"] for c in result.output["issue"]["comments"]] == [0, 1]
+        self.manager.get_issue_comments.assert_called_once_with(
+            self.manager.get_repository.return_value, 42
+        )
+        mock_issue.get_comments.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_get_issue_with_labels(self, test_username):
         """Test getting an issue with labels."""
@@ -300,7 +379,7 @@ class TestGetIssueToolComprehensive:
         mock_issue.assignees = []
         mock_issue.milestone = None
         mock_issue.comments = 0
-        mock_repo.get_issue.return_value = mock_issue
+        self.manager.get_issue.return_value = mock_issue
         self.manager.get_repository.return_value = mock_repo
 
         result = await self.tool.execute({"repository": f"{test_username}/repo", "issue_number": 42})
@@ -328,7 +407,7 @@ class TestGetIssueToolComprehensive:
         mock_issue.assignees = [Mock(login=f"{test_username}"), Mock(login="collaborator")]
         mock_issue.milestone = None
         mock_issue.comments = 0
-        mock_repo.get_issue.return_value = mock_issue
+        self.manager.get_issue.return_value = mock_issue
         self.manager.get_repository.return_value = mock_repo
 
         result = await self.tool.execute({"repository": f"{test_username}/repo", "issue_number": 42})
@@ -358,7 +437,7 @@ class TestGetIssueToolComprehensive:
         mock_issue.assignees = []
         mock_issue.milestone = Mock(number=1, title="v1.0")
         mock_issue.comments = 0
-        mock_repo.get_issue.return_value = mock_issue
+        self.manager.get_issue.return_value = mock_issue
         self.manager.get_repository.return_value = mock_repo
 
         result = await self.tool.execute({"repository": f"{test_username}/repo", "issue_number": 42})
@@ -371,7 +450,7 @@ class TestGetIssueToolComprehensive:
     async def test_get_issue_not_found(self, test_username):
         """Test getting a non-existent issue."""
         mock_repo = Mock()
-        mock_repo.get_issue.side_effect = UnknownObjectException(404, "Not Found")
+        self.manager.get_issue.side_effect = UnknownObjectException(404, "Not Found")
         self.manager.get_repository.return_value = mock_repo
 
         result = await self.tool.execute({"repository": f"{test_username}/repo", "issue_number": 999})
@@ -394,7 +473,7 @@ class TestCreateIssueToolComprehensive:
 
     def setup_method(self):
         """Set up test fixtures."""
-        self.manager = Mock()
+        self.manager = create_mock_manager()
         self.manager.is_authenticated.return_value = True
         self.tool = CreateIssueTool(self.manager)
 
@@ -573,7 +652,7 @@ class TestUpdateIssueToolComprehensive:
 
     def setup_method(self):
         """Set up test fixtures."""
-        self.manager = Mock()
+        self.manager = create_mock_manager()
         self.manager.is_authenticated.return_value = True
         self.tool = UpdateIssueTool(self.manager)
 
@@ -688,7 +767,7 @@ class TestCommentIssueToolComprehensive:
 
     def setup_method(self):
         """Set up test fixtures."""
-        self.manager = Mock()
+        self.manager = create_mock_manager()
         self.manager.is_authenticated.return_value = True
         self.tool = CommentIssueTool(self.manager)
 
@@ -704,7 +783,7 @@ class TestCommentIssueToolComprehensive:
         mock_comment.html_url = "https://github.com/{test_username}/repo/issues/42#issuecomment-1"
         mock_comment.user.login = f"{test_username}"
         mock_issue.create_comment.return_value = mock_comment
-        mock_repo.get_issue.return_value = mock_issue
+        self.manager.get_issue.return_value = mock_issue
         self.manager.get_repository.return_value = mock_repo
 
         result = await self.tool.execute({
@@ -729,7 +808,7 @@ class TestCommentIssueToolComprehensive:
         mock_comment.html_url = "https://github.com/{test_username}/repo/issues/42#issuecomment-1"
         mock_comment.user.login = f"{test_username}"
         mock_issue.create_comment.return_value = mock_comment
-        mock_repo.get_issue.return_value = mock_issue
+        self.manager.get_issue.return_value = mock_issue
         self.manager.get_repository.return_value = mock_repo
 
         result = await self.tool.execute({
@@ -755,7 +834,7 @@ class TestCommentIssueToolComprehensive:
     async def test_add_comment_issue_not_found(self, test_username):
         """Test adding comment to non-existent issue."""
         mock_repo = Mock()
-        mock_repo.get_issue.side_effect = UnknownObjectException(404, "Not Found")
+        self.manager.get_issue.side_effect = UnknownObjectException(404, "Not Found")
         self.manager.get_repository.return_value = mock_repo
 
         result = await self.tool.execute({
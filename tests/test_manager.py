@@ -2,13 +2,34 @@
 
 import pytest
 import os
-from unittest.mock import Mock, patch, MagicMock
+import time
+from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from amplifier_module_tool_github.manager import GitHubManager
 from amplifier_module_tool_github.exceptions import (
     AuthenticationError,
     RepositoryNotFoundError,
 )
 
+CREATE_SUBPROCESS = "amplifier_module_tool_github.manager.asyncio.create_subprocess_exec"
+
+
+def mock_gh_process(returncode=0, stdout=b"", stderr=b""):
+    """Create a mock `gh auth token` subprocess."""
+    process = Mock()
+    process.returncode = returncode
+    process.communicate = AsyncMock(return_value=(stdout, stderr))
+    return process
+
+
+@pytest.fixture(autouse=True)
+def clear_class_caches():
+    """Reset the process-wide CLI token and verified user caches between tests."""
+    GitHubManager._cli_token_cache.clear()
+    GitHubManager._verified_users.clear()
+    yield
+    GitHubManager._cli_token_cache.clear()
+    GitHubManager._verified_users.clear()
+
 
 class TestGitHubManager:
     """Tests for GitHubManager class."""
@@ -43,6 +64,97 @@ class TestGitHubManager:
         await manager.stop()
         manager.client.close.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_run_offloads_to_thread(self, mock_github_config):
+        """Test that blocking calls run outside the event loop thread."""
+        import threading
+
+        manager = GitHubManager(mock_github_config)
+        caller_thread = threading.get_ident()
+        result = await manager.run(lambda x, y=0: (threading.get_ident(), x + y), 1, y=2)
+        assert result[1] == 3
+        assert result[0] != caller_thread
+
+    @pytest.mark.asyncio
+    async def test_run_waits_when_rate_limit_low(self, mock_github_config):
+        """Test that calls pause until reset when the remaining budget is low."""
+        import time
+
+        manager = GitHubManager(mock_github_config)
+        manager.client = Mock()
+        manager.client.requester.rate_limiting = (2, 5000)
+        manager.client.requester.rate_limiting_resettime = time.time() + 5
+
+        with patch("amplifier_module_tool_github.manager.asyncio.sleep") as mock_sleep:
+            await manager.run(lambda: None)
+            mock_sleep.assert_called_once()
+            assert 0 < mock_sleep.call_args[0][0] <= 5
+
+    @pytest.mark.asyncio
+    async def test_run_does_not_wait_with_budget(self, mock_github_config):
+        """Test that calls are not delayed while plenty of requests remain."""
+        manager = GitHubManager(mock_github_config)
+        manager.client = Mock()
+        manager.client.requester.rate_limiting = (4000, 5000)
+
+        with patch("amplifier_module_tool_github.manager.asyncio.sleep") as mock_sleep:
+            await manager.run(lambda: None)
+            mock_sleep.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_run_does_not_fetch_rate_limit_before_headers(self, mock_github_config):
+        """Test no /rate_limit request is made before any rate limit headers are seen."""
+        from github import Github
+
+        manager = GitHubManager(mock_github_config)
+        manager.client = Github(per_page=100)
+        manager.client.requester.requestJsonAndCheck = Mock(
+            side_effect=AssertionError("unexpected request")
+        )
+
+        with patch("amplifier_module_tool_github.manager.asyncio.sleep") as mock_sleep:
+            assert await manager.run(lambda: 42) == 42
+            mock_sleep.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_run_translates_rate_limit_rejection(self, mock_github_config):
+        """Test a rate limited response surfaces as RateLimitError with the reset time."""
+        from github.GithubException import RateLimitExceededException
+        from amplifier_module_tool_github.exceptions import RateLimitError
+
+        manager = GitHubManager(mock_github_config)
+
+        def call():
+            raise RateLimitExceededException(
+                403, {"message": "API rate limit exceeded"}, {"x-ratelimit-reset": "1704067200"}
+            )
+
+        with pytest.raises(RateLimitError) as exc_info:
+            await manager.run(call)
+        assert exc_info.value.reset_time == 1704067200
+
+    @pytest.mark.asyncio
+    async def test_run_caps_concurrent_calls(self, mock_github_config):
+        """Test that no more than max_concurrency calls are in flight at once."""
+        import asyncio
+        import threading
+
+        manager = GitHubManager({**mock_github_config, "max_concurrency": 2})
+        lock = threading.Lock()
+        active = peak = 0
+
+        def call():
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+
+        await asyncio.gather(*(manager.run(call) for _ in range(6)))
+        assert peak == 2
+
     def test_is_authenticated(self, mock_github_config):
         """Test authentication check."""
         manager = GitHubManager(mock_github_config)
@@ -50,47 +162,74 @@ class TestGitHubManager:
         manager.client = Mock()
         assert manager.is_authenticated()
 
-    def test_get_token_from_environment(self):
+    @pytest.mark.asyncio
+    async def test_get_token_from_environment(self):
         """Test getting token from environment variable."""
         with patch.dict(os.environ, {"GITHUB_TOKEN": "env_token_123"}):
             manager = GitHubManager({})
-            token = manager._get_token_from_sources()
+            token = await manager._get_token_from_sources()
             assert token == "env_token_123"
 
-    def test_get_token_from_gh_token_env(self):
+    @pytest.mark.asyncio
+    async def test_get_token_from_gh_token_env(self):
         """Test getting token from GH_TOKEN environment variable."""
         with patch.dict(os.environ, {"GH_TOKEN": "gh_env_token_456"}, clear=True):
             manager = GitHubManager({})
-            token = manager._get_token_from_sources()
+            token = await manager._get_token_from_sources()
             assert token == "gh_env_token_456"
 
-    def test_get_token_from_cli(self):
+    @pytest.mark.asyncio
+    async def test_get_token_from_cli(self):
         """Test getting token from GitHub CLI."""
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_result.stdout = "cli_token_789\n"
-        
-        with patch("subprocess.run", return_value=mock_result):
+        process = mock_gh_process(stdout=b"cli_token_789\n")
+
+        with patch(CREATE_SUBPROCESS, return_value=process) as mock_exec:
             manager = GitHubManager({"use_cli_auth": True})
-            token = manager._get_token_from_cli()
+            token = await manager._get_token_from_cli()
             assert token == "cli_token_789"
+            assert mock_exec.call_args[0][:3] == ("gh", "auth", "token")
+
+    @pytest.mark.asyncio
+    async def test_get_token_from_cli_is_cached(self):
+        """Test the CLI token is reused across managers without respawning gh."""
+        process = mock_gh_process(stdout=b"cli_token_789\n")
+
+        with patch(CREATE_SUBPROCESS, return_value=process) as mock_exec:
+            first = await GitHubManager({})._get_token_from_cli()
+            second = await GitHubManager({})._get_token_from_cli()
+            assert first == second == "cli_token_789"
+            mock_exec.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_get_token_from_cli_is_cached_per_host(self):
+        """Test enterprise hosts get their own CLI token and cache entry."""
+        process = mock_gh_process(stdout=b"cli_token_789\n")
 
-    def test_get_token_from_cli_not_authenticated(self):
+        with patch(CREATE_SUBPROCESS, return_value=process) as mock_exec:
+            await GitHubManager({})._get_token_from_cli()
+            enterprise = GitHubManager({"base_url": "https://ghe.example.com/api/v3"})
+            await enterprise._get_token_from_cli()
+            await enterprise._get_token_from_cli()
+
+            assert mock_exec.call_count == 2
+            assert mock_exec.call_args[0] == ("gh", "auth", "token", "--hostname", "ghe.example.com")
+
+    @pytest.mark.asyncio
+    async def test_get_token_from_cli_not_authenticated(self):
         """Test GitHub CLI not authenticated."""
-        mock_result = Mock()
-        mock_result.returncode = 1
-        mock_result.stderr = "not authenticated"
-        
-        with patch("subprocess.run", return_value=mock_result):
+        process = mock_gh_process(returncode=1, stderr=b"not authenticated")
+
+        with patch(CREATE_SUBPROCESS, return_value=process):
             manager = GitHubManager({"use_cli_auth": True})
-            token = manager._get_token_from_cli()
+            token = await manager._get_token_from_cli()
             assert token is None
 
-    def test_get_token_from_cli_not_installed(self):
+    @pytest.mark.asyncio
+    async def test_get_token_from_cli_not_installed(self):
         """Test GitHub CLI not installed."""
-        with patch("subprocess.run", side_effect=FileNotFoundError):
+        with patch(CREATE_SUBPROCESS, side_effect=FileNotFoundError):
             manager = GitHubManager({"use_cli_auth": True})
-            token = manager._get_token_from_cli()
+            token = await manager._get_token_from_cli()
             assert token is None
 
     def test_get_token_priority_config_over_env(self):
@@ -100,29 +239,28 @@ class TestGitHubManager:
             # Config token should be used directly, not from sources
             assert manager.token == "config_token"
 
-    def test_get_token_priority_env_over_cli(self):
+    @pytest.mark.asyncio
+    async def test_get_token_priority_env_over_cli(self):
         """Test that environment token takes priority over CLI."""
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_result.stdout = "cli_token"
-        
+        process = mock_gh_process(stdout=b"cli_token")
+
         with patch.dict(os.environ, {"GITHUB_TOKEN": "env_token"}):
-            with patch("subprocess.run", return_value=mock_result):
+            with patch(CREATE_SUBPROCESS, return_value=process):
                 manager = GitHubManager({})
-                token = manager._get_token_from_sources()
+                token = await manager._get_token_from_sources()
                 assert token == "env_token"
 
-    def test_cli_auth_disabled(self):
+    @pytest.mark.asyncio
+    async def test_cli_auth_disabled(self):
         """Test that CLI auth can be disabled."""
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_result.stdout = "cli_token"
-        
-        with patch("subprocess.run", return_value=mock_result) as mock_run:
-            manager = GitHubManager({"use_cli_auth": False})
-            token = manager._get_token_from_sources()
-            assert token is None
-            mock_run.assert_not_called()
+        process = mock_gh_process(stdout=b"cli_token")
+
+        with patch.dict(os.environ, {}, clear=True):
+            with patch(CREATE_SUBPROCESS, return_value=process) as mock_exec:
+                manager = GitHubManager({"use_cli_auth": False})
+                token = await manager._get_token_from_sources()
+                assert token is None
+                mock_exec.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_start_with_environment_token(self):
@@ -142,6 +280,68 @@ class TestGitHubManager:
                     assert manager.token == "test_token"
                     assert manager.client is not None
                     mock_auth_class.Token.assert_called_once_with("test_token")
+                    assert mock_github_class.call_args.kwargs["pool_size"] == 64
+
+    @pytest.mark.asyncio
+    async def test_restart_reuses_verified_token(self, mock_github_config):
+        """Test a second start with the same token skips the GET /user verification."""
+        with patch("amplifier_module_tool_github.manager.Github") as mock_github_class:
+            first_client = Mock()
+            first_client.get_user.return_value.login = "testuser"
+            first_client.get_user.return_value.raw_data = {"login": "testuser"}
+            second_client = Mock()
+            second_client.create_from_raw_data.return_value.login = "testuser"
+            mock_github_class.side_effect = [first_client, second_client]
+
+            await GitHubManager(mock_github_config).start()
+            manager = GitHubManager(mock_github_config)
+            await manager.start()
+
+            second_client.get_user.assert_not_called()
+            assert second_client.create_from_raw_data.call_args[0][1] == {"login": "testuser"}
+            assert manager.github_user.login == "testuser"
+
+    def test_client_retries_rate_limit_responses(self, mock_github_config):
+        """Test that clients retry 429 and 5xx responses, but 5xx only for idempotent methods."""
+        manager = GitHubManager({**mock_github_config, "max_retries": 3})
+        with patch("amplifier_module_tool_github.manager.Github") as mock_github:
+            manager._create_client("test_token")
+
+        retry = mock_github.call_args.kwargs["retry"]
+        assert retry.total == 3
+        assert retry.is_retry("GET", 429)
+        assert retry.is_retry("GET", 502)
+        assert retry.is_retry("POST", 429)
+        assert retry.is_retry("POST", 403)
+        assert not retry.is_retry("POST", 502)
+        assert not retry.is_retry("PATCH", 503)
+        assert not retry.is_retry("GET", 404)
+
+    def test_client_retries_rate_limited_post(self, mock_github_config):
+        """Test a POST rejected with 429 is sent again, while a 502 is not."""
+        from urllib3 import HTTPResponse
+        from urllib3.connectionpool import HTTPConnectionPool
+
+        manager = GitHubManager({**mock_github_config, "max_retries": 3})
+        with patch("amplifier_module_tool_github.manager.Github") as mock_github:
+            manager._create_client("test_token")
+        retry = mock_github.call_args.kwargs["retry"]
+
+        def send(*statuses):
+            responses = iter(statuses)
+            pool = HTTPConnectionPool("api.github.com")
+            with patch.object(
+                HTTPConnectionPool, "_make_request",
+                side_effect=lambda *a, **k: HTTPResponse(
+                    body=b"{}", status=next(responses), headers={"Retry-After": "0"},
+                    preload_content=False,
+                ),
+            ) as make_request:
+                response = pool.urlopen("POST", "/repos/o/r/dispatches", body=b"{}", retries=retry)
+            return response.status, make_request.call_count
+
+        assert send(429, 204) == (204, 2)
+        assert send(502, 204) == (502, 1)
 
     @pytest.mark.asyncio
     async def test_start_no_auth_no_prompt(self):
@@ -151,6 +351,275 @@ class TestGitHubManager:
             await manager.start()
             assert manager.client is None
 
+    def test_get_repository_revalidates_cached_object(self, mock_github_config):
+        """Test repeat lookups reuse the cached object via a conditional request."""
+        manager = GitHubManager(mock_github_config)
+        manager.client = Mock()
+        mock_repo = Mock()
+        manager.client.get_repo.return_value = mock_repo
+
+        assert manager.get_repository("owner/repo") is mock_repo
+        assert manager.get_repository("Owner/Repo") is mock_repo
+
+        manager.client.get_repo.assert_called_once_with("owner/repo")
+        mock_repo.update.assert_called_once()
+
+    def test_get_workflow_run_revalidates_cached_object(self, mock_github_config):
+        """Test repeat workflow run lookups use a conditional request."""
+        manager = GitHubManager(mock_github_config)
+        mock_repo = Mock()
+        mock_repo.full_name = "owner/repo"
+        mock_run = Mock()
+        mock_repo.get_workflow_run.return_value = mock_run
+
+        assert manager.get_workflow_run(mock_repo, 42) is mock_run
+        assert manager.get_workflow_run(mock_repo, 42) is mock_run
+
+        mock_repo.get_workflow_run.assert_called_once_with(42)
+        mock_run.update.assert_called_once()
+
+    def test_get_comparison_revalidates_cached_object(self, mock_github_config):
+        """Test repeat comparisons of the same refs use a conditional request."""
+        manager = GitHubManager(mock_github_config)
+        mock_repo = Mock()
+        mock_repo.full_name = "owner/repo"
+        mock_comparison = Mock()
+        mock_repo.compare.return_value = mock_comparison
+
+        assert manager.get_comparison(mock_repo, "main", "feature") is mock_comparison
+        assert manager.get_comparison(mock_repo, "main", "feature") is mock_comparison
+
+        mock_repo.compare.assert_called_once_with("main", "feature")
+        mock_comparison.update.assert_called_once()
+
+    def test_get_commit_by_full_sha_skips_revalidation(self, mock_github_config):
+        """Test a commit looked up by full SHA is served from the cache."""
+        manager = GitHubManager(mock_github_config)
+        mock_repo = Mock()
+        mock_repo.full_name = "owner/repo"
+        mock_commit = Mock()
+        mock_repo.get_commit.return_value = mock_commit
+        sha = "a" * 40
+
+        assert manager.get_commit(mock_repo, sha) is mock_commit
+        assert manager.get_commit(mock_repo, sha) is mock_commit
+
+        mock_repo.get_commit.assert_called_once_with(sha)
+        mock_commit.update.assert_not_called()
+
+    def test_get_commit_by_ref_follows_moved_branch(self, mock_github_config):
+        """Test a commit looked up by a movable ref returns the ref's new head."""
+        manager = GitHubManager(mock_github_config)
+        mock_repo = Mock()
+        mock_repo.full_name = "owner/repo"
+        old_head, new_head = Mock(sha="a" * 40), Mock(sha="b" * 40)
+        # The old head's own URL would answer 304 forever
+        old_head.update.return_value = False
+        mock_repo.get_commit.side_effect = [old_head, new_head]
+
+        assert manager.get_commit(mock_repo, "main") is old_head
+        assert manager.get_commit(mock_repo, "main") is new_head
+
+        assert mock_repo.get_commit.call_count == 2
+        old_head.update.assert_not_called()
+
+    def test_get_issue_revalidates_cached_object(self, mock_github_config):
+        """Test repeat issue lookups use a conditional request."""
+        manager = GitHubManager(mock_github_config)
+        mock_repo = Mock()
+        mock_repo.full_name = "owner/repo"
+        mock_issue = Mock()
+        mock_repo.get_issue.return_value = mock_issue
+
+        assert manager.get_issue(mock_repo, 7) is mock_issue
+        assert manager.get_issue(mock_repo, 7) is mock_issue
+
+        mock_repo.get_issue.assert_called_once_with(number=7)
+        mock_issue.update.assert_called_once()
+
+    def test_get_issue_comments_builds_listing_from_number(self, mock_github_config):
+        """Test the comments listing is addressed by issue number without loading the issue."""
+        manager = GitHubManager(mock_github_config)
+        mock_repo = Mock()
+        mock_repo.url = "https://api.github.com/repos/owner/repo"
+        mock_repo.requester.per_page = 30
+        mock_repo.requester.requestJsonAndCheck.return_value = ({}, [{"id": 9, "body": "Hi"}])
+
+        comments = manager.get_issue_comments(mock_repo, 7)
+
+        assert [comment.id for comment in comments.get_page(0)] == [9]
+        mock_repo.get_issue.assert_not_called()
+        call = mock_repo.requester.requestJsonAndCheck.call_args
+        assert call.args == ("GET", "https://api.github.com/repos/owner/repo/issues/7/comments")
+
+    def test_get_workflow_run_jobs_builds_listing_from_run_id(self, mock_github_config):
+        """Test the jobs listing is addressed by run ID without loading the run."""
+        manager = GitHubManager(mock_github_config)
+        mock_repo = Mock()
+        mock_repo.url = "https://api.github.com/repos/owner/repo"
+        mock_repo.requester.per_page = 100
+        mock_repo.requester.requestJsonAndCheck.return_value = (
+            {}, {"total_count": 1, "jobs": [{"id": 5, "name": "build"}]}
+        )
+
+        jobs = manager.get_workflow_run_jobs(mock_repo, 42)
+
+        assert [job.id for job in jobs.get_page(0)] == [5]
+        mock_repo.get_workflow_run.assert_not_called()
+        call = mock_repo.requester.requestJsonAndCheck.call_args
+        assert call.args == ("GET", "https://api.github.com/repos/owner/repo/actions/runs/42/jobs")
+
+    def test_get_workflows_revalidates_with_etag(self, mock_github_config):
+        """Test a repeat workflow listing sends the stored ETag and keeps items on 304."""
+        manager = GitHubManager(mock_github_config)
+        mock_repo = Mock()
+        mock_repo.full_name = "owner/repo"
+        mock_repo.url = "https://api.github.com/repos/owner/repo"
+        mock_repo.requester.requestJsonAndCheck.side_effect = [
+            ({"etag": 'W/"abc"'}, {"total_count": 1, "workflows": [{"id": 7, "name": "CI"}]}),
+            ({}, None),
+        ]
+
+        first = manager.get_workflows(mock_repo)
+        second = manager.get_workflows(mock_repo)
+
+        assert [w.id for w in first] == [7]
+        assert second is first
+        calls = mock_repo.requester.requestJsonAndCheck.call_args_list
+        assert calls[0].kwargs["headers"] is None
+        assert calls[1].kwargs["headers"] == {"If-None-Match": 'W/"abc"'}
+
+    def test_get_repository_shares_concurrent_lookups(self, mock_github_config):
+        """Test concurrent lookups of the same repository share one request."""
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        manager = GitHubManager(mock_github_config)
+        manager.client = Mock()
+        mock_repo = Mock()
+        release = threading.Event()
+
+        def slow_get_repo(name):
+            release.wait(timeout=5)
+            return mock_repo
+
+        manager.client.get_repo.side_effect = slow_get_repo
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(manager.get_repository, "owner/repo") for _ in range(4)]
+            # Let every caller reach the in-flight request before it completes
+            while not manager._inflight:
+                time.sleep(0.01)
+            time.sleep(0.05)
+            release.set()
+            results = [future.result() for future in futures]
+
+        assert all(result is mock_repo for result in results)
+        manager.client.get_repo.assert_called_once_with("owner/repo")
+        assert manager._inflight == {}
+
+    def test_get_repository_cache_is_bounded(self):
+        """Test the least recently used repository is evicted past cache_size."""
+        manager = GitHubManager({"token": "test", "cache_size": 2})
+        manager.client = Mock()
+        manager.client.get_repo.side_effect = lambda name: Mock(name=name)
+
+        for name in ("o/a", "o/b", "o/c"):
+            manager.get_repository(name)
+
+        assert list(manager._object_cache) == ["o/b", "o/c"]
+
+    def test_get_rate_limit_reports_epoch_reset(self, mock_github_config):
+        """Test the core rate limit is read from /rate_limit with an epoch reset."""
+        manager = GitHubManager(mock_github_config)
+        manager.client = Mock()
+        manager.client.requester.requestJsonAndCheck.return_value = (
+            {}, {"resources": {"core": {"limit": 5000, "remaining": 4990, "reset": 1704067200}}}
+        )
+
+        assert manager.get_rate_limit() == {
+            "authenticated": True,
+            "limit": 5000,
+            "remaining": 4990,
+            "reset": 1704067200,
+            "used": 10,
+        }
+        manager.client.requester.requestJsonAndCheck.assert_called_once_with("GET", "/rate_limit")
+
+    def test_get_rate_limit_reuses_recent_answer(self, mock_github_config):
+        """Test repeated rate limit queries within the TTL make one request."""
+        manager = GitHubManager(mock_github_config)
+        manager.client = Mock()
+        manager.client.requester.requestJsonAndCheck.return_value = (
+            {}, {"resources": {"core": {"limit": 5000, "remaining": 4990, "reset": 1704067200}}}
+        )
+
+        first = manager.get_rate_limit()
+        first["remaining"] = 0
+        assert manager.get_rate_limit()["remaining"] == 4990
+        manager.client.requester.requestJsonAndCheck.assert_called_once()
+
+    def test_graphql_returns_data(self, mock_github_config):
+        """Test GraphQL queries go through the client's requester."""
+        manager = GitHubManager(mock_github_config)
+        manager.client = Mock()
+        manager.client.requester.graphql_query.return_value = (
+            {}, {"data": {"viewer": {"login": "octocat"}}}
+        )
+
+        data = manager.graphql("query { viewer { login } }")
+
+        assert data == {"viewer": {"login": "octocat"}}
+        manager.client.requester.graphql_query.assert_called_once_with(
+            "query { viewer { login } }", {}
+        )
+
+    def test_token_pool_from_config(self):
+        """Test the first pooled token becomes the primary token."""
+        manager = GitHubManager({"tokens": ["tok_a", "tok_b", "tok_a"]})
+        assert manager.token == "tok_a"
+        assert manager._extra_tokens == ["tok_b"]
+
+    def test_token_pool_picks_client_with_most_remaining(self, mock_github_config):
+        """Test requests go to the pooled client with the most remaining quota."""
+        manager = GitHubManager(mock_github_config)
+        low, high = Mock(), Mock()
+        low.requester.rate_limiting = (10, 5000)
+        high.requester.rate_limiting = (4000, 5000)
+        manager.client = low
+        manager._clients = [low, high]
+
+        manager.get_repository("owner/repo")
+
+        high.get_repo.assert_called_once_with("owner/repo")
+        low.get_repo.assert_not_called()
+
+    def test_token_pool_tries_client_without_rate_limit_headers(self, mock_github_config):
+        """Test a pooled client that has not seen rate limit headers is picked."""
+        manager = GitHubManager(mock_github_config)
+        seen, unseen = Mock(), Mock()
+        seen.requester.rate_limiting = (4000, 5000)
+        unseen.requester.rate_limiting = (-1, -1)
+        manager.client = seen
+        manager._clients = [seen, unseen]
+
+        assert manager._pick_client() is unseen
+
+    def test_get_repository_rate_limited(self, mock_github_config):
+        """Test rate limit errors carry the reset time from the response headers."""
+        from github.GithubException import RateLimitExceededException
+        from amplifier_module_tool_github.exceptions import RateLimitError
+
+        manager = GitHubManager(mock_github_config)
+        manager.client = Mock()
+        manager.client.get_repo.side_effect = RateLimitExceededException(
+            403, {"message": "API rate limit exceeded"}, {"x-ratelimit-reset": "1704067200"}
+        )
+
+        with pytest.raises(RateLimitError) as exc_info:
+            manager.get_repository("owner/repo")
+        assert exc_info.value.reset_time == 1704067200
+
 
 # Note: Additional tests would require mocking PyGithub more extensively
 # or using integration tests with a test GitHub instance
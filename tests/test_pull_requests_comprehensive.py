@@ -2,7 +2,7 @@
 
 import pytest
 from unittest.mock import Mock, AsyncMock, MagicMock, patch
-from tests.conftest import create_mock_datetime
+from tests.conftest import create_mock_datetime, create_mock_manager
 from github.GithubException import GithubException, UnknownObjectException
 
 from amplifier_module_tool_github.tools.pull_requests import (
@@ -20,7 +20,7 @@ class TestListPullRequestsToolComprehensive:
 
     def setup_method(self):
         """Set up test fixtures."""
-        self.manager = Mock()
+        self.manager = create_mock_manager()
         self.manager.is_authenticated.return_value = True
         self.tool = ListPullRequestsTool(self.manager)
 
@@ -198,7 +198,7 @@ class TestGetPullRequestToolComprehensive:
 
     def setup_method(self):
         """Set up test fixtures."""
-        self.manager = Mock()
+        self.manager = create_mock_manager()
         self.manager.is_authenticated.return_value = True
         self.tool = GetPullRequestTool(self.manager)
 
@@ -410,7 +410,7 @@ class TestCreatePullRequestToolComprehensive:
 
     def setup_method(self):
         """Set up test fixtures."""
-        self.manager = Mock()
+        self.manager = create_mock_manager()
         self.manager.is_authenticated.return_value = True
         self.tool = CreatePullRequestTool(self.manager)
 
@@ -561,7 +561,7 @@ class TestUpdatePullRequestToolComprehensive:
 
     def setup_method(self):
         """Set up test fixtures."""
-        self.manager = Mock()
+        self.manager = create_mock_manager()
         self.manager.is_authenticated.return_value = True
         self.tool = UpdatePullRequestTool(self.manager)
 
@@ -626,7 +626,7 @@ class TestMergePullRequestToolComprehensive:
 
     def setup_method(self):
         """Set up test fixtures."""
-        self.manager = Mock()
+        self.manager = create_mock_manager()
         self.manager.is_authenticated.return_value = True
         self.tool = MergePullRequestTool(self.manager)
 
@@ -738,7 +738,7 @@ class TestReviewPullRequestToolComprehensive:
 
     def setup_method(self):
         """Set up test fixtures."""
-        self.manager = Mock()
+        self.manager = create_mock_manager()
         self.manager.is_authenticated.return_value = True
         self.tool = ReviewPullRequestTool(self.manager)
 
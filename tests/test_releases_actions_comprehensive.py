@@ -2,7 +2,7 @@
 
 import pytest
 from unittest.mock import Mock, AsyncMock, MagicMock, patch
-from tests.conftest import create_mock_datetime
+from tests.conftest import create_mock_datetime, create_mock_manager
 from github.GithubException import GithubException, UnknownObjectException
 
 from amplifier_module_tool_github.tools.releases import (
@@ -19,6 +19,7 @@ from amplifier_module_tool_github.tools.actions import (
     ListWorkflowRunsTool,
     GetWorkflowRunTool,
     CancelWorkflowRunTool,
+    CancelWorkflowRunsTool,
     RerunWorkflowTool,
 )
 
@@ -28,7 +29,7 @@ class TestListReleasesToolComprehensive:
 
     def setup_method(self):
         """Set up test fixtures."""
-        self.manager = Mock()
+        self.manager = create_mock_manager()
         self.manager.is_authenticated.return_value = True
         self.tool = ListReleasesTool(self.manager)
 
@@ -112,13 +113,44 @@ class TestListReleasesToolComprehensive:
         assert result.success
         assert result.output["releases"][0]["prerelease"] is True
 
+    @pytest.mark.asyncio
+    async def test_list_releases_fetches_remaining_pages_together(self, test_username):
+        """Test that pages after the first are requested concurrently and stop at a short page."""
+        from github.PaginatedList import PaginatedList
+
+        def make_release(number):
+            release = Mock()
+            release.id = number
+            release.tag_name = f"v{number}"
+            release.draft = False
+            release.prerelease = False
+            release.created_at = None
+            release.published_at = None
+            release.get_assets.return_value = []
+            return release
+
+        releases = [make_release(n) for n in range(70)]
+        paginated = Mock(spec=PaginatedList)
+        paginated.get_page.side_effect = lambda page: releases[page * 30:(page + 1) * 30]
+        mock_repo = Mock()
+        mock_repo.get_releases.return_value = paginated
+        self.manager.get_repository.return_value = mock_repo
+
+        result = await self.tool.execute({"repository": f"{test_username}/repo", "limit": 100})
+
+        assert result.success
+        assert result.output["count"] == 70
+        assert [r["id"] for r in result.output["releases"]] == list(range(70))
+        # Page 0 first, then pages 1-3 in one batch; the short page 2 ends the list
+        assert [c.args[0] for c in paginated.get_page.call_args_list] == [0, 1, 2, 3]
+
 
 class TestGetReleaseToolComprehensive:
     """Comprehensive tests for GetReleaseTool."""
 
     def setup_method(self):
         """Set up test fixtures."""
-        self.manager = Mock()
+        self.manager = create_mock_manager()
         self.manager.is_authenticated.return_value = True
         self.tool = GetReleaseTool(self.manager)
 
@@ -270,7 +302,7 @@ class TestCreateReleaseToolComprehensive:
 
     def setup_method(self):
         """Set up test fixtures."""
-        self.manager = Mock()
+        self.manager = create_mock_manager()
         self.manager.is_authenticated.return_value = True
         self.tool = CreateReleaseTool(self.manager)
 
@@ -362,7 +394,7 @@ class TestListTagsToolComprehensive:
 
     def setup_method(self):
         """Set up test fixtures."""
-        self.manager = Mock()
+        self.manager = create_mock_manager()
         self.manager.is_authenticated.return_value = True
         self.tool = ListTagsTool(self.manager)
 
@@ -388,7 +420,7 @@ class TestCreateTagToolComprehensive:
 
     def setup_method(self):
         """Set up test fixtures."""
-        self.manager = Mock()
+        self.manager = create_mock_manager()
         self.manager.is_authenticated.return_value = True
         self.tool = CreateTagTool(self.manager)
 
@@ -423,7 +455,7 @@ class TestListWorkflowsToolComprehensive:
 
     def setup_method(self):
         """Set up test fixtures."""
-        self.manager = Mock()
+        self.manager = create_mock_manager()
         self.manager.is_authenticated.return_value = True
         self.tool = ListWorkflowsTool(self.manager)
 
@@ -438,7 +470,7 @@ class TestListWorkflowsToolComprehensive:
         mock_workflow.state = "active"
         mock_workflow.created_at = create_mock_datetime("2024-01-01")
         mock_workflow.updated_at = create_mock_datetime("2024-01-02")
-        mock_repo.get_workflows.return_value = [mock_workflow]
+        self.manager.get_workflows.return_value = [mock_workflow]
         self.manager.get_repository.return_value = mock_repo
 
         result = await self.tool.execute({"repository": f"{test_username}/repo"})
@@ -463,7 +495,7 @@ class TestListWorkflowsToolComprehensive:
         mock_deploy.path = ".github/workflows/deploy.yml"
         mock_deploy.state = "active"
         
-        mock_repo.get_workflows.return_value = [mock_ci, mock_deploy]
+        self.manager.get_workflows.return_value = [mock_ci, mock_deploy]
         self.manager.get_repository.return_value = mock_repo
 
         result = await self.tool.execute({"repository": f"{test_username}/repo"})
@@ -477,7 +509,7 @@ class TestGetWorkflowToolComprehensive:
 
     def setup_method(self):
         """Set up test fixtures."""
-        self.manager = Mock()
+        self.manager = create_mock_manager()
         self.manager.is_authenticated.return_value = True
         self.tool = GetWorkflowTool(self.manager)
 
@@ -490,7 +522,7 @@ class TestGetWorkflowToolComprehensive:
         mock_workflow.name = "CI"
         mock_workflow.path = ".github/workflows/ci.yml"
         mock_workflow.state = "active"
-        mock_repo.get_workflow.return_value = mock_workflow
+        self.manager.get_workflow.return_value = mock_workflow
         self.manager.get_repository.return_value = mock_repo
 
         result = await self.tool.execute({
@@ -510,7 +542,7 @@ class TestGetWorkflowToolComprehensive:
         mock_workflow.name = "CI"
         mock_workflow.path = ".github/workflows/ci.yml"
         mock_workflow.state = "active"
-        mock_repo.get_workflow.return_value = mock_workflow
+        self.manager.get_workflow.return_value = mock_workflow
         self.manager.get_repository.return_value = mock_repo
 
         result = await self.tool.execute({
@@ -526,7 +558,7 @@ class TestTriggerWorkflowToolComprehensive:
 
     def setup_method(self):
         """Set up test fixtures."""
-        self.manager = Mock()
+        self.manager = create_mock_manager()
         self.manager.is_authenticated.return_value = True
         self.tool = TriggerWorkflowTool(self.manager)
 
@@ -592,13 +624,37 @@ class TestTriggerWorkflowToolComprehensive:
         
         assert result.success
 
+    @pytest.mark.asyncio
+    async def test_trigger_workflow_errors_by_status(self, test_username):
+        """Test that API errors map to the tool's error codes."""
+        mock_repo = Mock()
+        mock_workflow = Mock()
+        mock_repo.get_workflow.return_value = mock_workflow
+        self.manager.get_repository.return_value = mock_repo
+        input_data = {"repository": f"{test_username}/repo", "workflow_id": "ci.yml", "ref": "main"}
+
+        mock_workflow.create_dispatch.side_effect = GithubException(403, {"message": "Forbidden"})
+        result = await self.tool.execute(input_data)
+        assert result.error["code"] == "PERMISSION_DENIED"
+
+        mock_workflow.create_dispatch.side_effect = GithubException(422, {"message": "Unexpected inputs"})
+        result = await self.tool.execute(input_data)
+        assert result.error["code"] == "VALIDATION_ERROR"
+
+        mock_repo.get_workflow.side_effect = UnknownObjectException(404, {"message": "Not Found"})
+        result = await self.tool.execute(input_data)
+        assert result.error == {
+            "message": f"Workflow 'ci.yml' not found in repository '{test_username}/repo'",
+            "code": "WORKFLOW_NOT_FOUND"
+        }
+
 
 class TestListWorkflowRunsToolComprehensive:
     """Comprehensive tests for ListWorkflowRunsTool."""
 
     def setup_method(self):
         """Set up test fixtures."""
-        self.manager = Mock()
+        self.manager = create_mock_manager()
         self.manager.is_authenticated.return_value = True
         self.tool = ListWorkflowRunsTool(self.manager)
 
@@ -642,13 +698,93 @@ class TestListWorkflowRunsToolComprehensive:
         
         assert result.success
 
+    @pytest.mark.asyncio
+    async def test_list_workflow_runs_filters_conclusion_server_side(self, test_username):
+        """Test that a conclusion filter is sent to GitHub as the status parameter."""
+        mock_repo = Mock()
+        mock_run = Mock()
+        mock_run.conclusion = "failure"
+        mock_run.created_at = None
+        mock_run.updated_at = None
+        mock_run.run_started_at = None
+        mock_repo.get_workflow_runs.return_value = [mock_run]
+        self.manager.get_repository.return_value = mock_repo
+
+        result = await self.tool.execute({
+            "repository": f"{test_username}/repo",
+            "conclusion": "failure"
+        })
+
+        assert result.success
+        assert result.output["count"] == 1
+        mock_repo.get_workflow_runs.assert_called_once_with(status="failure", branch=None, actor=None)
+
+    @pytest.mark.asyncio
+    async def test_list_workflow_runs_projects_fields(self, test_username):
+        """Test that fields limits each run to the requested keys."""
+        mock_repo = Mock()
+        mock_run = Mock()
+        mock_run.id = 7
+        mock_run.status = "completed"
+        mock_repo.get_workflow_runs.return_value = [mock_run]
+        self.manager.get_repository.return_value = mock_repo
+
+        result = await self.tool.execute({
+            "repository": f"{test_username}/repo",
+            "fields": ["id", "status"]
+        })
+
+        assert result.success
+        assert result.output["runs"] == [{"id": 7, "status": "completed"}]
+
+    @pytest.mark.asyncio
+    async def test_list_workflow_runs_rejects_unknown_fields(self, test_username):
+        """Test that an unknown field name is rejected before calling GitHub."""
+        result = await self.tool.execute({
+            "repository": f"{test_username}/repo",
+            "fields": ["id", "bogus"]
+        })
+
+        assert not result.success
+        assert result.error["code"] == "INVALID_FIELD"
+        self.manager.get_repository.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_list_workflow_runs_workflow_not_found(self, test_username):
+        """Test a missing workflow is reported as WORKFLOW_NOT_FOUND."""
+        mock_repo = Mock()
+        mock_repo.get_workflow.side_effect = GithubException(404, {"message": "Not Found"})
+        self.manager.get_repository.return_value = mock_repo
+
+        result = await self.tool.execute({
+            "repository": f"{test_username}/repo",
+            "workflow_id": "ci.yml"
+        })
+
+        assert not result.success
+        assert result.error["code"] == "WORKFLOW_NOT_FOUND"
+        assert "ci.yml" in result.error["message"]
+
+    @pytest.mark.asyncio
+    async def test_list_workflow_runs_not_found_without_workflow(self, test_username):
+        """Test a 404 without a workflow_id is not reported as a missing workflow."""
+        mock_repo = Mock()
+        mock_repo.get_workflow_runs.side_effect = GithubException(404, {"message": "Not Found"})
+        self.manager.get_repository.return_value = mock_repo
+
+        result = await self.tool.execute({"repository": f"{test_username}/repo"})
+
+        assert not result.success
+        assert result.error["code"] == "GITHUB_API_ERROR"
+        assert "None" not in result.error["message"]
+
 
 class TestGetWorkflowRunToolComprehensive:
     """Comprehensive tests for GetWorkflowRunTool."""
 
     def setup_method(self):
         """Set up test fixtures."""
-        self.manager = Mock()
+        self.manager = create_mock_manager()
         self.manager.is_authenticated.return_value = True
         self.tool = GetWorkflowRunTool(self.manager)
 
@@ -674,9 +810,9 @@ class TestGetWorkflowRunToolComprehensive:
         mock_run.logs_url = "https://github.com/{test_username}/repo/actions/runs/12345/logs"
         mock_run.cancel_url = "https://github.com/{test_username}/repo/actions/runs/12345/cancel"
         mock_run.rerun_url = "https://github.com/{test_username}/repo/actions/runs/12345/rerun"
-        mock_run.jobs.return_value = []
-        mock_repo.get_workflow_run.return_value = mock_run
         self.manager.get_repository.return_value = mock_repo
+        self.manager.get_workflow_run.return_value = mock_run
+        self.manager.get_workflow_run_jobs.return_value = []
 
         result = await self.tool.execute({
             "repository": f"{test_username}/repo",
@@ -686,13 +822,103 @@ class TestGetWorkflowRunToolComprehensive:
         assert result.success
         assert result.output["run"]["id"] == 12345
 
+    @pytest.mark.asyncio
+    async def test_get_workflow_run_fetches_job_pages_together(self, test_username):
+        """Test that job pages after the first are requested together until a short page."""
+        from github.PaginatedList import PaginatedList
+
+        def make_job(number):
+            job = Mock()
+            job.id = number
+            job.started_at = None
+            job.completed_at = None
+            job.steps = []
+            return job
+
+        jobs = [make_job(n) for n in range(65)]
+        paginated = Mock(spec=PaginatedList)
+        paginated.get_page.side_effect = lambda page: jobs[page * 30:(page + 1) * 30]
+        mock_run = Mock()
+        mock_run.created_at = None
+        mock_run.updated_at = None
+        mock_run.run_started_at = None
+        self.manager.get_repository.return_value = Mock()
+        self.manager.get_workflow_run.return_value = mock_run
+        self.manager.get_workflow_run_jobs.return_value = paginated
+
+        result = await self.tool.execute({"repository": f"{test_username}/repo", "run_id": 1})
+
+        assert result.success
+        assert result.output["run"]["jobs_count"] == 65
+        assert [j["id"] for j in result.output["run"]["jobs"]] == list(range(65))
+        assert [c.args[0] for c in paginated.get_page.call_args_list] == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_get_workflow_runs_in_bulk(self, test_username):
+        """Test that run_ids looks up each run and reports misses per run."""
+        def get_run(repo, run_id):
+            if run_id == 2:
+                raise UnknownObjectException(404, {"message": "Not Found"})
+            run = Mock()
+            run.id = run_id
+            run.created_at = None
+            run.updated_at = None
+            run.run_started_at = None
+            return run
+
+        self.manager.get_repository.return_value = Mock()
+        self.manager.get_workflow_run.side_effect = get_run
+
+        result = await self.tool.execute({
+            "repository": f"{test_username}/repo",
+            "run_ids": [1, 2, 3],
+            "include_jobs": False
+        })
+
+        assert result.success
+        assert result.output["found"] == 2
+        assert result.output["failed"] == 1
+        assert [r["id"] for r in result.output["runs"]] == [1, 2, 3]
+        assert result.output["runs"][1]["error"]["code"] == "RUN_NOT_FOUND"
+
+    @pytest.mark.asyncio
+    async def test_get_workflow_runs_in_bulk_rate_limited_run(self, test_username):
+        """Test a rate limited lookup is reported for its run without failing the others."""
+        from amplifier_module_tool_github.exceptions import RateLimitError
+
+        def get_run(repo, run_id):
+            if run_id == 2:
+                raise RateLimitError(1704067200)
+            run = Mock()
+            run.id = run_id
+            run.created_at = None
+            run.updated_at = None
+            run.run_started_at = None
+            return run
+
+        self.manager.get_repository.return_value = Mock()
+        self.manager.get_workflow_run.side_effect = get_run
+
+        result = await self.tool.execute({
+            "repository": f"{test_username}/repo",
+            "run_ids": [1, 2, 3],
+            "include_jobs": False
+        })
+
+        assert result.success
+        assert result.output["found"] == 2
+        assert result.output["runs"][1] == {
+            "id": 2,
+            "error": RateLimitError(1704067200).to_dict(),
+        }
+
 
 class TestCancelWorkflowRunToolComprehensive:
     """Comprehensive tests for CancelWorkflowRunTool."""
 
     def setup_method(self):
         """Set up test fixtures."""
-        self.manager = Mock()
+        self.manager = create_mock_manager()
         self.manager.is_authenticated.return_value = True
         self.tool = CancelWorkflowRunTool(self.manager)
 
@@ -700,10 +926,8 @@ class TestCancelWorkflowRunToolComprehensive:
     async def test_cancel_workflow_run_success(self, test_username):
         """Test successfully cancelling a workflow run."""
         mock_repo = Mock()
-        mock_run = Mock()
-        mock_run.id = 12345
-        mock_run.cancel.return_value = True
-        mock_repo.get_workflow_run.return_value = mock_run
+        mock_repo.url = f"https://api.github.com/repos/{test_username}/repo"
+        mock_repo.requester.requestJsonAndCheck.return_value = ({}, {})
         self.manager.get_repository.return_value = mock_repo
 
         result = await self.tool.execute({
@@ -712,7 +936,119 @@ class TestCancelWorkflowRunToolComprehensive:
         })
         
         assert result.success
-        mock_run.cancel.assert_called_once()
+        assert result.output["run"] == {"id": 12345, "status": "cancelling"}
+        # The cancel request is sent without fetching the run first
+        mock_repo.requester.requestJsonAndCheck.assert_called_once_with(
+            "POST", f"https://api.github.com/repos/{test_username}/repo/actions/runs/12345/cancel"
+        )
+        self.manager.get_workflow_run.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_cancel_completed_workflow_run(self, test_username):
+        """Test that GitHub's 409 for a finished run is reported as already completed."""
+        mock_repo = Mock()
+        mock_repo.url = f"https://api.github.com/repos/{test_username}/repo"
+        mock_repo.requester.requestJsonAndCheck.side_effect = GithubException(
+            409, {"message": "Cannot cancel a workflow run that is completed."}, None
+        )
+        self.manager.get_repository.return_value = mock_repo
+
+        result = await self.tool.execute({
+            "repository": f"{test_username}/repo",
+            "run_id": 12345
+        })
+
+        assert not result.success
+        assert result.error["code"] == "RUN_ALREADY_COMPLETED"
+
+    @pytest.mark.asyncio
+    async def test_cancel_workflow_run_errors_by_status(self, test_username):
+        """Test GitHub error statuses map to the tool's error codes."""
+        mock_repo = Mock()
+        mock_repo.url = f"https://api.github.com/repos/{test_username}/repo"
+        self.manager.get_repository.return_value = mock_repo
+
+        for status, code in ((404, "RUN_NOT_FOUND"), (403, "PERMISSION_DENIED"), (500, "GITHUB_API_ERROR")):
+            mock_repo.requester.requestJsonAndCheck.side_effect = GithubException(
+                status, {"message": "error"}, None
+            )
+            result = await self.tool.execute({
+                "repository": f"{test_username}/repo",
+                "run_id": 12345
+            })
+
+            assert not result.success
+            assert result.error["code"] == code
+
+
+class TestCancelWorkflowRunsToolComprehensive:
+    """Comprehensive tests for CancelWorkflowRunsTool."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.manager = create_mock_manager()
+        self.manager.is_authenticated.return_value = True
+        self.tool = CancelWorkflowRunsTool(self.manager)
+
+    @pytest.mark.asyncio
+    async def test_cancel_workflow_runs_reports_each_run(self, test_username):
+        """Test each run is cancelled and failures are reported per run."""
+        mock_repo = Mock()
+        mock_repo.url = f"https://api.github.com/repos/{test_username}/repo"
+
+        def cancel(method, url):
+            if url.endswith("/2/cancel"):
+                raise GithubException(409, {"message": "completed"}, None)
+            return ({}, {})
+
+        mock_repo.requester.requestJsonAndCheck.side_effect = cancel
+        self.manager.get_repository.return_value = mock_repo
+
+        result = await self.tool.execute({
+            "repository": f"{test_username}/repo",
+            "run_ids": [1, 2, 3, 1]
+        })
+
+        assert result.success
+        assert result.output["count"] == 3
+        assert result.output["cancelled"] == 2
+        assert result.output["failed"] == 1
+        assert result.output["runs"][0] == {"id": 1, "status": "cancelling"}
+        assert result.output["runs"][1]["error"]["code"] == "RUN_ALREADY_COMPLETED"
+        self.manager.get_repository.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_cancel_workflow_runs_rate_limited_run(self, test_username):
+        """Test a rate limited cancellation is reported for its run without failing the batch."""
+        from amplifier_module_tool_github.exceptions import RateLimitError
+        mock_repo = Mock()
+        mock_repo.url = f"https://api.github.com/repos/{test_username}/repo"
+
+        def cancel(method, url):
+            if url.endswith("/2/cancel"):
+                raise RateLimitError(1704067200)
+            return ({}, {})
+
+        mock_repo.requester.requestJsonAndCheck.side_effect = cancel
+        self.manager.get_repository.return_value = mock_repo
+
+        result = await self.tool.execute({
+            "repository": f"{test_username}/repo",
+            "run_ids": [1, 2, 3]
+        })
+
+        assert result.success
+        assert result.output["cancelled"] == 2
+        assert result.output["runs"][1]["error"]["code"] == "RATE_LIMIT_EXCEEDED"
+        assert result.output["runs"][2] == {"id": 3, "status": "cancelling"}
+
+    @pytest.mark.asyncio
+    async def test_cancel_workflow_runs_missing_run_ids(self, test_username):
+        """Test run_ids is required."""
+        result = await self.tool.execute({"repository": f"{test_username}/repo", "run_ids": []})
+
+        assert not result.success
+        assert result.error["code"] == "MISSING_PARAMETER"
 
 
 class TestRerunWorkflowToolComprehensive:
@@ -720,7 +1056,7 @@ class TestRerunWorkflowToolComprehensive:
 
     def setup_method(self):
         """Set up test fixtures."""
-        self.manager = Mock()
+        self.manager = create_mock_manager()
         self.manager.is_authenticated.return_value = True
         self.tool = RerunWorkflowTool(self.manager)
 
@@ -728,11 +1064,8 @@ class TestRerunWorkflowToolComprehensive:
     async def test_rerun_workflow_success(self, test_username):
         """Test successfully rerunning a workflow."""
         mock_repo = Mock()
-        mock_run = Mock()
-        mock_run.id = 12345
-        mock_run.status = "completed"
-        mock_run.rerun.return_value = True
-        mock_repo.get_workflow_run.return_value = mock_run
+        mock_repo.url = f"https://api.github.com/repos/{test_username}/repo"
+        mock_repo.requester.requestJsonAndCheck.return_value = ({}, {})
         self.manager.get_repository.return_value = mock_repo
 
         result = await self.tool.execute({
@@ -741,4 +1074,31 @@ class TestRerunWorkflowToolComprehensive:
         })
         
         assert result.success
-        mock_run.rerun.assert_called_once()
+        assert result.output["run"]["id"] == 12345
+        # The rerun request is sent without fetching the run first
+        mock_repo.requester.requestJsonAndCheck.assert_called_once_with(
+            "POST", f"https://api.github.com/repos/{test_username}/repo/actions/runs/12345/rerun"
+        )
+        mock_repo.get_workflow_run.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_rerun_failed_jobs_reports_conflict(self, test_username):
+        """Test that GitHub's 409 for a run that cannot be rerun is surfaced."""
+        mock_repo = Mock()
+        mock_repo.url = f"https://api.github.com/repos/{test_username}/repo"
+        mock_repo.requester.requestJsonAndCheck.side_effect = GithubException(
+            409, {"message": "This workflow is already running"}
+        )
+        self.manager.get_repository.return_value = mock_repo
+
+        result = await self.tool.execute({
+            "repository": f"{test_username}/repo",
+            "run_id": 12345,
+            "failed_jobs_only": True
+        })
+
+        assert not result.success
+        assert result.error["code"] == "CANNOT_RERUN"
+        assert mock_repo.requester.requestJsonAndCheck.call_args.args[1].endswith(
+            "/actions/runs/12345/rerun-failed-jobs"
+        )
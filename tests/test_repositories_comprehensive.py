@@ -2,7 +2,7 @@
 
 import pytest
 from unittest.mock import Mock, AsyncMock, MagicMock, patch
-from tests.conftest import create_mock_datetime
+from tests.conftest import create_mock_datetime, create_mock_manager
 from github.GithubException import GithubException, UnknownObjectException
 
 from amplifier_module_tool_github.tools.repositories import (
@@ -19,7 +19,7 @@ class TestGetRepositoryToolComprehensive:
 
     def setup_method(self):
         """Set up test fixtures."""
-        self.manager = Mock()
+        self.manager = create_mock_manager()
         self.manager.is_authenticated.return_value = True
         self.tool = GetRepositoryTool(self.manager)
 
@@ -110,7 +110,7 @@ class TestListRepositoriesToolComprehensive:
 
     def setup_method(self):
         """Set up test fixtures."""
-        self.manager = Mock()
+        self.manager = create_mock_manager()
         self.manager.is_authenticated.return_value = True
         self.tool = ListRepositoriesTool(self.manager)
 
@@ -224,7 +224,7 @@ class TestCreateRepositoryToolComprehensive:
 
     def setup_method(self):
         """Set up test fixtures."""
-        self.manager = Mock()
+        self.manager = create_mock_manager()
         self.manager.is_authenticated.return_value = True
         self.tool = CreateRepositoryTool(self.manager)
 
@@ -355,7 +355,7 @@ class TestGetFileContentToolComprehensive:
 
     def setup_method(self):
         """Set up test fixtures."""
-        self.manager = Mock()
+        self.manager = create_mock_manager()
         self.manager.is_authenticated.return_value = True
         self.tool = GetFileContentTool(self.manager)
 
@@ -419,7 +419,7 @@ class TestListRepositoryContentsToolComprehensive:
 
     def setup_method(self):
         """Set up test fixtures."""
-        self.manager = Mock()
+        self.manager = create_mock_manager()
         self.manager.is_authenticated.return_value = True
         self.tool = ListRepositoryContentsTool(self.manager)
 
@@ -153,6 +153,25 @@ class TestRepositoryConfiguration:
         assert manager.is_repository_allowed("https://github.com/microsoft/vscode")
         assert manager.is_repository_allowed("git@github.com:microsoft/vscode.git")
 
+    def test_is_repository_allowed_ignores_case(self):
+        """Test that access checks match repository names case-insensitively."""
+        manager = GitHubManager({"repositories": ["https://github.com/Microsoft/VSCode"]})
+
+        assert manager.is_repository_allowed("microsoft/vscode")
+        assert manager.is_repository_allowed("MICROSOFT/VSCODE")
+        assert manager.is_repository_allowed("git@github.com:microsoft/vscode.git")
+        assert manager.get_configured_repositories() == ["Microsoft/VSCode"]
+
+    def test_is_repository_allowed_skips_normalizing_exact_names(self):
+        """Test that configured owner/repo names are matched without normalizing."""
+        manager = GitHubManager({"repositories": ["microsoft/vscode"]})
+
+        from unittest.mock import patch
+
+        with patch.object(GitHubManager, "_normalize_repository") as normalize:
+            assert manager.is_repository_allowed("microsoft/vscode")
+            normalize.assert_not_called()
+
     def test_restrict_to_configured_flag(self):
         """Test the restrict_to_configured flag."""
         # No repositories configured
@@ -202,3 +221,18 @@ class TestRepositoryConfiguration:
         repos = manager.get_configured_repositories()
         assert len(repos) == 1
         assert "owner/repo" in repos
+
+    def test_get_repository_enforces_configured_repositories(self):
+        """Test repositories outside the configured list are rejected before any API call."""
+        from unittest.mock import Mock
+        from amplifier_module_tool_github.exceptions import PermissionError
+
+        manager = GitHubManager({"repositories": ["microsoft/vscode"]})
+        manager.client = Mock()
+
+        with pytest.raises(PermissionError):
+            manager.get_repository("python/cpython")
+        manager.client.get_repo.assert_not_called()
+
+        manager.get_repository("microsoft/vscode")
+        manager.client.get_repo.assert_called_once_with("microsoft/vscode")
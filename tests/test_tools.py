@@ -2,6 +2,7 @@
 
 import pytest
 from unittest.mock import Mock, AsyncMock
+from tests.conftest import create_mock_manager
 from amplifier_module_tool_github.tools import (
     # Issues
     ListIssuesTool,
@@ -43,6 +44,7 @@ from amplifier_module_tool_github.tools import (
     ListWorkflowRunsTool,
     GetWorkflowRunTool,
     CancelWorkflowRunTool,
+    CancelWorkflowRunsTool,
     RerunWorkflowTool,
 )
 
@@ -52,7 +54,7 @@ class TestListIssuesTool:
 
     def test_tool_properties(self):
         """Test tool name, description, and schema."""
-        manager = Mock()
+        manager = create_mock_manager()
         tool = ListIssuesTool(manager)
         
         assert tool.name == "github_list_issues"
@@ -63,7 +65,7 @@ class TestListIssuesTool:
     @pytest.mark.asyncio
     async def test_execute_without_auth(self):
         """Test execution without authentication."""
-        manager = Mock()
+        manager = create_mock_manager()
         manager.is_authenticated.return_value = False
         tool = ListIssuesTool(manager)
         
@@ -77,7 +79,7 @@ class TestGetIssueTool:
 
     def test_tool_properties(self):
         """Test tool name, description, and schema."""
-        manager = Mock()
+        manager = create_mock_manager()
         tool = GetIssueTool(manager)
         
         assert tool.name == "github_get_issue"
@@ -91,7 +93,7 @@ class TestCreateIssueTool:
 
     def test_tool_properties(self):
         """Test tool name, description, and schema."""
-        manager = Mock()
+        manager = create_mock_manager()
         tool = CreateIssueTool(manager)
         
         assert tool.name == "github_create_issue"
@@ -105,7 +107,7 @@ class TestUpdateIssueTool:
 
     def test_tool_properties(self):
         """Test tool name, description, and schema."""
-        manager = Mock()
+        manager = create_mock_manager()
         tool = UpdateIssueTool(manager)
         
         assert tool.name == "github_update_issue"
@@ -118,7 +120,7 @@ class TestCommentIssueTool:
 
     def test_tool_properties(self):
         """Test tool name, description, and schema."""
-        manager = Mock()
+        manager = create_mock_manager()
         tool = CommentIssueTool(manager)
         
         assert tool.name == "github_comment_issue"
@@ -133,7 +135,7 @@ class TestListPullRequestsTool:
 
     def test_tool_properties(self):
         """Test tool name, description, and schema."""
-        manager = Mock()
+        manager = create_mock_manager()
         tool = ListPullRequestsTool(manager)
         
         assert tool.name == "github_list_pull_requests"
@@ -144,7 +146,7 @@ class TestListPullRequestsTool:
     @pytest.mark.asyncio
     async def test_execute_without_auth(self):
         """Test execution without authentication."""
-        manager = Mock()
+        manager = create_mock_manager()
         manager.is_authenticated.return_value = False
         tool = ListPullRequestsTool(manager)
         
@@ -157,7 +159,7 @@ class TestGetPullRequestTool:
 
     def test_tool_properties(self):
         """Test tool name, description, and schema."""
-        manager = Mock()
+        manager = create_mock_manager()
         tool = GetPullRequestTool(manager)
         
         assert tool.name == "github_get_pull_request"
@@ -170,7 +172,7 @@ class TestCreatePullRequestTool:
 
     def test_tool_properties(self):
         """Test tool name, description, and schema."""
-        manager = Mock()
+        manager = create_mock_manager()
         tool = CreatePullRequestTool(manager)
         
         assert tool.name == "github_create_pull_request"
@@ -184,7 +186,7 @@ class TestMergePullRequestTool:
 
     def test_tool_properties(self):
         """Test tool name, description, and schema."""
-        manager = Mock()
+        manager = create_mock_manager()
         tool = MergePullRequestTool(manager)
         
         assert tool.name == "github_merge_pull_request"
@@ -198,7 +200,7 @@ class TestGetRepositoryTool:
 
     def test_tool_properties(self):
         """Test tool name, description, and schema."""
-        manager = Mock()
+        manager = create_mock_manager()
         tool = GetRepositoryTool(manager)
         
         assert tool.name == "github_get_repository"
@@ -210,7 +212,7 @@ class TestListRepositoriesTool:
 
     def test_tool_properties(self):
         """Test tool name, description, and schema."""
-        manager = Mock()
+        manager = create_mock_manager()
         tool = ListRepositoriesTool(manager)
         
         assert tool.name == "github_list_repositories"
@@ -222,7 +224,7 @@ class TestCreateRepositoryTool:
 
     def test_tool_properties(self):
         """Test tool name, description, and schema."""
-        manager = Mock()
+        manager = create_mock_manager()
         tool = CreateRepositoryTool(manager)
         
         assert tool.name == "github_create_repository"
@@ -235,7 +237,7 @@ class TestGetFileContentTool:
 
     def test_tool_properties(self):
         """Test tool name, description, and schema."""
-        manager = Mock()
+        manager = create_mock_manager()
         tool = GetFileContentTool(manager)
         
         assert tool.name == "github_get_file_content"
@@ -248,7 +250,7 @@ class TestListCommitsTool:
 
     def test_tool_properties(self):
         """Test tool name, description, and schema."""
-        manager = Mock()
+        manager = create_mock_manager()
         tool = ListCommitsTool(manager)
         
         assert tool.name == "github_list_commits"
@@ -260,7 +262,7 @@ class TestGetCommitTool:
 
     def test_tool_properties(self):
         """Test tool name, description, and schema."""
-        manager = Mock()
+        manager = create_mock_manager()
         tool = GetCommitTool(manager)
         
         assert tool.name == "github_get_commit"
@@ -273,7 +275,7 @@ class TestListBranchesTool:
 
     def test_tool_properties(self):
         """Test tool name, description, and schema."""
-        manager = Mock()
+        manager = create_mock_manager()
         tool = ListBranchesTool(manager)
         
         assert tool.name == "github_list_branches"
@@ -285,7 +287,7 @@ class TestCreateBranchTool:
 
     def test_tool_properties(self):
         """Test tool name, description, and schema."""
-        manager = Mock()
+        manager = create_mock_manager()
         tool = CreateBranchTool(manager)
         
         assert tool.name == "github_create_branch"
@@ -297,7 +299,7 @@ class TestCompareBranchesTool:
 
     def test_tool_properties(self):
         """Test tool name, description, and schema."""
-        manager = Mock()
+        manager = create_mock_manager()
         tool = CompareBranchesTool(manager)
         
         assert tool.name == "github_compare_branches"
@@ -311,7 +313,7 @@ class TestListReleasesTool:
 
     def test_tool_properties(self):
         """Test tool name, description, and schema."""
-        manager = Mock()
+        manager = create_mock_manager()
         tool = ListReleasesTool(manager)
         
         assert tool.name == "github_list_releases"
@@ -323,7 +325,7 @@ class TestCreateReleaseTool:
 
     def test_tool_properties(self):
         """Test tool name, description, and schema."""
-        manager = Mock()
+        manager = create_mock_manager()
         tool = CreateReleaseTool(manager)
         
         assert tool.name == "github_create_release"
@@ -335,7 +337,7 @@ class TestListTagsTool:
 
     def test_tool_properties(self):
         """Test tool name, description, and schema."""
-        manager = Mock()
+        manager = create_mock_manager()
         tool = ListTagsTool(manager)
         
         assert tool.name == "github_list_tags"
@@ -348,7 +350,7 @@ class TestListWorkflowsTool:
 
     def test_tool_properties(self):
         """Test tool name, description, and schema."""
-        manager = Mock()
+        manager = create_mock_manager()
         tool = ListWorkflowsTool(manager)
         
         assert tool.name == "github_list_workflows"
@@ -360,7 +362,7 @@ class TestTriggerWorkflowTool:
 
     def test_tool_properties(self):
         """Test tool name, description, and schema."""
-        manager = Mock()
+        manager = create_mock_manager()
         tool = TriggerWorkflowTool(manager)
         
         assert tool.name == "github_trigger_workflow"
@@ -372,7 +374,7 @@ class TestListWorkflowRunsTool:
 
     def test_tool_properties(self):
         """Test tool name, description, and schema."""
-        manager = Mock()
+        manager = create_mock_manager()
         tool = ListWorkflowRunsTool(manager)
         
         assert tool.name == "github_list_workflow_runs"
@@ -384,19 +386,31 @@ class TestCancelWorkflowRunTool:
 
     def test_tool_properties(self):
         """Test tool name, description, and schema."""
-        manager = Mock()
+        manager = create_mock_manager()
         tool = CancelWorkflowRunTool(manager)
         
         assert tool.name == "github_cancel_workflow_run"
         assert "run_id" in tool.input_schema["required"]
 
 
+class TestCancelWorkflowRunsTool:
+    """Tests for CancelWorkflowRunsTool."""
+
+    def test_tool_properties(self):
+        """Test tool name, description, and schema."""
+        manager = create_mock_manager()
+        tool = CancelWorkflowRunsTool(manager)
+        
+        assert tool.name == "github_cancel_workflow_runs"
+        assert "run_ids" in tool.input_schema["required"]
+
+
 class TestRerunWorkflowTool:
     """Tests for RerunWorkflowTool."""
 
     def test_tool_properties(self):
         """Test tool name, description, and schema."""
-        manager = Mock()
+        manager = create_mock_manager()
         tool = RerunWorkflowTool(manager)
         
         assert tool.name == "github_rerun_workflow"
@@ -22,7 +22,7 @@ class TestGitHubUnifiedTool:
         
         assert tool.name == "github"
         assert "GitHub" in tool.description
-        assert "34" in tool.description or "operations" in tool.description
+        assert "35" in tool.description or "operations" in tool.description
         
         schema = tool.input_schema
         assert schema["type"] == "object"
@@ -31,10 +31,10 @@ class TestGitHubUnifiedTool:
         assert schema["required"] == ["operation", "parameters"]
 
     def test_all_operations_available(self, mock_manager):
-        """Test that all 34 operations are available."""
+        """Test that all 35 operations are available."""
         tool = GitHubUnifiedTool(mock_manager)
         
-        assert len(tool._tools) == 34
+        assert len(tool._tools) == 35
         
         # Check some key operations exist
         expected_ops = [
@@ -129,7 +129,7 @@ class TestGitHubUnifiedTool:
         
         operations = tool.list_operations()
         
-        assert len(operations) == 34
+        assert len(operations) == 35
         assert all("operation" in op for op in operations)
         assert all("description" in op for op in operations)
         
@@ -144,7 +144,7 @@ class TestGitHubUnifiedTool:
         schema = tool.input_schema
         enum_values = schema["properties"]["operation"]["enum"]
         
-        assert len(enum_values) == 34
+        assert len(enum_values) == 35
         assert "list_issues" in enum_values
         assert "create_pull_request" in enum_values
         assert "trigger_workflow" in enum_values